@@ -7,6 +7,9 @@ A cyberpunk-themed wave-based survival game built with Python and Pygame.
 
 import sys
 import os
+import time
+import random
+import argparse
 import pygame
 
 # Add src directory to Python path so we can import from it
@@ -15,13 +18,97 @@ sys.path.insert(0, src_path)
 
 # Now import the game
 from src.core.game import Game
+from src.core.quality import QUALITY_ORDER
+from src.systems.profiler import FrameProfiler
+from src.systems.input_provider import (PygameInputProvider, ScriptedInputProvider,
+                                        RecordingInputProvider)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cyber Survival")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the simulation without a window")
+    parser.add_argument("--frames", type=int,
+                        help="number of frames to run in headless mode (default 3600, or the whole replay)")
+    parser.add_argument("--sim-rate", type=int,
+                        help="fixed simulation steps per second (e.g. 60 or 120; default 60 or the replay's)")
+    parser.add_argument("--seed", type=int,
+                        help="seed for all random streams (reproducible runs)")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="replay input recorded with --record")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record input to a JSON file")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="profile every frame and export the timings as CSV on exit")
+    parser.add_argument("--quality", choices=QUALITY_ORDER, default="high",
+                        help="render quality preset (render scale, shadows, trails, particles)")
+    parser.add_argument("--fixed-quality", action="store_true",
+                        help="keep full detail instead of trimming it to hold the frame rate")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    
+    if args.headless:
+        # No window or audio device needed
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    
     pygame.init()  # pylint: disable=no-member
-    game = Game()
-    game.run()
+    
+    seed = args.seed
+    sim_rate = args.sim_rate
+    frames = args.frames if args.frames is not None else 3600
+    replay_state = None
+    if args.replay:
+        # Replay under the recorded session's seed and simulation rate
+        input_provider = ScriptedInputProvider.load(args.replay)
+        if seed is None:
+            seed = input_provider.seed
+        if sim_rate is None:
+            sim_rate = input_provider.sim_rate
+        if args.frames is None:
+            frames = len(input_provider.script)
+        replay_state = input_provider.start_state
+    elif args.headless:
+        input_provider = ScriptedInputProvider()
+    else:
+        input_provider = PygameInputProvider()
+    
+    if args.record:
+        input_provider = RecordingInputProvider(input_provider)
+        if seed is None:
+            # Fix the seed so restarts during the session reuse it and it can be saved
+            seed = random.SystemRandom().randrange(2 ** 32)
+    
+    profiler = FrameProfiler(history=max(600, frames), enabled=True) if args.profile else None
+    game = Game(headless=args.headless, input_provider=input_provider, seed=seed,
+                sim_rate=sim_rate or 60, profiler=profiler, quality=args.quality,
+                adaptive_quality=not args.fixed_quality)
+    
+    # Replays start where the recording did (live play opens on the main menu)
+    if replay_state:
+        game.game_state = replay_state
+    start_state = game.game_state
+    
+    if args.headless:
+        start = time.perf_counter()
+        frames = game.run_headless(frames)
+        elapsed = time.perf_counter() - start
+        fps = frames / elapsed if elapsed > 0 else 0.0
+        print(f"Simulated {frames} frames in {elapsed:.2f}s ({fps:.0f} frames/s), seed {game.seed}")
+    else:
+        game.run()
+    
+    if args.record:
+        input_provider.save(args.record, seed=game.fixed_seed, sim_rate=game.SIM_RATE, start_state=start_state)
+        print(f"Recorded {len(input_provider.frames)} frames to {args.record}, seed {game.fixed_seed}")
+    
+    if args.profile:
+        frames = profiler.export_csv(args.profile)
+        print(f"Exported {frames} profiled frames to {args.profile}")
+    
     pygame.quit()  # pylint: disable=no-member
     sys.exit()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
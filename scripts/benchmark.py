@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Cyber Survival - Stress Benchmarks
+
+Runs named stress scenarios headless, built on the cheat menu actions, and
+reports update/draw timings (ms percentiles) and peak Python memory per
+scenario. Results are saved as JSON; pass --baseline to compare against an
+earlier run and exit with status 1 if any hot path got slower.
+
+    python scripts/benchmark.py
+    python scripts/benchmark.py --baseline baseline.json --tolerance 0.15
+"""
+
+import sys
+import os
+import io
+import gc
+import json
+import math
+import time
+import platform
+import argparse
+import contextlib
+import tracemalloc
+
+# Headless: no window or audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the project root importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from src.core.game import Game
+from src.core.quality import QUALITY_ORDER
+from src.entities.enemy import Enemy
+from src.systems.rng import rng
+from src.systems.input_provider import ScriptedInputProvider, InputFrame
+
+# Arena placement: cheat spawns use screen coordinates, so the player is moved
+# to the middle of the first screen of the world to keep everything in view
+ARENA_CENTER = (600, 400)
+
+# Enemy counts for the scaling sweep
+SWEEP_COUNTS = (50, 100, 250, 500, 1000, 2000, 5000)
+
+# Timings below this (ms) are too small to flag as regressions
+MIN_REGRESSION_MS = 0.25
+
+
+def cheat(game, action_value, times=1):
+    """Trigger a cheat menu action (spawns, upgrades, wave skips)"""
+    for _ in range(times):
+        game.handle_cheat_action(("Benchmark", "cheat", action_value))
+
+
+def place_player(game, x, y):
+    """Move the player and snap the camera so the arena is on screen"""
+    player = game.player
+    player.x = player.prev_x = float(x)
+    player.y = player.prev_y = float(y)
+    player.rect.center = (x, y)
+    game.camera_x = game.prev_camera_x = max(0, x - game.SCREEN_WIDTH // 2)
+    game.camera_y = game.prev_camera_y = max(0, y - game.SCREEN_HEIGHT // 2)
+
+
+def spawn_in_view(game, enemy_type, count):
+    """Spawn enemies of one type at random positions on the current screen"""
+    for _ in range(count):
+        x = rng.spawning.randint(int(game.camera_x) + 30, int(game.camera_x) + game.SCREEN_WIDTH - 30)
+        y = rng.spawning.randint(int(game.camera_y) + 30, int(game.camera_y) + game.SCREEN_HEIGHT - 30)
+        game.enemies.add(Enemy(x, y, enemy_type, game.current_wave))
+
+
+def fill_player_projectiles(game, target):
+    """Fire the player's weapon in a rotating ring until target projectiles exist"""
+    player = game.player
+    player_projectiles = sum(1 for projectile in game.projectiles if not projectile.is_enemy)
+    shot = 0
+    while player_projectiles < target:
+        angle = (game.input_provider.frame_index * 0.37 + shot * 0.61) % (2 * math.pi)
+        new_projectiles = player.weapon_system.create_projectiles(
+            player.current_weapon, player.x, player.y, angle, 20, player)
+        for projectile in new_projectiles:
+            game.projectiles.add(projectile)
+        player_projectiles += len(new_projectiles)
+        shot += 1
+
+
+# Scenario setups: each takes a fresh game and returns an optional per-frame
+# hook that keeps the load steady while the scenario runs
+
+def setup_swarm_500(game):
+    cheat(game, "spawn_swarm", 100)
+
+
+def setup_projectiles_150(game):
+    player = game.player
+    player.current_weapon = "machine_gun"
+    player.has_piercing = True
+    player.has_explosive = True
+    cheat(game, "spawn_basic", 10)
+
+    def maintain(game):
+        if len(game.enemies) < 100:
+            cheat(game, "spawn_basic")
+        fill_player_projectiles(game, 150)
+    return maintain
+
+
+def setup_boss_wave(game):
+    cheat(game, "max_upgrades")
+    cheat(game, "wave_10")
+    cheat(game, "spawn_boss")
+    cheat(game, "spawn_mixed", 5)
+
+
+def setup_wave(wave):
+    def setup(game):
+        # Jump to the wave like the cheat menu does, then spawn the wave's
+        # full composition at once
+        game.current_wave = wave
+        game.start_next_wave()
+        while game.enemies_spawned < game.enemies_in_wave:
+            enemy_type = game.enemy_spawner.choose_enemy_type(wave, game.is_boss_wave)
+            group_size = game.enemy_spawner.get_spawn_count_for_type(enemy_type, wave)
+            count = min(group_size, game.enemies_in_wave - game.enemies_spawned)
+            spawn_in_view(game, enemy_type, count)
+            game.enemies_spawned += count
+    return setup
+
+
+def setup_sweep(count):
+    def setup(game):
+        # Cycle through every enemy type like spawn_mixed
+        enemy_types = ["basic", "fast", "tank", "sniper", "swarm", "heavy", "elite", "boss"]
+        for i in range(count):
+            spawn_in_view(game, enemy_types[i % len(enemy_types)], 1)
+    return setup
+
+
+def get_scenarios(frames, sweep_frames):
+    """Get the named scenarios as (name, setup, frames) tuples"""
+    scenarios = [
+        ("swarm_500", setup_swarm_500, frames),
+        ("projectiles_150", setup_projectiles_150, frames),
+        ("boss_wave", setup_boss_wave, frames),
+        ("wave_30", setup_wave(30), frames),
+        ("wave_100", setup_wave(100), frames),
+    ]
+    for count in SWEEP_COUNTS:
+        scenarios.append((f"sweep_{count}", setup_sweep(count), sweep_frames))
+    return scenarios
+
+
+def create_game(setup, seed, quality="high"):
+    """Build a headless game in god mode with the scenario loaded"""
+    game = Game(headless=True, input_provider=ScriptedInputProvider([InputFrame()]), seed=seed, quality=quality)
+    place_player(game, *ARENA_CENTER)
+    cheat(game, "god_mode")
+    hook = setup(game)
+    return game, hook
+
+
+def run_frames(game, hook, frames, timings=None):
+    """Step and draw the game, optionally recording update/draw times in ms"""
+    for _ in range(frames):
+        if hook:
+            hook(game)
+
+        start = time.perf_counter()
+        game.step()
+        middle = time.perf_counter()
+        game.draw()
+        end = time.perf_counter()
+
+        if timings is not None:
+            timings["update"].append((middle - start) * 1000.0)
+            timings["draw"].append((end - middle) * 1000.0)
+            timings["frame"].append((end - start) * 1000.0)
+
+        # Keep the simulation running through level ups
+        if game.game_state == "level_up":
+            if game.level_up_choices:
+                game.apply_level_upgrade(game.level_up_choices[0])
+            game.game_state = "playing"
+
+
+def summarize(samples):
+    """Get percentile statistics (ms) for a list of samples"""
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+
+    def percentile(p):
+        return round(ordered[int(round(last * p))], 4)
+
+    return {
+        "mean": round(sum(ordered) / len(ordered), 4),
+        "p50": percentile(0.50),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": round(ordered[last], 4)
+    }
+
+
+def run_scenario(setup, frames, seed, warmup, memory_frames, quality="high"):
+    """Run one scenario: a timed pass, then a tracemalloc pass (if memory_frames)"""
+    timings = {"update": [], "draw": [], "frame": []}
+    with contextlib.redirect_stdout(io.StringIO()):
+        game, hook = create_game(setup, seed, quality)
+        start_entities = game.get_entity_counts()
+        run_frames(game, hook, warmup)
+
+        gc.collect()
+        run_frames(game, hook, frames, timings)
+        end_entities = game.get_entity_counts()
+
+    result = {
+        "frames": frames,
+        "update_ms": summarize(timings["update"]),
+        "draw_ms": summarize(timings["draw"]),
+        "frame_ms": summarize(timings["frame"]),
+        "entities_start": start_entities,
+        "entities_end": end_entities
+    }
+
+    # tracemalloc slows everything down, so memory gets its own pass
+    if memory_frames:
+        with contextlib.redirect_stdout(io.StringIO()):
+            gc.collect()
+            tracemalloc.start()
+            game, hook = create_game(setup, seed, quality)
+            run_frames(game, hook, warmup + min(frames, memory_frames))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        result["peak_memory_kb"] = round(peak / 1024.0, 1)
+
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """List regressions where a p50/p95 time grew beyond the tolerance"""
+    regressions = []
+    for name, result in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for metric in ("update_ms", "draw_ms"):
+            for stat in ("p50", "p95"):
+                old = base[metric][stat]
+                new = result[metric][stat]
+                if new > old * (1.0 + tolerance) and new - old > MIN_REGRESSION_MS:
+                    regressions.append(f"{name} {metric} {stat}: {old:.2f} -> {new:.2f} ms "
+                                       f"(+{(new / old - 1.0) * 100 if old else float('inf'):.0f}%)")
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cyber Survival stress benchmarks")
+    parser.add_argument("--frames", type=int, default=300,
+                        help="measured frames per scenario")
+    parser.add_argument("--sweep-frames", type=int, default=60,
+                        help="measured frames per enemy-count sweep step")
+    parser.add_argument("--warmup", type=int, default=30,
+                        help="unmeasured frames before each scenario")
+    parser.add_argument("--seed", type=int, default=1234,
+                        help="seed for all random streams")
+    parser.add_argument("--scenario", action="append", metavar="NAME",
+                        help="only run the named scenario (repeatable, prefix match)")
+    parser.add_argument("--memory-frames", type=int, default=60,
+                        help="frames for the tracemalloc peak memory pass (0 to skip)")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="where to write the JSON results")
+    parser.add_argument("--baseline", metavar="PATH",
+                        help="earlier results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="allowed slowdown vs the baseline (0.15 = 15%%)")
+    parser.add_argument("--quality", choices=QUALITY_ORDER, default="high",
+                        help="render quality preset to benchmark")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    pygame.init()  # pylint: disable=no-member
+
+    scenarios = get_scenarios(args.frames, args.sweep_frames)
+    if args.scenario:
+        scenarios = [s for s in scenarios if any(s[0].startswith(prefix) for prefix in args.scenario)]
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "warmup": args.warmup,
+            "memory_frames": args.memory_frames,
+            "quality": args.quality
+        },
+        "scenarios": {}
+    }
+
+    print(f"{'scenario':<18}{'enemies':>8}{'update p50':>12}{'p95':>8}{'draw p50':>10}{'p95':>8}{'peak KB':>10}")
+    for name, setup, frames in scenarios:
+        result = run_scenario(setup, frames, args.seed, args.warmup, args.memory_frames, args.quality)
+        results["scenarios"][name] = result
+        print(f"{name:<18}{result['entities_start']['enemies']:>8}"
+              f"{result['update_ms']['p50']:>12.2f}{result['update_ms']['p95']:>8.2f}"
+              f"{result['draw_ms']['p50']:>10.2f}{result['draw_ms']['p95']:>8.2f}"
+              f"{result.get('peak_memory_kb', 0):>10.0f}")
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) vs {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            exit_code = 1
+        else:
+            print(f"No regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+
+    pygame.quit()  # pylint: disable=no-member
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
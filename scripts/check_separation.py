@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Cyber Survival - Separation Check
+
+Compares the grid-based enemy separation pass (EnemyKernel._add_separation)
+against a brute-force O(n^2) version over every pair of enemies. Fields
+sparse enough that no grid cell goes over MAX_NEIGHBORS_PER_CELL must agree
+exactly; for dense hordes the difference the neighbour cap makes is only
+reported. Exits with status 1 if any exact case disagrees.
+
+    python scripts/check_separation.py
+"""
+
+import sys
+import os
+import argparse
+
+# Headless: no window or audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Make the project root importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from src.entities.enemy import Enemy
+from src.systems.enemy_kernel import (EnemyGroup, TYPE_CODES, SEPARATION_RESPONSE, SEPARATION_PUSH,
+                                      SEPARATION_PADDING, SEPARATION_MAX)
+
+# Largest difference (px/ms) still counted as agreeing
+TOLERANCE = 1e-9
+
+PLAYER_POS = (0.0, 0.0)
+
+
+def brute_force(kernel):
+    """Get the separation velocity change of every enemy, checking all pairs"""
+    n = kernel.count
+    x = kernel.fields["x"][:n]
+    y = kernel.fields["y"][:n]
+    half_size = kernel.half_size[:n].astype(np.float64)
+    type_code = kernel.type_code[:n]
+
+    dx = x[:, np.newaxis] - x[np.newaxis, :]
+    dy = y[:, np.newaxis] - y[np.newaxis, :]
+    distance = np.sqrt(dx * dx + dy * dy)
+    reach = half_size[:, np.newaxis] + half_size[np.newaxis, :] + SEPARATION_PADDING
+    close = (distance < reach) & ~np.eye(n, dtype=bool)
+
+    # Same golden-angle split as the kernel for exactly stacked pairs
+    stacked = close & (distance == 0)
+    slot_difference = np.arange(n)[:, np.newaxis] - np.arange(n)[np.newaxis, :]
+    angle = slot_difference * 2.399963
+    dx = np.where(stacked, np.cos(angle), dx)
+    dy = np.where(stacked, np.sin(angle), dy)
+    distance = np.where(stacked, 1.0, distance)
+
+    strength = np.where(close, (1.0 - distance / reach) * SEPARATION_PUSH[type_code][np.newaxis, :]
+                        / np.maximum(distance, 1e-9), 0.0)
+    push_x = (dx * strength).sum(axis=1)
+    push_y = (dy * strength).sum(axis=1)
+    magnitude = np.sqrt(push_x * push_x + push_y * push_y)
+    factor = (SEPARATION_RESPONSE[type_code] * kernel.fields["speed"][:n]
+              * np.minimum(1.0, SEPARATION_MAX / np.maximum(magnitude, 1e-9)))
+    return push_x * factor, push_y * factor
+
+
+def grid(kernel):
+    """Get the separation velocity change from the kernel's grid pass"""
+    n = kernel.count
+    velocity_x = np.zeros(n)
+    velocity_y = np.zeros(n)
+    kernel._add_separation(n, velocity_x, velocity_y, PLAYER_POS)
+    return velocity_x, velocity_y
+
+
+def compare(group):
+    """Get the largest difference between the grid and brute-force passes"""
+    grid_x, grid_y = grid(group.kernel)
+    brute_x, brute_y = brute_force(group.kernel)
+    return max(np.abs(grid_x - brute_x).max(), np.abs(grid_y - brute_y).max())
+
+
+def spawn(group, enemy_type, x, y):
+    enemy = Enemy(float(x), float(y), enemy_type)
+    group.add(enemy)
+    return enemy
+
+
+def random_field(seed, count, spread, types):
+    """Scatter count enemies of the given types over a spread x spread square"""
+    random = np.random.default_rng(seed)
+    group = EnemyGroup()
+    for i in range(count):
+        spawn(group, types[i % len(types)], *random.uniform(-spread / 2, spread / 2, 2))
+    return group
+
+
+def heavy_among_swarms(swarms):
+    """A basic overlapping a heavy that shares its cell with swarms"""
+    group = EnemyGroup()
+    for i in range(swarms):
+        spawn(group, "swarm", 300 + i % 3, 300 + i // 3)
+    spawn(group, "heavy", 302, 302)
+    spawn(group, "basic", 314, 302)
+    return group
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Check enemy separation against a brute-force version")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the random fields")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    pygame.init()
+    all_types = list(TYPE_CODES)
+    horde_types = ["swarm"] * 6 + ["basic"] * 2 + ["fast", "tank", "heavy"]
+
+    exact_cases = [
+        ("sparse mixed field", random_field(args.seed, 300, 1500, all_types)),
+        ("sparse horde with a boss", random_field(args.seed, 400, 1500, horde_types + ["boss"])),
+        ("heavy with 0 swarms in its cell", heavy_among_swarms(0)),
+        ("heavy with 4 swarms in its cell", heavy_among_swarms(4)),
+        ("heavy with 8 swarms in its cell", heavy_among_swarms(8)),
+    ]
+    failed = False
+    for name, group in exact_cases:
+        difference = compare(group)
+        status = "ok" if difference <= TOLERANCE else "FAILED"
+        failed = failed or difference > TOLERANCE
+        print(f"{name:34s} max difference {difference:.2e}  {status}")
+
+    # Dense hordes go over the per-cell cap, so only report how close they get
+    for count, spread in ((500, 300), (1000, 300)):
+        group = random_field(args.seed, count, spread, horde_types + ["boss"])
+        grid_x, grid_y = grid(group.kernel)
+        brute_x, brute_y = brute_force(group.kernel)
+        grid_push = np.hypot(grid_x, grid_y)
+        brute_push = np.hypot(brute_x, brute_y)
+        pushed = brute_push > 0
+        missed = np.count_nonzero(pushed & (grid_push == 0))
+        ratio = np.median(grid_push[pushed] / brute_push[pushed])
+        print(f"dense horde {count} in {spread}x{spread}: median push ratio {ratio:.2f}, "
+              f"{missed} of {np.count_nonzero(pushed)} pushed enemies missed")
+
+    pygame.quit()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,14 +15,14 @@ echo Python found:
 python --version
 echo.
 
-REM Install pygame
-echo Installing pygame...
-pip install pygame>=2.1.0
+REM Install dependencies
+echo Installing pygame and numpy...
+pip install pygame>=2.1.0 numpy>=1.20
 
 if errorlevel 1 (
     echo.
-    echo Installation failed. Please try installing pygame manually:
-    echo   pip install pygame
+    echo Installation failed. Please try installing the dependencies manually:
+    echo   pip install pygame numpy
     pause
     exit /b 1
 )
@@ -20,9 +20,9 @@ fi
 echo "pip3 found: $(pip3 --version)"
 echo ""
 
-# Install pygame
-echo "Installing pygame..."
-pip3 install pygame>=2.1.0
+# Install dependencies
+echo "Installing pygame and numpy..."
+pip3 install pygame>=2.1.0 numpy>=1.20
 
 if [ $? -eq 0 ]; then
     echo ""
@@ -40,6 +40,6 @@ if [ $? -eq 0 ]; then
     echo "Enjoy your cyberpunk survival adventure!"
 else
     echo ""
-    echo "Installation failed. Please try installing pygame manually:"
-    echo "  pip3 install pygame"
+    echo "Installation failed. Please try installing the dependencies manually:"
+    echo "  pip3 install pygame numpy"
 fi 
\ No newline at end of file
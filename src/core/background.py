@@ -0,0 +1,99 @@
+import pygame
+from src.systems.sprite_cache import scale_frame
+
+
+class BackgroundLayer:
+    """Pre-rendered world background: the map image or a grid, plus the world border.
+
+    Without a map, the grid is rendered once into a tile one grid cell larger
+    than the render target; any camera position is then one blit of the tile
+    with the offset wrapped to the grid size. The border is kept as four
+    world-space rects that are shifted, clipped to the target and filled, so
+    off-screen edges cost nothing. Either way a frame is one background
+    blit plus the border fills. set_scale() re-renders everything for a
+    scaled render target.
+    """
+    def __init__(self, screen_width, screen_height, world_width, world_height, base_color, grid_color,
+                 border_color, background_map=None, grid_size=100, border_width=3):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.source_map = background_map
+        self.base_color = base_color
+        self.grid_color = grid_color
+        self.grid_size = grid_size
+        self.border_color = border_color
+        self.border_width = border_width
+        self.set_scale(1.0)
+
+    def set_scale(self, scale):
+        """Render the layer for a target of scale x the screen size"""
+        self.scale = scale
+        self.width = round(self.screen_width * scale)
+        self.height = round(self.screen_height * scale)
+        self.cell_size = max(1, round(self.grid_size * scale))
+
+        # Map scaled to the target, or the grid tile when there is no map
+        self.background_map = None
+        self.grid_tile = None
+        if self.source_map is None:
+            self.grid_tile = self.render_grid_tile()
+        elif scale != 1.0:
+            self.background_map = scale_frame(self.source_map, scale)
+        else:
+            self.background_map = self.source_map
+
+        # World border rects (in target pixels), centered on the world edges
+        border_width = max(1, round(self.border_width * scale))
+        half = border_width // 2
+        world_width = round(self.world_width * scale)
+        world_height = round(self.world_height * scale)
+        self.border_rects = [
+            pygame.Rect(-half, -half, border_width, world_height + border_width),
+            pygame.Rect(world_width - half, -half, border_width, world_height + border_width),
+            pygame.Rect(-half, -half, world_width + border_width, border_width),
+            pygame.Rect(-half, world_height - half, world_width + border_width, border_width),
+        ]
+
+    def render_grid_tile(self):
+        """Render grid lines every cell over one target plus one cell"""
+        cell_size = self.cell_size
+        width = self.width + cell_size
+        height = self.height + cell_size
+        tile = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()
+        tile.fill(self.base_color)
+        for x in range(0, width, cell_size):
+            pygame.draw.line(tile, self.grid_color, (x, 0), (x, height), 1)
+        for y in range(0, height, cell_size):
+            pygame.draw.line(tile, self.grid_color, (0, y), (width, y), 1)
+        return tile
+
+    def draw(self, surface, offset_x, offset_y):
+        """Draw the background and world border for a world-to-screen offset"""
+        offset_x *= self.scale
+        offset_y *= self.scale
+        if self.grid_tile is not None:
+            # Grid repeats every cell, so wrap the offset into the tile
+            source_x = int(-offset_x) % self.cell_size
+            source_y = int(-offset_y) % self.cell_size
+            surface.blit(self.grid_tile, (0, 0), (source_x, source_y, self.width, self.height))
+        else:
+            self.draw_map(surface, offset_x, offset_y)
+
+        # World border on top of the background (fill clamps negative positions
+        # instead of clipping them, so clip to the surface first)
+        bounds = surface.get_rect()
+        for rect in self.border_rects:
+            surface.fill(self.border_color, rect.move(offset_x, offset_y).clip(bounds))
+
+    def draw_map(self, surface, offset_x, offset_y):
+        map_width, map_height = self.background_map.get_size()
+        dest_rect = pygame.Rect(int(offset_x), int(offset_y), map_width, map_height)
+
+        # Only clear what the map leaves uncovered (near the world edges)
+        if not dest_rect.contains(surface.get_rect()):
+            surface.fill(self.base_color)
+        surface.blit(self.background_map, dest_rect)
@@ -1,6 +1,5 @@
 import pygame
 import math
-import random
 from src.entities.player import Player
 from src.entities.enemy import Enemy, EnemySpawner
 from src.entities.projectile import Projectile
@@ -9,9 +8,23 @@ from src.ui.ui import UI
 from src.systems.particle import ParticleSystem
 from src.systems.sound_manager import SoundManager
 from src.core.level_system import LevelSystem, XPOrb
+from src.core.view import ViewTransform
+from src.core.background import BackgroundLayer
+from src.core.renderer import renderer
+from src.core.quality import QUALITY_PRESETS, next_quality
+from src.core.governor import QualityGovernor
+from src.ui.fonts import fonts
 from src.ui.level_up_ui import LevelUpUI
 from src.ui.main_menu import MainMenu
 from src.ui.cheat_menu import CheatMenu
+from src.systems.rng import rng
+from src.systems.profiler import FrameProfiler
+from src.systems.spatial_hash import SpatialHash
+from src.systems.enemy_kernel import EnemyGroup
+from src.systems.projectile_kernel import ProjectileGroup
+from src.systems.surface_pool import surface_pool
+from src.systems.targeting import TargetingService
+from src.systems.input_provider import PygameInputProvider, ScriptedInputProvider
 
 # Fix linter errors for pygame constants
 if not hasattr(pygame, 'QUIT'):
@@ -32,38 +45,69 @@ if not hasattr(pygame, 'QUIT'):
     pygame.K_d = 100
     pygame.K_r = 114
     pygame.K_c = 99
+    pygame.K_F3 = 1073741884
+    pygame.K_F4 = 1073741885
     pygame.SRCALPHA = 65536
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, input_provider=None, seed=None, sim_rate=60, profiler=None,
+                 quality="high", adaptive_quality=True):
+        # Headless mode runs the simulation without a window or draw pass
+        self.headless = headless
+        
+        # Seed all random streams so a run can be reproduced from its seed
+        self.fixed_seed = seed
+        self.seed = rng.reseed(seed)
+        
+        # Input source (live keyboard/mouse unless a provider is supplied)
+        if input_provider is None:
+            input_provider = ScriptedInputProvider() if headless else PygameInputProvider()
+        self.input_provider = input_provider
+        
         # Screen settings
         self.SCREEN_WIDTH = 1200
         self.SCREEN_HEIGHT = 800
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-        pygame.display.set_caption("Cyber Survival")
+        if self.headless:
+            # Offscreen target so draw() can still be called explicitly
+            self.screen = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+            pygame.display.set_caption("Cyber Survival")
         
         # World settings (larger than screen)
         self.WORLD_WIDTH = 4800   # 4x screen width
         self.WORLD_HEIGHT = 3200  # 4x screen height
         
-        # Load background map
-        try:
-            self.background_map = pygame.image.load("assets/pixel_art_map.png").convert()
-            print("Background map loaded successfully!")
-        except pygame.error:
-            print("Could not load assets/pixel_art_map.png, using simple background")
-            self.background_map = None
+        # Load background map (convert() needs a display, so skip it headless)
+        self.background_map = None
+        if not self.headless:
+            try:
+                self.background_map = pygame.image.load("assets/pixel_art_map.png").convert()
+                print("Background map loaded successfully!")
+            except (pygame.error, FileNotFoundError):
+                print("Could not load assets/pixel_art_map.png, using simple background")
         
         # Camera system
         self.camera_x = 0
         self.camera_y = 0
+        self.prev_camera_x = 0
+        self.prev_camera_y = 0
         self.camera_smooth = 0.15  # Camera smoothing factor (increased for more responsiveness)
         
         # Game settings
         self.clock = pygame.time.Clock()
-        self.FPS = 60
+        self.FPS = 60  # Render rate cap
         self.running = True
-        self.game_state = "main_menu"  # main_menu, playing, paused, game_over, level_up, controls
+        
+        # Fixed simulation step, decoupled from the render rate
+        self.SIM_RATE = sim_rate
+        self.SIM_DT = 1000.0 / sim_rate  # Milliseconds per simulation step
+        self.MAX_FRAME_TIME = 250  # Clamp long frames so the sim can catch up
+        self.accumulator = 0.0
+        
+        # Per-phase frame profiler (F3 toggles the overlay, F4 exports CSV)
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.game_state = "playing" if self.headless else "main_menu"  # main_menu, playing, paused, game_over, level_up, controls
         
         # Colors (New palette from user)
         self.BLACK = (0, 0, 0)
@@ -80,6 +124,12 @@ class Game:
         self.CORAL = (255, 134, 178)        # Coral/salmon
         self.DARK_PURPLE = (44, 26, 89)     # Dark background purple
         
+        # Pre-rendered background (map or grid) and world border
+        grid_color = (self.CYAN[0]//6, self.CYAN[1]//6, self.CYAN[2]//6)  # Dimmer grid
+        self.background = BackgroundLayer(self.SCREEN_WIDTH, self.SCREEN_HEIGHT,
+                                          self.WORLD_WIDTH, self.WORLD_HEIGHT,
+                                          self.DARK_PURPLE, grid_color, self.HOT_PINK, self.background_map)
+        
         # Visual enhancement variables
         self.background_animation_timer = 0
         self.grid_pulse_timer = 0
@@ -89,11 +139,14 @@ class Game:
         
         # Game objects
         self.player = Player(self.WORLD_WIDTH // 2, self.WORLD_HEIGHT // 2)
-        self.enemies = pygame.sprite.Group()
-        self.projectiles = pygame.sprite.Group()
+        self.enemies = EnemyGroup()  # Enemy AI runs as a vectorized kernel over the group
+        self.projectiles = ProjectileGroup()  # Projectiles update in batched array passes
+        self.max_projectiles = 600  # Cap on live projectiles (player, passive and enemy)
         self.powerups = pygame.sprite.Group()
         self.xp_orbs = []
         self.enemy_spawner = EnemySpawner(self.WORLD_WIDTH, self.WORLD_HEIGHT)
+        self.enemy_grid = SpatialHash(self.WORLD_WIDTH, self.WORLD_HEIGHT)  # Enemy broadphase, rebuilt each frame
+        self.targeting = TargetingService(self.enemy_grid)  # Nearest-enemy queries for auto-aim
         
         # Game systems
         self.particle_system = ParticleSystem()
@@ -104,6 +157,18 @@ class Game:
         self.main_menu = MainMenu(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         self.cheat_menu = CheatMenu(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
         
+        # Governor trimming visual detail to hold the frame rate (fed by run())
+        self.governor = QualityGovernor(target_fps=self.FPS, enabled=adaptive_quality)
+        
+        # Quality preset: the world is drawn to world_target (the screen itself
+        # at full scale) and upscaled, the HUD always at full resolution
+        self.world_target = self.screen
+        self.set_quality(quality)
+        
+        # Enemy level-of-detail tier picked each frame from the on-screen count
+        self.visible_enemy_count = 0
+        self.enemy_lod = 0
+        
         # Wave system - Enhanced for horde mode
         self.current_wave = 1
         self.base_enemies_per_wave = 15  # Increased base count for horde feel
@@ -133,9 +198,14 @@ class Game:
         # Pause menu
         self.pause_selected_index = 0
         self.pause_menu_items = ["RESUME", "RESTART", "MAIN MENU", "QUIT"]
+        
+        # Overlay screens (pause, game over) are composed into a cached layer
+        # and only recomposed when what they show changes
+        self.overlay_layer = None
+        self.overlay_layer_key = None
     
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in self.input_provider.poll():
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
@@ -153,6 +223,11 @@ class Game:
                     self.restart_game()
                 elif event.key == pygame.K_c and self.game_state == "playing":
                     self.game_state = "cheat_menu"
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                elif event.key == pygame.K_F4 and self.profiler.frames:
+                    frames = self.profiler.export_csv("profile.csv")
+                    print(f"Exported {frames} profiled frames to profile.csv")
             
             # Handle main menu input
             if self.game_state == "main_menu":
@@ -160,6 +235,8 @@ class Game:
                 if action == "START GAME":
                     self.restart_game()
                     self.game_state = "playing"
+                elif action == "QUALITY":
+                    self.set_quality(next_quality(self.quality.name))
                 elif action == "CONTROLS":
                     self.game_state = "controls"
                 elif action == "QUIT":
@@ -193,7 +270,8 @@ class Game:
     
     def update(self, dt):
         if self.game_state == "playing":
-            self.update_game_logic(dt)
+            with self.profiler.phase("update"):
+                self.update_game_logic(dt)
         
     def update_game_logic(self, dt):
         # Update visual timers
@@ -202,134 +280,130 @@ class Game:
         self.screen_flash_timer = max(0, self.screen_flash_timer - dt)
         self.screen_distortion = max(0, self.screen_distortion - dt * 0.01)
         
-        # Update player
-        keys = pygame.key.get_pressed()
-        self.player.update(keys, dt, self.WORLD_WIDTH, self.WORLD_HEIGHT)
-        
-        # Update camera to follow player
-        self.update_camera()
-        
-        # Handle player shooting
-        if keys[pygame.K_SPACE] or pygame.mouse.get_pressed()[0]:
-            new_projectiles = self.player.shoot(self.camera_x, self.camera_y)
-            for projectile in new_projectiles:
-                self.projectiles.add(projectile)
-            if new_projectiles:
-                self.sound_manager.play_sound("shoot")
-        
-        # Limit total projectiles to prevent performance issues
-        max_projectiles = 150  # Reasonable limit for performance
-        
-        # Handle auto-targeting system
-        # Only allow auto-targeting if we haven't hit projectile limit
-        if len(self.projectiles) < max_projectiles:
-            # Count existing auto-targeting projectiles
-            auto_projectiles = sum(1 for proj in self.projectiles if hasattr(proj, 'weapon_type') and proj.weapon_type == "auto_targeting")
-            max_auto_projectiles = 20  # Limit auto-targeting projectiles specifically
+        with self.profiler.phase("player"):
+            # Update player
+            keys = self.input_provider.get_pressed()
+            self.player.update(keys, dt, self.WORLD_WIDTH, self.WORLD_HEIGHT)
+            
+            # Update camera to follow player
+            self.update_camera()
             
-            if auto_projectiles < max_auto_projectiles:
-                auto_shot = self.player.get_auto_target_shot(self.enemies)
-                if auto_shot:
-                    self.projectiles.add(auto_shot)
+            # Auto-aim queries this frame are answered around the player
+            self.targeting.begin_frame(self.player.rect.centerx, self.player.rect.centery)
+            
+            # Handle player shooting
+            if keys[pygame.K_SPACE] or self.input_provider.get_mouse_pressed()[0]:
+                new_projectiles = self.player.shoot(self.camera_x, self.camera_y,
+                                                    self.input_provider.get_mouse_pos())
+                for projectile in new_projectiles:
+                    self.projectiles.add(projectile)
+                if new_projectiles:
                     self.sound_manager.play_sound("shoot")
-        
-        # Handle passive weapon attacks
-        if len(self.projectiles) < max_projectiles:
-            passive_attacks = self.player.get_passive_attacks()
-            for attack in passive_attacks:
-                if len(self.projectiles) < max_projectiles:  # Check again before each attack
-                    self.handle_passive_attack(attack)
-        
-        # Spawn enemies - Enhanced for horde mode
-        if not self.in_wave_break and self.enemies_spawned < self.enemies_in_wave:
-            if self.enemy_spawner.should_spawn(dt):
-                enemy = self.enemy_spawner.spawn_enemy(self.current_wave, self.player.rect.center)
-                if enemy:
-                    # Handle group spawning (especially for swarm enemies)
-                    spawn_count = self.enemy_spawner.get_spawn_count_for_type(enemy.enemy_type, self.current_wave)
-                    
-                    # Add the main enemy
-                    self.enemies.add(enemy)
-                    self.enemies_spawned += 1
-                    
-                    # Add additional enemies for group spawning
-                    for i in range(1, min(spawn_count, self.enemies_in_wave - self.enemies_spawned + 1)):
-                        # Spawn additional enemies nearby
-                        offset_x = random.randint(-50, 50)
-                        offset_y = random.randint(-50, 50)
-                        spawn_x, spawn_y = self.enemy_spawner.get_spawn_position(self.player.rect.center)
-                        additional_enemy = Enemy(spawn_x + offset_x, spawn_y + offset_y, enemy.enemy_type, self.current_wave)
-                        self.enemies.add(additional_enemy)
+            
+            # Handle auto-targeting system
+            # Only allow auto-targeting if we haven't hit projectile limit
+            if len(self.projectiles) < self.max_projectiles:
+                # Count existing auto-targeting projectiles
+                auto_projectiles = self.projectiles.count_weapon("auto_targeting")
+                max_auto_projectiles = 20  # Limit auto-targeting projectiles specifically
+                
+                if auto_projectiles < max_auto_projectiles:
+                    auto_shot = self.player.get_auto_target_shot(self.targeting)
+                    if auto_shot:
+                        self.projectiles.add(auto_shot)
+                        self.sound_manager.play_sound("shoot")
+            
+            # Handle passive weapon attacks
+            if len(self.projectiles) < self.max_projectiles:
+                passive_attacks = self.player.get_passive_attacks()
+                for attack in passive_attacks:
+                    if len(self.projectiles) < self.max_projectiles:  # Check again before each attack
+                        self.handle_passive_attack(attack)
+        
+        with self.profiler.phase("spawning"):
+            # Spawn enemies - Enhanced for horde mode
+            if not self.in_wave_break and self.enemies_spawned < self.enemies_in_wave:
+                if self.enemy_spawner.should_spawn(dt):
+                    enemy = self.enemy_spawner.spawn_enemy(self.current_wave, self.player.rect.center)
+                    if enemy:
+                        # Handle group spawning (especially for swarm enemies)
+                        spawn_count = self.enemy_spawner.get_spawn_count_for_type(enemy.enemy_type, self.current_wave)
+                        
+                        # Add the main enemy
+                        self.enemies.add(enemy)
                         self.enemies_spawned += 1
                         
-                        if self.enemies_spawned >= self.enemies_in_wave:
-                            break
+                        # Add additional enemies for group spawning
+                        for i in range(1, min(spawn_count, self.enemies_in_wave - self.enemies_spawned + 1)):
+                            # Spawn additional enemies nearby
+                            offset_x = rng.spawning.randint(-50, 50)
+                            offset_y = rng.spawning.randint(-50, 50)
+                            spawn_x, spawn_y = self.enemy_spawner.get_spawn_position(self.player.rect.center)
+                            additional_enemy = Enemy(spawn_x + offset_x, spawn_y + offset_y, enemy.enemy_type, self.current_wave)
+                            self.enemies.add(additional_enemy)
+                            self.enemies_spawned += 1
+                            
+                            if self.enemies_spawned >= self.enemies_in_wave:
+                                break
         
-        # Update enemies and handle shooting
-        for enemy in self.enemies:
-            enemy.update(dt, self.player.rect.center)
+        with self.profiler.phase("enemy_update"):
+            # Update enemies (AI, movement and shooting timers for all at once)
+            self.enemies.update(dt, self.player.rect.center)
             
-            # Update enemy shooting timer
-            if hasattr(enemy, 'shoot_timer'):
-                enemy.shoot_timer = max(0, enemy.shoot_timer - dt)
+            # Handle enemy shooting (only shooters in range and off cooldown)
+            for enemy in self.enemies.ready_shooters(self.player.rect.center):
+                enemy_projectile = enemy.shoot_at_player(self.player.rect.center)
+                if enemy_projectile:
+                    self.projectiles.add(enemy_projectile)
             
-            # Handle enemy shooting
-            if hasattr(enemy, 'can_shoot') and enemy.can_shoot:
-                if enemy.can_shoot_at_player(self.player.rect.center):
-                    enemy_projectile = enemy.shoot_at_player(self.player.rect.center)
-                    if enemy_projectile:
-                        self.projectiles.add(enemy_projectile)
-        
-        # Update projectiles
-        projectiles_to_remove = []
-        for projectile in self.projectiles:
-            projectile.update(dt)
-            # Remove projectiles that are off-world bounds (with buffer) or marked for removal
-            buffer = 100
-            if (projectile.rect.x < -buffer or projectile.rect.x > self.WORLD_WIDTH + buffer or
-                projectile.rect.y < -buffer or projectile.rect.y > self.WORLD_HEIGHT + buffer):
-                projectiles_to_remove.append(projectile)
+            # Re-bucket enemies at their new positions for proximity queries
+            self.enemy_grid.rebuild(self.enemies)
         
-        # Remove projectiles safely
-        for projectile in projectiles_to_remove:
-            self.projectiles.remove(projectile)
+        with self.profiler.phase("projectile_update"):
+            # Update projectiles, removing those out of range or off-world bounds
+            self.projectiles.update(dt, self.WORLD_WIDTH, self.WORLD_HEIGHT)
         
         # Update powerups
         for powerup in self.powerups:
             powerup.update(dt)
         
-        # Update XP orbs
-        magnet_range = 50
-        if self.level_system.has_upgrade("xp_magnet"):
-            magnet_range = 50 + (self.level_system.get_upgrade_level("xp_magnet") * 30)
-        
-        for orb in self.xp_orbs[:]:  # Use slice copy for safe iteration
-            if not orb.update(dt, (self.player.rect.centerx, self.player.rect.centery), magnet_range):
-                self.xp_orbs.remove(orb)
-        
-        # Check XP collection
-        player_rect = pygame.Rect(self.player.rect.x - 10, self.player.rect.y - 10, 
-                                self.player.rect.width + 20, self.player.rect.height + 20)
-        for orb in self.xp_orbs[:]:
-            if player_rect.colliderect(orb.get_rect()):
-                self.xp_orbs.remove(orb)
-                if self.level_system.add_xp(orb.value):
-                    self.trigger_level_up()
-        
-        # Check area damage
-        area_damage, area_radius = self.player.get_area_damage_info()
-        if area_damage and area_radius:
-            self.handle_area_damage(area_damage, area_radius)
-        
-        # Check energy shuriken collisions
-        if self.player.energy_shuriken_level > 0:
-            self.check_shuriken_collisions()
-        
-        # Check collisions
-        self.check_collisions()
-        
-        # Update particle system
-        self.particle_system.update(dt)
+        with self.profiler.phase("xp_orb_update"):
+            # Update XP orbs
+            magnet_range = 50
+            if self.level_system.has_upgrade("xp_magnet"):
+                magnet_range = 50 + (self.level_system.get_upgrade_level("xp_magnet") * 30)
+            
+            for orb in self.xp_orbs[:]:  # Use slice copy for safe iteration
+                if not orb.update(dt, (self.player.rect.centerx, self.player.rect.centery), magnet_range):
+                    self.xp_orbs.remove(orb)
+            
+            # Check XP collection
+            player_rect = pygame.Rect(self.player.rect.x - 10, self.player.rect.y - 10, 
+                                    self.player.rect.width + 20, self.player.rect.height + 20)
+            for orb in self.xp_orbs[:]:
+                if player_rect.colliderect(orb.get_rect()):
+                    self.xp_orbs.remove(orb)
+                    if self.level_system.add_xp(orb.value):
+                        self.trigger_level_up()
+        
+        with self.profiler.phase("area_damage"):
+            # Check area damage
+            area_damage, area_radius = self.player.get_area_damage_info()
+            if area_damage and area_radius:
+                self.handle_area_damage(area_damage, area_radius)
+        
+        with self.profiler.phase("shuriken"):
+            # Check energy shuriken collisions
+            if self.player.energy_shuriken_level > 0:
+                self.check_shuriken_collisions()
+        
+        with self.profiler.phase("collisions"):
+            # Check collisions
+            self.check_collisions()
+        
+        with self.profiler.phase("particles_update"):
+            # Update particle system
+            self.particle_system.update(dt)
         
         # Update wave system AFTER all collisions are processed
         self.update_wave_system(dt)
@@ -339,8 +413,8 @@ class Game:
             self.camera_shake -= dt * 5
             intensity = min(self.camera_shake, 10)
             intensity = max(1, int(intensity))  # Ensure minimum intensity of 1
-            self.shake_offset_x = random.randint(-intensity, intensity)
-            self.shake_offset_y = random.randint(-intensity, intensity)
+            self.shake_offset_x = rng.cosmetic.randint(-intensity, intensity)
+            self.shake_offset_y = rng.cosmetic.randint(-intensity, intensity)
         else:
             self.shake_offset_x = 0
             self.shake_offset_y = 0
@@ -352,9 +426,13 @@ class Game:
     
     def update_camera(self):
         """Update camera position to follow player smoothly"""
+        # Remember the last simulated camera position for render interpolation
+        self.prev_camera_x = self.camera_x
+        self.prev_camera_y = self.camera_y
+        
         # Target camera position (center player on screen)
-        target_x = self.player.rect.centerx - self.SCREEN_WIDTH // 2
-        target_y = self.player.rect.centery - self.SCREEN_HEIGHT // 2
+        target_x = self.player.x - self.SCREEN_WIDTH // 2
+        target_y = self.player.y - self.SCREEN_HEIGHT // 2
         
         # Keep camera within world bounds
         target_x = max(0, min(target_x, self.WORLD_WIDTH - self.SCREEN_WIDTH))
@@ -437,10 +515,10 @@ class Game:
         
         # Chance to spawn powerup (higher chance after boss waves)
         powerup_chance = 0.5 if (old_wave % 5 == 0) and old_wave >= 5 else 0.3
-        if random.random() < powerup_chance:
+        if rng.loot.random() < powerup_chance:
             powerup = PowerUp(
-                random.randint(50, self.SCREEN_WIDTH - 50),
-                random.randint(50, self.SCREEN_HEIGHT - 50)
+                rng.loot.randint(50, self.SCREEN_WIDTH - 50),
+                rng.loot.randint(50, self.SCREEN_HEIGHT - 50)
             )
             self.powerups.add(powerup)
             print("Powerup spawned!")
@@ -449,14 +527,7 @@ class Game:
     
     def check_collisions(self):
         # Separate player and enemy projectiles
-        player_projectiles = []
-        enemy_projectiles = []
-        
-        for projectile in list(self.projectiles):
-            if hasattr(projectile, 'is_enemy') and projectile.is_enemy:
-                enemy_projectiles.append(projectile)
-            else:
-                player_projectiles.append(projectile)
+        player_projectiles, enemy_projectiles = self.projectiles.split_by_owner()
         
         # Enemy projectiles vs Player collisions
         projectiles_to_remove = []
@@ -477,7 +548,7 @@ class Game:
         
         # Player projectiles vs Enemy collisions
         for projectile in player_projectiles:
-            hit_enemies = pygame.sprite.spritecollide(projectile, self.enemies, False)
+            hit_enemies = self.enemy_grid.query_rect(projectile.rect)
             enemies_hit_this_frame = []
             
             for enemy in hit_enemies:
@@ -530,41 +601,36 @@ class Game:
                 for hit_enemy in enemies_hit_this_frame:
                     explosion_center = (hit_enemy.rect.centerx, hit_enemy.rect.centery)
                     
-                    for enemy in self.enemies:
+                    for enemy in self.enemy_grid.query_radius(explosion_center[0], explosion_center[1], explosion_radius):
                         if enemy in enemies_hit_this_frame:
                             continue  # Already hit by direct impact
                         
-                        dx = enemy.rect.centerx - explosion_center[0]
-                        dy = enemy.rect.centery - explosion_center[1]
-                        distance = (dx * dx + dy * dy) ** 0.5
+                        explosion_damage = projectile.damage // 2  # Half damage for explosion
+                        enemy.take_damage(explosion_damage)
+                        
+                        # Explosion particles
+                        self.particle_system.create_explosion(
+                            enemy.rect.centerx, enemy.rect.centery, 
+                            self.HOT_PINK, 3
+                        )
                         
-                        if distance <= explosion_radius:
-                            explosion_damage = projectile.damage // 2  # Half damage for explosion
-                            enemy.take_damage(explosion_damage)
+                        # Check if enemy dies from explosion
+                        if enemy.health <= 0:
+                            enemy_type_values = {"basic": 1, "fast": 2, "tank": 3, "sniper": 3, "swarm": 1, "heavy": 4, "elite": 4, "boss": 5}
+                            type_multiplier = enemy_type_values.get(enemy.enemy_type, 1)
+                            xp_value = 5 + (type_multiplier * 2)
+                            xp_orb = XPOrb(enemy.rect.centerx, enemy.rect.centery, xp_value)
+                            self.xp_orbs.append(xp_orb)
+                            
+                            self.enemies.remove(enemy)
+                            self.enemies_killed += 1
+                            self.total_kills += 1
+                            self.score += enemy.score_value
                             
-                            # Explosion particles
                             self.particle_system.create_explosion(
-                                enemy.rect.centerx, enemy.rect.centery, 
-                                self.HOT_PINK, 3
+                                enemy.rect.centerx, enemy.rect.centery,
+                                self.HOT_PINK, 10
                             )
-                            
-                            # Check if enemy dies from explosion
-                            if enemy.health <= 0:
-                                enemy_type_values = {"basic": 1, "fast": 2, "tank": 3, "sniper": 3, "swarm": 1, "heavy": 4, "elite": 4, "boss": 5}
-                                type_multiplier = enemy_type_values.get(enemy.enemy_type, 1)
-                                xp_value = 5 + (type_multiplier * 2)
-                                xp_orb = XPOrb(enemy.rect.centerx, enemy.rect.centery, xp_value)
-                                self.xp_orbs.append(xp_orb)
-                                
-                                self.enemies.remove(enemy)
-                                self.enemies_killed += 1
-                                self.total_kills += 1
-                                self.score += enemy.score_value
-                                
-                                self.particle_system.create_explosion(
-                                    enemy.rect.centerx, enemy.rect.centery,
-                                    self.HOT_PINK, 10
-                                )
                     
                     # Big explosion effect
                     self.particle_system.create_explosion(
@@ -582,7 +648,7 @@ class Game:
                 self.projectiles.remove(projectile)
         
         # Player vs Enemy collisions
-        hit_enemies = pygame.sprite.spritecollide(self.player, self.enemies, False)  # type: ignore
+        hit_enemies = self.enemy_grid.query_rect(self.player.rect)
         for enemy in hit_enemies:
             if self.player.can_take_damage():
                 self.player.take_damage(enemy.damage)
@@ -614,224 +680,150 @@ class Game:
         """Add screen distortion effect"""
         self.screen_distortion = max(self.screen_distortion, intensity)
     
-    def draw(self):
-        # Clear screen with dark background
-        self.screen.fill(self.DARK_PURPLE)
+    def draw(self, alpha=1.0):
+        surface_pool.begin_frame()
         
-        # Draw background map or fallback to grid
-        self.draw_background()
+        # Only blend between steps while the simulation is advancing
+        if self.game_state != "playing":
+            alpha = 1.0
+        
+        # Interpolated camera position
+        camera_x = self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha
+        camera_y = self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha
         
         # Calculate total offset (camera + shake)
-        total_offset_x = -self.camera_x + self.shake_offset_x
-        total_offset_y = -self.camera_y + self.shake_offset_y
-        
-        # Draw enemies with camera offset
-        for enemy in self.enemies:
-            screen_x = enemy.rect.x + total_offset_x
-            screen_y = enemy.rect.y + total_offset_y
-            # Only draw if on screen (with buffer)
-            if (-50 < screen_x < self.SCREEN_WIDTH + 50 and 
-                -50 < screen_y < self.SCREEN_HEIGHT + 50):
-                # Create temporary rect for drawing
-                temp_rect = pygame.Rect(screen_x, screen_y, enemy.rect.width, enemy.rect.height)
-                original_rect = enemy.rect
-                enemy.rect = temp_rect
-                enemy.draw(self.screen)
-                enemy.rect = original_rect
-        
-        # Draw projectiles with camera offset
-        for projectile in self.projectiles:
-            screen_x = projectile.rect.x + total_offset_x
-            screen_y = projectile.rect.y + total_offset_y
-            # Only draw if on screen (with buffer)
-            if (-50 < screen_x < self.SCREEN_WIDTH + 50 and 
-                -50 < screen_y < self.SCREEN_HEIGHT + 50):
-                # Calculate screen center position
-                screen_center_x = projectile.rect.centerx + total_offset_x
-                screen_center_y = projectile.rect.centery + total_offset_y
-                projectile.draw(self.screen, (screen_center_x, screen_center_y), (total_offset_x, total_offset_y))
-        
-        # Draw powerups with camera offset
-        for powerup in self.powerups:
-            screen_x = powerup.rect.x + total_offset_x
-            screen_y = powerup.rect.y + total_offset_y
-            if (-50 < screen_x < self.SCREEN_WIDTH + 50 and 
-                -50 < screen_y < self.SCREEN_HEIGHT + 50):
-                temp_rect = pygame.Rect(screen_x, screen_y, powerup.rect.width, powerup.rect.height)
-                original_rect = powerup.rect
-                powerup.rect = temp_rect
-                powerup.draw(self.screen)
-                powerup.rect = original_rect
-        
-        # Draw XP orbs with camera offset
-        for orb in self.xp_orbs:
-            orb_rect = orb.get_rect()
-            screen_x = orb_rect.x + total_offset_x
-            screen_y = orb_rect.y + total_offset_y
-            if (-50 < screen_x < self.SCREEN_WIDTH + 50 and 
-                -50 < screen_y < self.SCREEN_HEIGHT + 50):
-                # Temporarily modify orb position for drawing
-                original_x, original_y = orb.x, orb.y
-                orb.x = orb.x + total_offset_x
-                orb.y = orb.y + total_offset_y
-                orb.draw(self.screen)
-                orb.x, orb.y = original_x, original_y
-        
-        # Draw player with camera offset
-        player_screen_x = self.player.rect.x + total_offset_x
-        player_screen_y = self.player.rect.y + total_offset_y
-        temp_rect = pygame.Rect(player_screen_x, player_screen_y, self.player.rect.width, self.player.rect.height)
-        original_rect = self.player.rect
-        self.player.rect = temp_rect
-        self.player.draw(self.screen)
-        # Draw passive weapons with modified player position
-        self.player.draw_passive_weapons(self.screen)
-        self.player.rect = original_rect
-        
-        # Draw particles with camera offset
-        for particle in self.particle_system.particles:
-            # Temporarily modify particle position for drawing
-            original_x, original_y = particle.x, particle.y
-            particle.x = particle.x + total_offset_x
-            particle.y = particle.y + total_offset_y
-            particle.draw(self.screen)
-            particle.x, particle.y = original_x, original_y
-        
-        # Draw UI (not affected by camera)
-        enemies_remaining = len(self.enemies)
-        self.ui.draw(self.screen, self.player, self.current_wave, self.score, 
-                    enemies_remaining, self.in_wave_break, 
-                    self.wave_timer, self.wave_break_duration, self.level_system,
-                    self.camera_x, self.camera_y, self.boss_notification_timer, self.is_boss_wave)
-        
-        # Draw world bounds indicator
-        self.draw_world_bounds(total_offset_x, total_offset_y)
-        
-        # Draw game state overlays
-        if self.game_state == "main_menu":
-            self.main_menu.draw(self.screen)
-        elif self.game_state == "controls":
-            self.main_menu.draw_controls_screen(self.screen)
-        elif self.game_state == "paused":
-            self.draw_pause_screen()
-        elif self.game_state == "game_over":
-            self.draw_game_over_screen()
-        elif self.game_state == "level_up":
-            self.level_up_ui.draw(self.screen, self.level_system, self.level_up_choices)
-        elif self.game_state == "cheat_menu":
-            self.cheat_menu.draw(self.screen)
-        
-        # Apply screen effects
-        self.apply_screen_effects()
+        total_offset_x = -camera_x + self.shake_offset_x
+        total_offset_y = -camera_y + self.shake_offset_y
+        
+        # The world is drawn to the (possibly scaled) world target
+        target = self.world_target
+        scale = self.quality.render_scale
+        view = ViewTransform(total_offset_x, total_offset_y, target.get_width(), target.get_height(), alpha,
+                             scale=scale)
+        
+        with self.profiler.phase("background"):
+            # Draw background map or grid, with the world bounds indicator
+            self.background.draw(target, total_offset_x, total_offset_y)
+        
+        with self.profiler.phase("enemy_draw"):
+            # Draw on-screen enemies at their interpolated screen positions, with
+            # less detail the more of them there are
+            visible_enemies = view.visible(self.enemies)
+            self.visible_enemy_count = len(visible_enemies)
+            self.enemy_lod = Enemy.get_lod_tier(self.visible_enemy_count)
+            Enemy.draw_all(target, visible_enemies, view.offset, scale, self.enemy_lod)
+        
+        with self.profiler.phase("projectile_draw"):
+            # Draw on-screen projectiles (trails batched first, offset by the camera)
+            Projectile.draw_all(target, view.visible(self.projectiles), view.offset, scale)
+        
+        with self.profiler.phase("pickup_draw"):
+            # Draw on-screen powerups (animated in place, not interpolated)
+            for powerup, center in view.visible(self.powerups, interpolate=False):
+                powerup.draw(target, center, scale)
+            
+            # Draw XP orbs with camera offset
+            XPOrb.draw_all(target, self.xp_orbs, view.offset, scale)
+        
+        with self.profiler.phase("player_draw"):
+            # Draw player and passive weapons at the interpolated screen position
+            player_center = view.screen_center(self.player)
+            self.player.draw(target, player_center, scale)
+            self.player.draw_passive_weapons(target, player_center, scale)
+        
+        with self.profiler.phase("particle_draw"):
+            # Draw particles with camera offset
+            self.particle_system.draw(target, view.offset, scale)
+        
+        with self.profiler.phase("upscale"):
+            # Scale a reduced-resolution world up to the screen
+            if target is not self.screen:
+                if self.quality.smooth_upscale:
+                    pygame.transform.smoothscale(target, self.screen.get_size(), self.screen)
+                else:
+                    pygame.transform.scale(target, self.screen.get_size(), self.screen)
+        
+        with self.profiler.phase("ui"):
+            # Draw UI (not affected by camera)
+            enemies_remaining = len(self.enemies)
+            self.ui.draw(self.screen, self.player, self.current_wave, self.score, 
+                        enemies_remaining, self.in_wave_break, 
+                        self.wave_timer, self.wave_break_duration, self.level_system,
+                        camera_x, camera_y, self.boss_notification_timer, self.is_boss_wave)
+            
+            # Draw game state overlays
+            if self.game_state == "main_menu":
+                self.main_menu.draw(self.screen)
+            elif self.game_state == "controls":
+                self.main_menu.draw_controls_screen(self.screen)
+            elif self.game_state == "paused":
+                self.draw_pause_screen()
+            elif self.game_state == "game_over":
+                self.draw_game_over_screen()
+            elif self.game_state == "level_up":
+                self.level_up_ui.draw(self.screen, self.level_system, self.level_up_choices)
+            elif self.game_state == "cheat_menu":
+                self.cheat_menu.draw(self.screen)
+            
+            # Apply screen effects
+            self.apply_screen_effects()
+        
+        # Profiler overlay goes on top of everything
+        if self.profiler.enabled:
+            self.profiler.draw_overlay(self.screen, self.get_debug_info())
+    
+    def set_quality(self, name):
+        """Apply a quality preset by name (see src/core/quality.py)"""
+        preset = QUALITY_PRESETS[name]
+        self.quality = preset
+        
+        # World render target at the preset's scale
+        size = (round(self.SCREEN_WIDTH * preset.render_scale), round(self.SCREEN_HEIGHT * preset.render_scale))
+        if preset.render_scale == 1.0:
+            self.world_target = self.screen
+        elif self.world_target is self.screen or self.world_target.get_size() != size:
+            self.world_target = pygame.Surface(size)
+            if not self.headless:
+                self.world_target = self.world_target.convert()
+        if self.background.scale != preset.render_scale:
+            self.background.set_scale(preset.render_scale)
+        
+        self.apply_detail_settings()
+        self.main_menu.quality_name = name
+    
+    def apply_detail_settings(self):
+        """Apply the preset's detail settings, cut down by the governor's level"""
+        preset = self.quality
+        detail = self.governor.detail
+        Enemy.use_shadows = preset.shadows and detail.shadows
+        Player.use_shadows = preset.shadows and detail.shadows
+        Enemy.use_movement_trails = detail.movement_trails
+        Enemy.min_lod_tier = detail.min_lod
+        Projectile.trail_length_scale = preset.trail_scale * detail.trail_scale
+        self.particle_system.limit = preset.particle_cap
+        self.particle_system.emission_scale = detail.particle_scale
     
     def apply_screen_effects(self):
         """Apply post-processing screen effects"""
         # Screen flash effect
         if self.screen_flash_timer > 0:
-            flash_alpha = int(255 * (self.screen_flash_timer / 200))
-            flash_surface = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-            flash_surface.set_alpha(flash_alpha)
-            flash_surface.fill(self.screen_flash_color)
-            self.screen.blit(flash_surface, (0, 0))
+            renderer.flash(self.screen, self.screen_flash_color, self.screen_flash_timer / 200)
         
         # Simple screen shake effect instead of distortion
         if self.screen_distortion > 0:
             # Just add more camera shake instead of complex distortion
             self.add_camera_shake(int(self.screen_distortion * 5))
     
-    def draw_background(self):
-        """Draw the background map or fallback to grid"""
-        if self.background_map:
-            # Calculate camera offset for background
-            total_offset_x = -self.camera_x + self.shake_offset_x
-            total_offset_y = -self.camera_y + self.shake_offset_y
-            
-            # Create a rect for the visible portion of the background
-            source_rect = pygame.Rect(
-                max(0, -total_offset_x),  # Source x
-                max(0, -total_offset_y),  # Source y
-                min(self.SCREEN_WIDTH, self.background_map.get_width() + total_offset_x),  # Source width
-                min(self.SCREEN_HEIGHT, self.background_map.get_height() + total_offset_y)  # Source height
-            )
-            
-            # Destination rect on screen
-            dest_rect = pygame.Rect(
-                max(0, total_offset_x),  # Dest x
-                max(0, total_offset_y),  # Dest y
-                source_rect.width,       # Dest width
-                source_rect.height       # Dest height
-            )
-            
-            # Only draw if there's something to draw
-            if source_rect.width > 0 and source_rect.height > 0:
-                self.screen.blit(self.background_map, dest_rect, source_rect)
-        else:
-            # Fallback to simple grid
-            self.draw_world_grid()
-    
-    def draw_world_grid(self):
-        """Draw a grid that shows the world coordinates (fallback)"""
-        grid_size = 100  # Larger grid for better visibility
-        grid_color = (self.CYAN[0]//6, self.CYAN[1]//6, self.CYAN[2]//6)  # Dimmer grid
-        
-        # Calculate grid offset based on camera position
-        offset_x = int(self.camera_x) % grid_size
-        offset_y = int(self.camera_y) % grid_size
-        
-        # Draw vertical lines
-        for x in range(-offset_x, self.SCREEN_WIDTH + grid_size, grid_size):
-            if 0 <= x <= self.SCREEN_WIDTH:
-                pygame.draw.line(self.screen, grid_color, (x, 0), (x, self.SCREEN_HEIGHT), 1)
-        
-        # Draw horizontal lines  
-        for y in range(-offset_y, self.SCREEN_HEIGHT + grid_size, grid_size):
-            if 0 <= y <= self.SCREEN_HEIGHT:
-                pygame.draw.line(self.screen, grid_color, (0, y), (self.SCREEN_WIDTH, y), 1)
-    
-    def draw_world_bounds(self, offset_x, offset_y):
-        """Draw indicators showing the world boundaries"""
-        border_color = self.HOT_PINK
-        border_width = 3
-        
-        # Calculate world bounds on screen
-        world_left = 0 + offset_x
-        world_right = self.WORLD_WIDTH + offset_x
-        world_top = 0 + offset_y
-        world_bottom = self.WORLD_HEIGHT + offset_y
-        
-        # Draw world boundary lines if they're visible on screen
-        if -border_width <= world_left <= self.SCREEN_WIDTH + border_width:
-            pygame.draw.line(self.screen, border_color, 
-                           (world_left, max(0, world_top)), 
-                           (world_left, min(self.SCREEN_HEIGHT, world_bottom)), border_width)
-        
-        if -border_width <= world_right <= self.SCREEN_WIDTH + border_width:
-            pygame.draw.line(self.screen, border_color,
-                           (world_right, max(0, world_top)), 
-                           (world_right, min(self.SCREEN_HEIGHT, world_bottom)), border_width)
-        
-        if -border_width <= world_top <= self.SCREEN_HEIGHT + border_width:
-            pygame.draw.line(self.screen, border_color,
-                           (max(0, world_left), world_top), 
-                           (min(self.SCREEN_WIDTH, world_right), world_top), border_width)
-        
-        if -border_width <= world_bottom <= self.SCREEN_HEIGHT + border_width:
-            pygame.draw.line(self.screen, border_color,
-                           (max(0, world_left), world_bottom), 
-                           (min(self.SCREEN_WIDTH, world_right), world_bottom), border_width)
-    
     def draw_pause_screen(self):
-        # Dark overlay
-        overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill((15, 20, 25))  # DARK_BG
-        self.screen.blit(overlay, (0, 0))
-        
+        self.draw_overlay_screen(("paused", self.pause_selected_index), self.compose_pause_screen)
+    
+    def compose_pause_screen(self, surface):
+        """Draw the pause menu (everything but the dim overlay)"""
         # Title frame
-        self.draw_hex_frame(self.SCREEN_WIDTH // 2, 200, 350, 100)
+        self.draw_hex_frame(self.SCREEN_WIDTH // 2, 200, 350, 100, surface)
         
         # Title with glow effect
-        font_large = pygame.font.Font(None, 72)
+        font_large = fonts.get(72)
         title_text = "SYSTEM PAUSED"
         title_surface = font_large.render(title_text, True, (0, 255, 255))  # CYAN_BRIGHT
         title_rect = title_surface.get_rect(center=(self.SCREEN_WIDTH // 2, 180))
@@ -842,12 +834,12 @@ class Game:
             glow_rect = title_rect.copy()
             glow_rect.x += offset[0]
             glow_rect.y += offset[1]
-            self.screen.blit(glow_surface, glow_rect)
+            surface.blit(glow_surface, glow_rect)
         
-        self.screen.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
         
         # Menu items with cyberpunk panels
-        font_medium = pygame.font.Font(None, 48)
+        font_medium = fonts.get(48)
         start_y = self.SCREEN_HEIGHT // 2 - 20
         item_height = 80
         
@@ -874,7 +866,7 @@ class Game:
                 accent_color = (120, 120, 120)  # GRAY_MID
             
             # Draw panel with angled corners
-            self.draw_angled_panel(panel_rect, bg_color, border_color)
+            self.draw_angled_panel(panel_rect, bg_color, border_color, surface)
             
             # Selection indicators
             if is_selected:
@@ -884,7 +876,7 @@ class Game:
                     (panel_rect.left - 5, item_y - 8),
                     (panel_rect.left - 5, item_y + 8)
                 ]
-                pygame.draw.polygon(self.screen, accent_color, left_points)
+                pygame.draw.polygon(surface, accent_color, left_points)
                 
                 # Right indicator
                 right_points = [
@@ -892,25 +884,39 @@ class Game:
                     (panel_rect.right + 5, item_y - 8),
                     (panel_rect.right + 5, item_y + 8)
                 ]
-                pygame.draw.polygon(self.screen, accent_color, right_points)
+                pygame.draw.polygon(surface, accent_color, right_points)
             
             # Text
             item_surface = font_medium.render(item, True, text_color)
             item_text_rect = item_surface.get_rect(center=panel_rect.center)
-            self.screen.blit(item_surface, item_text_rect)
+            surface.blit(item_surface, item_text_rect)
         
         # Controls hint panel
         hint_panel = pygame.Rect(self.SCREEN_WIDTH // 2 - 250, self.SCREEN_HEIGHT - 80, 500, 40)
-        self.draw_angled_panel(hint_panel, (25, 35, 45), (60, 85, 110))
+        self.draw_angled_panel(hint_panel, (25, 35, 45), (60, 85, 110), surface)
         
-        font_small = pygame.font.Font(None, 24)
+        font_small = fonts.get(24)
         hint_text = "↑↓ / WS: Navigate    Enter / Space / Click: Select    ESC: Resume"
         hint_surface = font_small.render(hint_text, True, (180, 180, 180))  # GRAY_LIGHT
         hint_rect = hint_surface.get_rect(center=hint_panel.center)
-        self.screen.blit(hint_surface, hint_rect)
+        surface.blit(hint_surface, hint_rect)
+    
+    def draw_overlay_screen(self, key, compose):
+        """Dim the game and blit a cached overlay screen, recomposed by compose(surface) when key changes"""
+        renderer.dim(self.screen, (15, 20, 25), 220)  # DARK_BG
+        
+        if key != self.overlay_layer_key:
+            self.overlay_layer = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.SRCALPHA)
+            compose(self.overlay_layer)
+            # RLE skips the layer's transparent runs when blitting
+            self.overlay_layer.set_alpha(255, pygame.RLEACCEL)
+            self.overlay_layer_key = key
+        self.screen.blit(self.overlay_layer, (0, 0))
     
-    def draw_angled_panel(self, rect, bg_color, border_color):
+    def draw_angled_panel(self, rect, bg_color, border_color, surface=None):
         """Draw a panel with angled corners using proper clipping"""
+        if surface is None:
+            surface = self.screen
         corner_size = 12
         
         # Create the angled panel shape (octagon)
@@ -926,13 +932,15 @@ class Game:
         ]
         
         # Draw the filled panel
-        pygame.draw.polygon(self.screen, bg_color, points)
+        pygame.draw.polygon(surface, bg_color, points)
         
         # Draw the border
-        pygame.draw.polygon(self.screen, border_color, points, 2)
+        pygame.draw.polygon(surface, border_color, points, 2)
     
-    def draw_hex_frame(self, center_x, center_y, width, height):
+    def draw_hex_frame(self, center_x, center_y, width, height, surface=None):
         """Draw a hexagonal frame"""
+        if surface is None:
+            surface = self.screen
         # Hexagon points
         w2, h2 = width // 2, height // 2
         hex_points = [
@@ -945,25 +953,23 @@ class Game:
         ]
         
         # Draw hexagon border
-        pygame.draw.polygon(self.screen, (25, 35, 45), hex_points)  # PANEL_BG
-        pygame.draw.polygon(self.screen, (0, 200, 220), hex_points, 3)  # CYAN_MID
+        pygame.draw.polygon(surface, (25, 35, 45), hex_points)  # PANEL_BG
+        pygame.draw.polygon(surface, (0, 200, 220), hex_points, 3)  # CYAN_MID
         
         # Corner accents
         for i, point in enumerate(hex_points):
-            pygame.draw.circle(self.screen, (255, 165, 0), point, 4)  # ORANGE
+            pygame.draw.circle(surface, (255, 165, 0), point, 4)  # ORANGE
     
     def draw_game_over_screen(self):
-        # Dark overlay
-        overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill((15, 20, 25))  # DARK_BG
-        self.screen.blit(overlay, (0, 0))
-        
+        self.draw_overlay_screen(("game_over", self.score, self.current_wave), self.compose_game_over_screen)
+    
+    def compose_game_over_screen(self, surface):
+        """Draw the game over screen (everything but the dim overlay)"""
         # Title frame
-        self.draw_hex_frame(self.SCREEN_WIDTH // 2, 200, 400, 100)
+        self.draw_hex_frame(self.SCREEN_WIDTH // 2, 200, 400, 100, surface)
         
         # Title with glow effect
-        font_large = pygame.font.Font(None, 72)
+        font_large = fonts.get(72)
         title_text = "SYSTEM FAILURE"
         title_surface = font_large.render(title_text, True, (255, 50, 50))  # RED_BRIGHT
         title_rect = title_surface.get_rect(center=(self.SCREEN_WIDTH // 2, 180))
@@ -974,43 +980,45 @@ class Game:
             glow_rect = title_rect.copy()
             glow_rect.x += offset[0]
             glow_rect.y += offset[1]
-            self.screen.blit(glow_surface, glow_rect)
+            surface.blit(glow_surface, glow_rect)
         
-        self.screen.blit(title_surface, title_rect)
+        surface.blit(title_surface, title_rect)
         
         # Stats panel
         stats_panel = pygame.Rect(self.SCREEN_WIDTH // 2 - 250, 280, 500, 200)
-        self.draw_angled_panel(stats_panel, (25, 35, 45), (200, 100, 255))  # PANEL_BG, PURPLE_BRIGHT
+        self.draw_angled_panel(stats_panel, (25, 35, 45), (200, 100, 255), surface)  # PANEL_BG, PURPLE_BRIGHT
         
         # Stats content
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
+        font_medium = fonts.get(48)
+        font_small = fonts.get(36)
         
         # Final score
         score_label = font_small.render("FINAL SCORE", True, (200, 100, 255))  # PURPLE_BRIGHT
-        self.screen.blit(score_label, (stats_panel.x + 30, stats_panel.y + 30))
+        surface.blit(score_label, (stats_panel.x + 30, stats_panel.y + 30))
         
         score_value = font_medium.render(f"{self.score:,}", True, (255, 255, 255))  # WHITE
-        self.screen.blit(score_value, (stats_panel.x + 30, stats_panel.y + 60))
+        surface.blit(score_value, (stats_panel.x + 30, stats_panel.y + 60))
         
         # Wave reached
         wave_label = font_small.render("WAVE REACHED", True, (0, 255, 255))  # CYAN_BRIGHT
-        self.screen.blit(wave_label, (stats_panel.x + 30, stats_panel.y + 110))
+        surface.blit(wave_label, (stats_panel.x + 30, stats_panel.y + 110))
         
         wave_value = font_medium.render(f"{self.current_wave}", True, (255, 255, 255))  # WHITE
-        self.screen.blit(wave_value, (stats_panel.x + 30, stats_panel.y + 140))
+        surface.blit(wave_value, (stats_panel.x + 30, stats_panel.y + 140))
         
         # Restart instruction panel
         restart_panel = pygame.Rect(self.SCREEN_WIDTH // 2 - 200, self.SCREEN_HEIGHT - 120, 400, 60)
-        self.draw_angled_panel(restart_panel, (25, 35, 45), (255, 165, 0))  # PANEL_BG, ORANGE
+        self.draw_angled_panel(restart_panel, (25, 35, 45), (255, 165, 0), surface)  # PANEL_BG, ORANGE
         
         restart_text = "Press R to restart mission"
         restart_surface = font_small.render(restart_text, True, (255, 165, 0))  # ORANGE
         restart_rect = restart_surface.get_rect(center=restart_panel.center)
-        self.screen.blit(restart_surface, restart_rect)
+        surface.blit(restart_surface, restart_rect)
     
     def restart_game(self):
-        self.__init__()
+        self.__init__(headless=self.headless, input_provider=self.input_provider,
+                      seed=self.fixed_seed, sim_rate=self.SIM_RATE, profiler=self.profiler,
+                      quality=self.quality.name, adaptive_quality=self.governor.enabled)
         self.game_state = "playing"
     
     def trigger_level_up(self):
@@ -1100,8 +1108,8 @@ class Game:
             elif action_value == "spawn_basic":
                 for i in range(10):
                     enemy = Enemy(
-                        random.randint(50, self.SCREEN_WIDTH - 50),
-                        random.randint(50, self.SCREEN_HEIGHT - 50),
+                        rng.spawning.randint(50, self.SCREEN_WIDTH - 50),
+                        rng.spawning.randint(50, self.SCREEN_HEIGHT - 50),
                         "basic",
                         self.current_wave
                     )
@@ -1111,8 +1119,8 @@ class Game:
             elif action_value == "spawn_fast":
                 for i in range(5):
                     enemy = Enemy(
-                        random.randint(50, self.SCREEN_WIDTH - 50),
-                        random.randint(50, self.SCREEN_HEIGHT - 50),
+                        rng.spawning.randint(50, self.SCREEN_WIDTH - 50),
+                        rng.spawning.randint(50, self.SCREEN_HEIGHT - 50),
                         "fast",
                         self.current_wave
                     )
@@ -1122,8 +1130,8 @@ class Game:
             elif action_value == "spawn_tank":
                 for i in range(3):
                     enemy = Enemy(
-                        random.randint(50, self.SCREEN_WIDTH - 50),
-                        random.randint(50, self.SCREEN_HEIGHT - 50),
+                        rng.spawning.randint(50, self.SCREEN_WIDTH - 50),
+                        rng.spawning.randint(50, self.SCREEN_HEIGHT - 50),
                         "tank",
                         self.current_wave
                     )
@@ -1133,8 +1141,8 @@ class Game:
             elif action_value == "spawn_swarm":
                 for i in range(5):
                     enemy = Enemy(
-                        random.randint(50, self.SCREEN_WIDTH - 50),
-                        random.randint(50, self.SCREEN_HEIGHT - 50),
+                        rng.spawning.randint(50, self.SCREEN_WIDTH - 50),
+                        rng.spawning.randint(50, self.SCREEN_HEIGHT - 50),
                         "swarm",
                         self.current_wave
                     )
@@ -1144,8 +1152,8 @@ class Game:
             elif action_value == "spawn_sniper":
                 for i in range(2):
                     enemy = Enemy(
-                        random.randint(50, self.SCREEN_WIDTH - 50),
-                        random.randint(50, self.SCREEN_HEIGHT - 50),
+                        rng.spawning.randint(50, self.SCREEN_WIDTH - 50),
+                        rng.spawning.randint(50, self.SCREEN_HEIGHT - 50),
                         "sniper",
                         self.current_wave
                     )
@@ -1155,8 +1163,8 @@ class Game:
             elif action_value == "spawn_heavy":
                 for i in range(2):
                     enemy = Enemy(
-                        random.randint(50, self.SCREEN_WIDTH - 50),
-                        random.randint(50, self.SCREEN_HEIGHT - 50),
+                        rng.spawning.randint(50, self.SCREEN_WIDTH - 50),
+                        rng.spawning.randint(50, self.SCREEN_HEIGHT - 50),
                         "heavy",
                         self.current_wave
                     )
@@ -1165,8 +1173,8 @@ class Game:
             
             elif action_value == "spawn_elite":
                 enemy = Enemy(
-                    random.randint(50, self.SCREEN_WIDTH - 50),
-                    random.randint(50, self.SCREEN_HEIGHT - 50),
+                    rng.spawning.randint(50, self.SCREEN_WIDTH - 50),
+                    rng.spawning.randint(50, self.SCREEN_HEIGHT - 50),
                     "elite",
                     self.current_wave
                 )
@@ -1187,8 +1195,8 @@ class Game:
                 enemy_types = ["basic", "fast", "tank", "sniper", "swarm", "heavy", "elite", "boss"]
                 for enemy_type in enemy_types:
                     enemy = Enemy(
-                        random.randint(50, self.SCREEN_WIDTH - 50),
-                        random.randint(50, self.SCREEN_HEIGHT - 50),
+                        rng.spawning.randint(50, self.SCREEN_WIDTH - 50),
+                        rng.spawning.randint(50, self.SCREEN_HEIGHT - 50),
                         enemy_type,
                         self.current_wave
                     )
@@ -1197,8 +1205,8 @@ class Game:
             
             elif action_value == "spawn_powerup":
                 powerup = PowerUp(
-                    random.randint(50, self.SCREEN_WIDTH - 50),
-                    random.randint(50, self.SCREEN_HEIGHT - 50)
+                    rng.loot.randint(50, self.SCREEN_WIDTH - 50),
+                    rng.loot.randint(50, self.SCREEN_HEIGHT - 50)
                 )
                 self.powerups.add(powerup)
                 print("Spawned powerup")
@@ -1225,40 +1233,34 @@ class Game:
         """Handle area damage effect"""
         player_center = (self.player.rect.centerx, self.player.rect.centery)
         
-        for enemy in self.enemies:
-            enemy_center = (enemy.rect.centerx, enemy.rect.centery)
-            dx = enemy_center[0] - player_center[0]
-            dy = enemy_center[1] - player_center[1]
-            distance = (dx * dx + dy * dy) ** 0.5
+        for enemy in self.enemy_grid.query_radius(player_center[0], player_center[1], radius):
+            enemy.take_damage(damage)
+            
+            # Create hit particles
+            self.particle_system.create_explosion(
+                enemy.rect.centerx, enemy.rect.centery, 
+                self.ELECTRIC_BLUE, 3
+            )
             
-            if distance <= radius:
-                enemy.take_damage(damage)
+            # Check if enemy is dead
+            if enemy.health <= 0:
+                # Drop XP
+                enemy_type_values = {"basic": 1, "fast": 2, "tank": 3, "sniper": 3, "swarm": 1, "heavy": 4, "elite": 4, "boss": 5}
+                type_multiplier = enemy_type_values.get(enemy.enemy_type, 1)
+                xp_value = 5 + (type_multiplier * 2)  # Different XP per enemy type
+                xp_orb = XPOrb(enemy.rect.centerx, enemy.rect.centery, xp_value)
+                self.xp_orbs.append(xp_orb)
                 
-                # Create hit particles
+                self.enemies.remove(enemy)
+                self.enemies_killed += 1
+                self.total_kills += 1
+                self.score += enemy.score_value
+                
+                # Create death particles
                 self.particle_system.create_explosion(
-                    enemy.rect.centerx, enemy.rect.centery, 
-                    self.ELECTRIC_BLUE, 3
+                    enemy.rect.centerx, enemy.rect.centery,
+                    self.HOT_PINK, 15
                 )
-                
-                # Check if enemy is dead
-                if enemy.health <= 0:
-                    # Drop XP
-                    enemy_type_values = {"basic": 1, "fast": 2, "tank": 3, "sniper": 3, "swarm": 1, "heavy": 4, "elite": 4, "boss": 5}
-                    type_multiplier = enemy_type_values.get(enemy.enemy_type, 1)
-                    xp_value = 5 + (type_multiplier * 2)  # Different XP per enemy type
-                    xp_orb = XPOrb(enemy.rect.centerx, enemy.rect.centery, xp_value)
-                    self.xp_orbs.append(xp_orb)
-                    
-                    self.enemies.remove(enemy)
-                    self.enemies_killed += 1
-                    self.total_kills += 1
-                    self.score += enemy.score_value
-                    
-                    # Create death particles
-                    self.particle_system.create_explosion(
-                        enemy.rect.centerx, enemy.rect.centery,
-                        self.HOT_PINK, 15
-                    )
     
     def handle_passive_attack(self, attack):
         """Handle passive weapon attacks like missiles, lasers, etc."""
@@ -1268,16 +1270,7 @@ class Game:
             # Create homing missile
             if self.enemies:
                 # Find nearest enemy for homing
-                nearest_enemy = None
-                min_distance = float('inf')
-                
-                for enemy in self.enemies:
-                    dx = enemy.rect.centerx - attack["x"]
-                    dy = enemy.rect.centery - attack["y"]
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    if distance < min_distance:
-                        min_distance = distance
-                        nearest_enemy = enemy
+                nearest_enemy = self.targeting.nearest(attack["x"], attack["y"])
                 
                 if nearest_enemy:
                     # Calculate angle to target
@@ -1296,16 +1289,7 @@ class Game:
             # Continuous laser targeting nearest enemy
             if self.enemies:
                 # Find nearest enemy
-                nearest_enemy = None
-                min_distance = float('inf')
-                
-                for enemy in self.enemies:
-                    dx = enemy.rect.centerx - attack["x"]
-                    dy = enemy.rect.centery - attack["y"]
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    if distance < min_distance and distance < 300:  # Range limit
-                        min_distance = distance
-                        nearest_enemy = enemy
+                nearest_enemy = self.targeting.nearest(attack["x"], attack["y"], max_distance=300)  # Range limit
                 
                 if nearest_enemy:
                     # Calculate angle to target
@@ -1324,16 +1308,7 @@ class Game:
             # Drone auto-aim shot
             if self.enemies:
                 # Find nearest enemy
-                nearest_enemy = None
-                min_distance = float('inf')
-                
-                for enemy in self.enemies:
-                    dx = enemy.rect.centerx - attack["x"]
-                    dy = enemy.rect.centery - attack["y"]
-                    distance = (dx * dx + dy * dy) ** 0.5
-                    if distance < min_distance and distance < 250:  # Range limit
-                        min_distance = distance
-                        nearest_enemy = enemy
+                nearest_enemy = self.targeting.nearest(attack["x"], attack["y"], max_distance=250)  # Range limit
                 
                 if nearest_enemy:
                     # Calculate angle to target
@@ -1363,8 +1338,8 @@ class Game:
             shuriken_rect = pygame.Rect(shuriken_x - 8, shuriken_y - 8, 16, 16)
             
             # Check collisions with enemies
-            for enemy in list(self.enemies):  # Convert to list for safe iteration
-                if shuriken_rect.colliderect(enemy.rect) and id(enemy) not in self.player.shuriken_hit_enemies:
+            for enemy in self.enemy_grid.query_rect(shuriken_rect):
+                if id(enemy) not in self.player.shuriken_hit_enemies:
                     damage = 10 * self.player.energy_shuriken_level
                     enemy.take_damage(damage)
                     self.player.shuriken_hit_enemies.add(id(enemy))  # Prevent multiple hits
@@ -1456,12 +1431,78 @@ class Game:
         elif selected_item == "QUIT":
             self.running = False
     
+    def step(self, dt=None):
+        """Advance the game by one frame of input without drawing.
+        
+        A frame is one simulation step unless its input frame says otherwise
+        (recordings of live play store how many steps each frame ran).
+        """
+        self.handle_events()
+        steps = self.input_provider.current.steps
+        if steps is None:
+            steps = 1
+        for _ in range(steps):
+            self.update(self.SIM_DT if dt is None else dt)
+        self.input_provider.end_frame(steps)
+        self.profiler.end_frame(self.get_entity_counts())
+    
+    def get_entity_counts(self):
+        """Get the live entity counts recorded alongside profiled frames"""
+        return {
+            "enemies": len(self.enemies),
+            "projectiles": len(self.projectiles),
+            "particles": self.particle_system.get_particle_count(),
+            "xp_orbs": len(self.xp_orbs),
+            "surface_allocations": surface_pool.frame_allocations,
+            "visible_enemies": self.visible_enemy_count,
+            "enemy_lod": self.enemy_lod,
+            "detail_level": self.governor.level
+        }
+    
+    def get_debug_info(self):
+        """Get extra lines for the profiler overlay"""
+        thresholds = ", ".join(str(threshold) for threshold in Enemy.lod_thresholds)
+        return [f"lod {Enemy.LOD_TIER_NAMES[self.enemy_lod]} (tiers at {thresholds})"] + self.governor.describe()
+    
+    def run_headless(self, frames, dt=None):
+        """Step the simulation as fast as possible for a number of frames.
+        
+        Each frame is one fixed simulation step of dt (default SIM_DT), or as
+        many steps as a replayed recording ran for that frame.
+        Returns the number of frames actually simulated (fewer if the game quits).
+        """
+        if dt is None:
+            dt = self.SIM_DT
+        
+        frames_run = 0
+        while self.running and frames_run < frames:
+            self.step(dt)
+            frames_run += 1
+        return frames_run
+    
     def run(self):
         while self.running:
-            dt = self.clock.tick(self.FPS)
+            frame_time = self.clock.tick(self.FPS)
+            
+            # Let the governor see the last frame's work time (without the
+            # frame cap's wait) and adjust detail to the frame budget
+            if self.governor.update(self.clock.get_rawtime()):
+                self.apply_detail_settings()
+            
+            # Bank real time, then consume it in fixed simulation steps
+            self.accumulator += min(frame_time, self.MAX_FRAME_TIME)
             
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            steps = 0
+            while self.accumulator >= self.SIM_DT:
+                self.update(self.SIM_DT)
+                self.accumulator -= self.SIM_DT
+                steps += 1
+            self.input_provider.end_frame(steps)
+            
+            # Render between the last two steps using the leftover time
+            with self.profiler.phase("draw"):
+                self.draw(self.accumulator / self.SIM_DT)
+            self.profiler.end_frame(self.get_entity_counts())
             
             pygame.display.flip() 
\ No newline at end of file
@@ -0,0 +1,109 @@
+from collections import deque
+
+
+class DetailLevel:
+    """Visual detail cuts applied by the governor on top of the quality preset.
+
+    particle_scale thins particle bursts, trail_scale shortens projectile
+    trails, shadows and movement_trails switch those effects, and min_lod
+    is the lowest enemy level-of-detail tier to draw at.
+    """
+    def __init__(self, name, particle_scale=1.0, trail_scale=1.0, shadows=True, movement_trails=True, min_lod=0):
+        self.name = name
+        self.particle_scale = particle_scale
+        self.trail_scale = trail_scale
+        self.shadows = shadows
+        self.movement_trails = movement_trails
+        self.min_lod = min_lod
+
+
+# Governor levels from full detail to cheapest, each cutting a little more
+DETAIL_LEVELS = (
+    DetailLevel("full"),
+    DetailLevel("fewer particles", particle_scale=0.5),
+    DetailLevel("short trails", particle_scale=0.5, trail_scale=0.5, movement_trails=False),
+    DetailLevel("no shadows", particle_scale=0.5, trail_scale=0.5, shadows=False, movement_trails=False),
+    DetailLevel("reduced enemies", particle_scale=0.25, trail_scale=0.5, shadows=False, movement_trails=False,
+                min_lod=1),
+    DetailLevel("silhouettes", particle_scale=0.25, trail_scale=0.25, shadows=False, movement_trails=False,
+                min_lod=2),
+)
+
+
+class QualityGovernor:
+    """Steps visual detail down and back up to hold a target frame rate.
+
+    update() takes each frame's work time in ms (not counting the frame
+    cap's idle wait) and averages the last window frames against the frame
+    budget. Above step_down_ratio x budget the level goes one step cheaper,
+    below step_up_ratio x budget one step richer. Hysteresis keeps it from
+    oscillating: the two ratios are far apart, every change starts a fresh
+    window, and after a step down it holds for hold_frames before trying
+    to step up again. Changes are kept in decisions for the overlay.
+    """
+    def __init__(self, target_fps=60, window=30, step_down_ratio=0.9, step_up_ratio=0.6, hold_frames=180,
+                 levels=DETAIL_LEVELS, enabled=True):
+        self.target_fps = target_fps
+        self.budget_ms = 1000.0 / target_fps
+        self.step_down_ratio = step_down_ratio
+        self.step_up_ratio = step_up_ratio
+        self.hold_frames = hold_frames
+        self.levels = levels
+        self.enabled = enabled
+        self.samples = deque(maxlen=window)
+        self.level = 0
+        self.average_ms = 0.0
+        self.hold = 0
+        self.frame_index = 0
+        self.decisions = deque(maxlen=16)  # (frame, old level, new level, average ms)
+
+    @property
+    def detail(self):
+        """The DetailLevel currently in effect"""
+        return self.levels[self.level]
+
+    def update(self, frame_ms):
+        """Record one frame's work time; get True if the level changed"""
+        self.frame_index += 1
+        if not self.enabled:
+            return False
+        self.samples.append(frame_ms)
+        if self.hold > 0:
+            self.hold -= 1
+        if len(self.samples) < self.samples.maxlen:
+            return False
+
+        self.average_ms = sum(self.samples) / len(self.samples)
+        if self.average_ms > self.budget_ms * self.step_down_ratio and self.level < len(self.levels) - 1:
+            self.set_level(self.level + 1)
+            self.hold = self.hold_frames
+            return True
+        if self.average_ms < self.budget_ms * self.step_up_ratio and self.level > 0 and self.hold == 0:
+            self.set_level(self.level - 1)
+            return True
+        return False
+
+    def set_level(self, level):
+        """Switch to a level (0 is full detail) and start a fresh window"""
+        level = max(0, min(level, len(self.levels) - 1))
+        if level != self.level:
+            self.decisions.append((self.frame_index, self.level, level, self.average_ms))
+            self.level = level
+        self.samples.clear()
+
+    def set_enabled(self, enabled):
+        """Turn the governor on or off (off restores full detail)"""
+        self.enabled = enabled
+        if not enabled:
+            self.set_level(0)
+            self.hold = 0
+
+    def describe(self):
+        """Get overlay lines: the current level and the last decision"""
+        if not self.enabled:
+            return ["governor off"]
+        lines = [f"detail {self.level} {self.detail.name} ({self.average_ms:.1f}/{self.budget_ms:.1f} ms)"]
+        if self.decisions:
+            frame, old_level, new_level, average_ms = self.decisions[-1]
+            lines.append(f"  {old_level}->{new_level} at frame {frame} ({average_ms:.1f} ms)")
+        return lines
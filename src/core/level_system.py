@@ -1,5 +1,7 @@
-import random
 import math
+import pygame
+from src.systems.rng import rng
+from src.systems.sprite_cache import bake_frame
 
 class LevelSystem:
     def __init__(self):
@@ -232,7 +234,7 @@ class LevelSystem:
                     available.extend([upgrade_id] * (upgrade_data["max_level"] - current_level))
         
         # Select random upgrades
-        choices = random.sample(available, min(count, len(available)))
+        choices = rng.loot.sample(available, min(count, len(available)))
         
         # If still not enough, add health boost as fallback
         while len(choices) < count:
@@ -281,6 +283,16 @@ class LevelSystem:
 
 class XPOrb:
     """XP pickup that enemies drop"""
+    # Colors
+    XP_COLOR = (255, 255, 100)  # Golden yellow
+    XP_GLOW = (255, 200, 50)
+    
+    # Glow ring alphas, outermost first
+    GLOW_ALPHAS = (60, 40, 20)
+    
+    # Baked orb frames: (radius, render scale) -> (surface, offset_x, offset_y)
+    frames = {}
+    
     def __init__(self, x, y, value=5):
         self.x = x
         self.y = y
@@ -292,10 +304,6 @@ class XPOrb:
         self.float_offset = 0
         self.pulse = 0
         
-        # Colors
-        self.XP_COLOR = (255, 255, 100)  # Golden yellow
-        self.XP_GLOW = (255, 200, 50)
-        
     def update(self, dt, player_pos, magnet_range=50):
         """Update XP orb with optional magnetic attraction"""
         self.timer += dt
@@ -319,41 +327,64 @@ class XPOrb:
         # Check if expired
         return self.timer < self.lifetime
     
-    def draw(self, surface):
-        """Draw the XP orb"""
-        import pygame
-        
-        center_x = int(self.x)
-        center_y = int(self.y + self.float_offset)
-        
-        # Main orb (larger and more visible)
-        orb_radius = max(3, int(6 * self.pulse))
-        pygame.draw.circle(surface, self.XP_COLOR, (center_x, center_y), orb_radius)
-        
-        # Inner highlight
-        inner_radius = max(1, orb_radius - 2)
-        if inner_radius > 0:
-            pygame.draw.circle(surface, (255, 255, 255), (center_x, center_y), inner_radius)
+    def get_radius(self):
+        """Orb radius for the current pulse (the only thing the pulse changes)"""
+        return max(3, int(6 * self.pulse))
+    
+    @classmethod
+    def get_frame(cls, radius, scale=1.0):
+        """Get the baked (surface, offset_x, offset_y) for an orb radius at a render scale"""
+        key = (radius, scale)
+        frame = cls.frames.get(key)
+        if frame is None:
+            frame = cls.frames[key] = bake_frame(
+                lambda canvas, x, y: cls.draw_orb(canvas, x, y, radius), radius * 2 + 16, scale=scale)
+        return frame
+    
+    @classmethod
+    def draw_orb(cls, surface, center_x, center_y, radius):
+        """Draw an orb of the given radius onto a transparent (SRCALPHA) surface"""
+        # Outer glow: nested rings of the same color, so each ring's alpha
+        # is the combined alpha of the rings layered over it
+        glow_radius = radius + 2
+        coverage = 1.0
+        for i, alpha in enumerate(cls.GLOW_ALPHAS):
+            coverage *= 1 - alpha / 255
+            ring_alpha = round((1 - coverage) * 255)
+            pygame.draw.circle(surface, cls.XP_GLOW + (ring_alpha,), (center_x, center_y), glow_radius - i)
         
-        # Outer glow (simpler approach)
-        glow_radius = orb_radius + 2
-        for i in range(3):
-            alpha = 60 - (i * 20)
-            glow_color = (self.XP_GLOW[0], self.XP_GLOW[1], self.XP_GLOW[2])
-            # Create a temporary surface for glow
-            temp_surface = pygame.Surface((glow_radius * 2 + 4, glow_radius * 2 + 4))
-            temp_surface.set_alpha(alpha)
-            temp_surface.fill((0, 0, 0))
-            temp_surface.set_colorkey((0, 0, 0))
-            pygame.draw.circle(temp_surface, glow_color, 
-                             (glow_radius + 2, glow_radius + 2), glow_radius - i)
-            surface.blit(temp_surface, 
-                        (center_x - glow_radius - 2, center_y - glow_radius - 2))
+        # Main orb under all the glow rings (the inner highlight is hidden by the core)
+        glow = 1 - coverage
+        orb_color = tuple(round(c * (1 - glow) + g * glow) for c, g in zip(cls.XP_COLOR, cls.XP_GLOW))
+        pygame.draw.circle(surface, orb_color, (center_x, center_y), radius)
         
         # Core
-        pygame.draw.circle(surface, (255, 255, 150), (center_x, center_y), max(1, orb_radius - 1))
+        pygame.draw.circle(surface, (255, 255, 150), (center_x, center_y), max(1, radius - 1))
+    
+    def draw(self, surface, offset=(0, 0)):
+        """Draw the XP orb, shifted by offset"""
+        frame, frame_x, frame_y = self.get_frame(self.get_radius())
+        center_x = int(self.x + offset[0])
+        center_y = int(self.y + offset[1] + self.float_offset)
+        surface.blit(frame, (center_x + frame_x, center_y + frame_y))
+    
+    @classmethod
+    def draw_all(cls, surface, orbs, offset=(0, 0), scale=1.0):
+        """Draw every on-screen orb, shifted by offset then scaled, in one batched blit"""
+        offset_x, offset_y = offset
+        width, height = surface.get_size()
+        batch = []
+        for orb in orbs:
+            # Cull by collision rect (with buffer)
+            screen_x = (int(orb.x) - 6 + offset_x) * scale
+            screen_y = (int(orb.y) - 6 + offset_y) * scale
+            if -50 < screen_x < width + 50 and -50 < screen_y < height + 50:
+                frame, frame_x, frame_y = cls.get_frame(orb.get_radius(), scale)
+                center_x = int((orb.x + offset_x) * scale)
+                center_y = int((orb.y + offset_y + orb.float_offset) * scale)
+                batch.append((frame, (center_x + frame_x, center_y + frame_y)))
+        surface.blits(batch, doreturn=False)
     
     def get_rect(self):
         """Get collision rectangle"""
-        import pygame
-        return pygame.Rect(int(self.x) - 6, int(self.y) - 6, 12, 12) 
\ No newline at end of file
+        return pygame.Rect(int(self.x) - 6, int(self.y) - 6, 12, 12)
@@ -0,0 +1,29 @@
+class QualityPreset:
+    """Named bundle of render settings.
+
+    render_scale is the size of the world render target relative to the
+    screen (the HUD is always drawn at full size), trail_scale shortens
+    projectile trails and particle_cap limits live particles. Game.set_quality
+    applies a preset.
+    """
+    def __init__(self, name, render_scale, shadows, trail_scale, particle_cap, smooth_upscale=False):
+        self.name = name
+        self.render_scale = render_scale
+        self.shadows = shadows
+        self.trail_scale = trail_scale
+        self.particle_cap = particle_cap
+        self.smooth_upscale = smooth_upscale  # smoothscale (slower) instead of nearest-neighbor
+
+
+# Presets from best looking to cheapest
+QUALITY_PRESETS = {
+    "high": QualityPreset("high", 1.0, True, 1.0, 4096),
+    "medium": QualityPreset("medium", 0.75, True, 0.75, 2048, smooth_upscale=True),
+    "low": QualityPreset("low", 0.5, False, 0.5, 1024),
+}
+QUALITY_ORDER = tuple(QUALITY_PRESETS)
+
+
+def next_quality(name):
+    """Get the preset after name, wrapping around"""
+    return QUALITY_ORDER[(QUALITY_ORDER.index(name) + 1) % len(QUALITY_ORDER)]
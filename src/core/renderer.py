@@ -0,0 +1,51 @@
+import pygame
+
+
+class Renderer:
+    """Full-screen effect passes drawn with persistent surfaces.
+
+    Each named overlay keeps one screen-sized surface that is only refilled
+    when its color changes and only re-alphaed when its alpha changes, so a
+    menu dimming the game every frame allocates and fills nothing. The
+    screen flash is a BLEND_RGB_ADD blit of a surface filled with the flash
+    color scaled by its strength. Blend fills straight onto the screen
+    would skip the surface, but pygame runs those per pixel, many times
+    slower than the SIMD blend blit.
+    """
+    def __init__(self):
+        self.overlays = {}  # name -> [surface, color, alpha]
+
+    def get_overlay(self, name, size, color, alpha=None):
+        """Get the overlay surface for name, filled with color at the per-surface alpha"""
+        overlay = self.overlays.get(name)
+        if overlay is None or overlay[0].get_size() != size:
+            surface = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            overlay = self.overlays[name] = [surface, None, None]
+        surface = overlay[0]
+        if overlay[1] != color:
+            surface.fill(color)
+            overlay[1] = color
+        if overlay[2] != alpha:
+            surface.set_alpha(alpha)
+            overlay[2] = alpha
+        return surface
+
+    def dim(self, surface, color, alpha, name="dim"):
+        """Blend color over the whole surface at alpha (for menus over the game)"""
+        surface.blit(self.get_overlay(name, surface.get_size(), color, alpha), (0, 0))
+
+    def flash(self, surface, color, strength):
+        """Add color, scaled by strength (0 to 1), to the whole surface"""
+        strength = min(1.0, strength)
+        color = (int(color[0] * strength), int(color[1] * strength), int(color[2] * strength))
+        surface.blit(self.get_overlay("flash", surface.get_size(), color), (0, 0),
+                     special_flags=pygame.BLEND_RGB_ADD)
+
+    def clear(self):
+        self.overlays.clear()
+
+
+# Shared renderer used by the game and its menus
+renderer = Renderer()
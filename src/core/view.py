@@ -0,0 +1,84 @@
+import numpy as np
+from src.systems.array_kernel import KernelGroup
+
+
+class ViewTransform:
+    """World-to-screen mapping for one rendered frame.
+
+    Holds the camera offset (camera plus shake), the render target size,
+    the interpolation alpha between the last two simulation steps and the
+    render scale (target pixels per world pixel). Entities draw at the
+    screen centers it computes and take the offset and scale for any
+    world-space extras (trails), so no entity state is touched to draw.
+    """
+    def __init__(self, offset_x, offset_y, width, height, alpha=1.0, margin=50, scale=1.0):
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.width = width
+        self.height = height
+        self.alpha = alpha
+        self.margin = margin  # Off-screen buffer kept when culling
+        self.scale = scale
+
+    @property
+    def offset(self):
+        return (self.offset_x, self.offset_y)
+
+    def to_screen(self, x, y):
+        """Get the integer screen position of a world position"""
+        return (round((x + self.offset_x) * self.scale), round((y + self.offset_y) * self.scale))
+
+    def screen_center(self, entity):
+        """Get an entity's screen center between its last two simulation steps"""
+        alpha = self.alpha
+        return self.to_screen(entity.prev_x + (entity.x - entity.prev_x) * alpha,
+                              entity.prev_y + (entity.y - entity.prev_y) * alpha)
+
+    def is_visible(self, center_x, center_y, width, height):
+        """Check whether a rect with this screen center is on screen (with margin)"""
+        left = center_x - width // 2
+        top = center_y - height // 2
+        margin = self.margin
+        return -margin < left < self.width + margin and -margin < top < self.height + margin
+
+    def visible(self, entities, interpolate=True):
+        """Get (entity, screen center) for every on-screen entity.
+
+        Interpolated entities need x/y and prev_x/prev_y; otherwise the rect
+        center is used. Kernel-backed groups are culled in one vectorized pass.
+        """
+        if interpolate and isinstance(entities, KernelGroup):
+            return self._visible_kernel(entities.kernel)
+
+        result = []
+        for entity in entities:
+            if interpolate:
+                center_x, center_y = self.screen_center(entity)
+            else:
+                center_x, center_y = self.to_screen(*entity.rect.center)
+            if self.is_visible(center_x, center_y, entity.rect.width * self.scale, entity.rect.height * self.scale):
+                result.append((entity, (center_x, center_y)))
+        return result
+
+    def _visible_kernel(self, kernel):
+        n = kernel.count
+        if n == 0:
+            return []
+        f = kernel.fields
+        prev_x = f["prev_x"][:n]
+        prev_y = f["prev_y"][:n]
+        scale = self.scale
+        center_x = np.rint((prev_x + (f["x"][:n] - prev_x) * self.alpha + self.offset_x) * scale).astype(np.int64)
+        center_y = np.rint((prev_y + (f["y"][:n] - prev_y) * self.alpha + self.offset_y) * scale).astype(np.int64)
+
+        # Kernel sprites are square, with a half_size per slot
+        half_size = kernel.half_size[:n] * scale if scale != 1.0 else kernel.half_size[:n]
+        left = center_x - half_size
+        top = center_y - half_size
+        margin = self.margin
+        on_screen = np.flatnonzero((left > -margin) & (left < self.width + margin) &
+                                   (top > -margin) & (top < self.height + margin))
+
+        sprites = kernel.sprites
+        return [(sprites[slot], (x, y)) for slot, x, y in
+                zip(on_screen.tolist(), center_x[on_screen].tolist(), center_y[on_screen].tolist())]
@@ -1,8 +1,52 @@
 import pygame
 import math
-import random
+from src.systems.rng import rng
+from src.systems.array_kernel import KernelField
+from src.systems.enemy_kernel import TrailField
+from src.systems.sprite_cache import EnemySpriteCache, scale_frame
+from src.systems.surface_pool import surface_pool
 
 class Enemy(pygame.sprite.Sprite):
+    # Kinematic state lives in an EnemyKernel's arrays while the enemy is in an
+    # EnemyGroup; Enemy.update is the scalar path for enemies outside one
+    kernel = None
+    kernel_slot = -1
+    x = KernelField()
+    y = KernelField()
+    prev_x = KernelField()
+    prev_y = KernelField()
+    velocity_x = KernelField()
+    velocity_y = KernelField()
+    speed = KernelField()
+    ai_timer = KernelField()
+    circle_angle = KernelField()
+    damage_flash = KernelField()
+    animation_timer = KernelField()
+    pulse_timer = KernelField()
+    hover_offset = KernelField()
+    rotation_angle = KernelField()
+    shoot_timer = KernelField()
+    movement_trail = TrailField()
+    
+    # Draw bodies from pre-rendered frames (False: procedural every frame)
+    use_sprite_cache = True
+    
+    # Baked shadow surfaces per enemy type (and render scale); off for low quality
+    use_shadows = True
+    shadow_cache = {}
+    
+    # Fast/swarm movement trails; off when the quality governor cuts detail
+    use_movement_trails = True
+    
+    # Level of detail by on-screen enemy count: at or above each threshold the
+    # tier goes up one (0 full, 1 reduced: no shadows or trails, 2 silhouette:
+    # one still frame, no health bar), never below min_lod_tier. The count
+    # includes bosses and elites, which always get full detail themselves.
+    lod_thresholds = (150, 400)
+    min_lod_tier = 0
+    LOD_TIER_NAMES = ("full", "reduced", "silhouette")
+    FULL_DETAIL_TYPES = ("elite", "boss")
+
     def __init__(self, x, y, enemy_type="basic", wave=1):
         super().__init__()
         self.enemy_type = enemy_type
@@ -70,6 +114,13 @@ class Enemy(pygame.sprite.Sprite):
             self.score_value = 100
             self.color = (255, 100, 255)  # Magenta
         
+        # Float position of the rect center (prev_* is the last simulated step)
+        self.x = float(x)
+        self.y = float(y)
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.rect.center = (round(self.x), round(self.y))
+        
         # Apply wave scaling to stats
         self.apply_wave_scaling()
         
@@ -84,7 +135,7 @@ class Enemy(pygame.sprite.Sprite):
         # AI behavior
         self.ai_timer = 0
         self.ai_state = getattr(self, 'ai_state', "chase")  # chase, circle, retreat, sniper
-        self.circle_angle = random.uniform(0, 2 * math.pi)
+        self.circle_angle = rng.ai.uniform(0, 2 * math.pi)
         
         # Special abilities
         self.attack_cooldown = getattr(self, 'attack_cooldown', 0)
@@ -138,6 +189,10 @@ class Enemy(pygame.sprite.Sprite):
             self.score_value = int(self.score_value * (1 + self.wave * 0.2))  # More score for higher wave bosses
     
     def update(self, dt, player_pos):
+        # Remember the last simulated position for render interpolation
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # Update timers
         self.ai_timer += dt
         self.damage_flash = max(0, self.damage_flash - dt)
@@ -161,13 +216,14 @@ class Enemy(pygame.sprite.Sprite):
         
         # Apply movement
         move_factor = dt / 1000.0
-        self.rect.x += self.velocity_x * move_factor
-        self.rect.y += self.velocity_y * move_factor
+        self.x += self.velocity_x * move_factor
+        self.y += self.velocity_y * move_factor
+        self.rect.center = (round(self.x), round(self.y))
     
     def update_ai(self, dt, player_pos):
         player_x, player_y = player_pos
-        dx = player_x - self.rect.centerx
-        dy = player_y - self.rect.centery
+        dx = player_x - self.x
+        dy = player_y - self.y
         distance = math.sqrt(dx * dx + dy * dy)
         
         if distance > 0:
@@ -217,11 +273,11 @@ class Enemy(pygame.sprite.Sprite):
             elif self.enemy_type == "swarm":
                 # Swarm behavior: fast and erratic
                 if self.ai_timer % 800 < 400:  # Change direction every 0.4 seconds
-                    self.velocity_x = dx * self.speed + random.uniform(-20, 20)
-                    self.velocity_y = dy * self.speed + random.uniform(-20, 20)
+                    self.velocity_x = dx * self.speed + rng.ai.uniform(-20, 20)
+                    self.velocity_y = dy * self.speed + rng.ai.uniform(-20, 20)
                 else:
                     # Sometimes make sharp turns
-                    turn_angle = random.uniform(-math.pi/4, math.pi/4)
+                    turn_angle = rng.ai.uniform(-math.pi/4, math.pi/4)
                     rotated_dx = dx * math.cos(turn_angle) - dy * math.sin(turn_angle)
                     rotated_dy = dx * math.sin(turn_angle) + dy * math.cos(turn_angle)
                     self.velocity_x = rotated_dx * self.speed
@@ -336,11 +392,29 @@ class Enemy(pygame.sprite.Sprite):
         
         return None
     
-    def draw_shadow(self, surface, center_x, center_y):
+    def draw_shadow(self, surface, center_x, center_y, scale=1.0):
         """Draw realistic shaped shadow based on enemy type (sun from South-West)"""
         # Shadow offset (sun from South-West)
-        shadow_offset_x = 4
-        shadow_offset_y = 6
+        shadow_offset_x = round(4 * scale)
+        shadow_offset_y = round(6 * scale)
+        
+        # Shadows only depend on the type, so each is baked once and reused
+        key = (self.enemy_type, scale)
+        shadow_surf = Enemy.shadow_cache.get(key)
+        if shadow_surf is None:
+            shadow_surf = self.create_shadow_surface()
+            if scale != 1.0:
+                shadow_surf = scale_frame(shadow_surf, scale, smooth=False)
+            Enemy.shadow_cache[key] = shadow_surf
+        
+        # Position shadow with offset
+        shadow_x = center_x - shadow_surf.get_width() // 2 + shadow_offset_x
+        shadow_y = center_y - shadow_surf.get_height() // 2 + shadow_offset_y
+        
+        surface.blit(shadow_surf, (shadow_x, shadow_y))
+
+    def create_shadow_surface(self):
+        """Bake the shaped shadow for this enemy type"""
         shadow_alpha = 60
         shadow_color = (30, 30, 30)
         
@@ -476,20 +550,93 @@ class Enemy(pygame.sprite.Sprite):
             points = [(12, 2), (18, 6), (18, 14), (12, 18), (6, 14), (6, 6)]
             pygame.draw.polygon(shadow_surf, shadow_color, points)
         
-        # Position shadow with offset
-        shadow_x = center_x - shadow_surf.get_width() // 2 + shadow_offset_x
-        shadow_y = center_y - shadow_surf.get_height() // 2 + shadow_offset_y
-        
-        surface.blit(shadow_surf, (shadow_x, shadow_y))
+        return shadow_surf
 
-    def draw(self, surface):
-        center_x, center_y = self.rect.center
+    @classmethod
+    def get_lod_tier(cls, visible_count):
+        """Get the level-of-detail tier for this many on-screen enemies"""
+        tier = 0
+        for threshold in cls.lod_thresholds:
+            if visible_count >= threshold:
+                tier += 1
+        return min(max(tier, cls.min_lod_tier), len(cls.LOD_TIER_NAMES) - 1)
+    
+    @classmethod
+    def draw_all(cls, surface, visible, camera_offset=(0, 0), scale=1.0, lod=0):
+        """Draw (enemy, screen center) pairs at a level-of-detail tier.
+        
+        At the silhouette tier every silhouette goes out in one blits call,
+        then the full-detail types are drawn on top.
+        """
+        if lod < 2:
+            for enemy, center in visible:
+                enemy.draw(surface, center, camera_offset, scale, lod)
+            return
+        
+        full_detail = []
+        blits = []
+        for enemy, (center_x, center_y) in visible:
+            if enemy.enemy_type in cls.FULL_DETAIL_TYPES:
+                full_detail.append((enemy, (center_x, center_y)))
+            else:
+                blits.append(enemy.get_silhouette_blit(center_x, center_y, scale))
+        surface.blits(blits, doreturn=False)
+        for enemy, center in full_detail:
+            enemy.draw(surface, center, camera_offset, scale)
+    
+    def draw(self, surface, custom_center=None, camera_offset=(0, 0), scale=1.0, lod=0):
+        # Use custom center if provided, otherwise use rect center
+        center_x, center_y = custom_center if custom_center else self.rect.center
+        
+        # Reduced detail for dense hordes (never for bosses and elites)
+        if lod and self.enemy_type not in self.FULL_DETAIL_TYPES:
+            self.draw_lod(surface, center_x, center_y, scale, lod)
+            return
         
         # Draw shadow first (underneath enemy)
-        self.draw_shadow(surface, center_x, center_y)
+        if self.use_shadows:
+            self.draw_shadow(surface, center_x, center_y, scale)
         
         # Aura effects disabled for cleaner appearance
         
+        # Translucent layers are drawn live around the (cached) body
+        if self.use_movement_trails:
+            self.draw_movement_trail(surface, camera_offset, scale)
+        if self.enemy_type == "boss":
+            self.draw_boss_aura(surface, center_x, center_y, scale)
+        
+        # Scaled render targets always use (scaled) cached frames
+        if self.use_sprite_cache or scale != 1.0:
+            sprite_cache.blit(surface, self, center_x, center_y, scale)
+        else:
+            self.draw_body(surface, center_x, center_y)
+        
+        if self.enemy_type == "boss":
+            self.draw_boss_damage_field(surface, center_x, center_y, scale)
+        
+        # Draw health bar for damaged enemies
+        if self.health < self.max_health:
+            self.draw_health_bar(surface, center_x, center_y, scale)
+    
+    def draw_lod(self, surface, center_x, center_y, scale, lod):
+        """Draw the enemy at a reduced level of detail (tier 1 or 2)"""
+        if lod >= 2:
+            surface.blit(*self.get_silhouette_blit(center_x, center_y, scale))
+            return
+        
+        # Cached body and health bar only
+        sprite_cache.blit(surface, self, center_x, center_y, scale)
+        if self.health < self.max_health:
+            self.draw_health_bar(surface, center_x, center_y, scale)
+    
+    def get_silhouette_blit(self, center_x, center_y, scale=1.0):
+        """Get (surface, position) for blitting the silhouette tier at a screen center"""
+        frame, offset_x, offset_y = sprite_cache.get_silhouette(self, scale)
+        return (frame, (center_x + offset_x, center_y + offset_y))
+    
+    def draw_body(self, surface, center_x, center_y):
+        """Draw the enemy body procedurally (also used to bake sprite cache frames)"""
+        # Animation rates must repeat within the sprite cache loop (see EnemySpriteCache)
         # Determine color based on type and damage flash
         draw_color = self.color
         if self.damage_flash > 0:
@@ -512,10 +659,6 @@ class Enemy(pygame.sprite.Sprite):
             self.draw_elite_enemy(surface, center_x, center_y, draw_color)
         elif self.enemy_type == "boss":
             self.draw_boss_enemy(surface, center_x, center_y, draw_color)
-        
-        # Draw health bar for damaged enemies
-        if self.health < self.max_health:
-            self.draw_health_bar(surface)
     
     def _draw_elite_aura(self, surface, center_x, center_y):
         """Draw aura for high-wave enemies or special types"""
@@ -541,8 +684,7 @@ class Enemy(pygame.sprite.Sprite):
             aura_alpha = int(40 * wave_factor * pulse)
             
             # Create aura surface
-            aura_surf = pygame.Surface((radius * 2, radius * 2))
-            aura_surf.set_alpha(aura_alpha)
+            aura_surf = surface_pool.get((radius * 2, radius * 2), alpha=aura_alpha)
             pygame.draw.circle(aura_surf, aura_color, (radius, radius), radius, 2)
             surface.blit(aura_surf, (center_x - radius, center_y - radius))
     
@@ -590,7 +732,7 @@ class Enemy(pygame.sprite.Sprite):
                         pygame.Rect(center_x + 11 + barrel_extend, hover_y - 0.5, 2, 1))
         
         # Sensor arrays - blinking lights
-        blink_on = (self.animation_timer % 1000) < 500
+        blink_on = math.sin(self.animation_timer * 0.006) >= 0
         sensor_color = energy_blue if blink_on else dark_metal
         
         # Top sensors
@@ -634,17 +776,6 @@ class Enemy(pygame.sprite.Sprite):
         pygame.draw.polygon(surface, dark_metal, body_points)
         pygame.draw.polygon(surface, color, body_points, 2)
         
-        # Speed trails behind the enemy
-        for i, trail_pos in enumerate(self.movement_trail):
-            if i < len(self.movement_trail) - 1:
-                alpha = (i + 1) * 50
-                trail_radius = 3 - i
-                # Create temporary surface for alpha blending
-                trail_surf = pygame.Surface((trail_radius * 2, trail_radius * 2))
-                trail_surf.set_alpha(alpha)
-                pygame.draw.circle(trail_surf, energy_trail, (trail_radius, trail_radius), trail_radius)
-                surface.blit(trail_surf, (trail_pos[0] - trail_radius, trail_pos[1] - trail_radius))
-        
         # Head/scanner - rotating
         scanner_angle = self.rotation_angle * 2
         scanner_x = center_x + math.cos(scanner_angle) * 2
@@ -755,7 +886,7 @@ class Enemy(pygame.sprite.Sprite):
                         pygame.Rect(center_x + 5, hover_y - 12, 3, 4))
         
         # Enhanced treads/mobility system
-        tread_animation = int(self.animation_timer * 0.01) % 8
+        tread_animation = int(self.animation_timer * 0.008 / (2 * math.pi) * 8) % 8  # 8 steps per cycle
         for i in range(-10, 11, 3):
             tread_y = hover_y + 12 + (1 if (i + tread_animation) % 6 < 3 else 0)
             pygame.draw.circle(surface, weapon_metal, (center_x + i, tread_y), 2)
@@ -937,15 +1068,7 @@ class Enemy(pygame.sprite.Sprite):
                         (center_x + swarm_jitter, hover_y - 4), 
                         (antenna_tip_x, antenna_tip_y), 1)
         pygame.draw.circle(surface, swarm_yellow, (antenna_tip_x, antenna_tip_y), 1)
-        
-        # Energy trails for speed indication
-        for i, trail_pos in enumerate(self.movement_trail[-3:]):  # Only last 3 positions
-            if i < len(self.movement_trail) - 1:
-                alpha = (i + 1) * 80
-                trail_surf = pygame.Surface((2, 2))
-                trail_surf.set_alpha(alpha)
-                pygame.draw.circle(trail_surf, agile_green, (1, 1), 1)
-                surface.blit(trail_surf, (trail_pos[0] - 1, trail_pos[1] - 1))
+
     
     def draw_heavy_enemy(self, surface, center_x, center_y, color):
         """Enhanced heavy assault cyborg - larger than tank with more firepower"""
@@ -1032,7 +1155,7 @@ class Enemy(pygame.sprite.Sprite):
                         pygame.Rect(center_x + 6 + heavy_sway, hover_y - 18, 4, 6))
         
         # Missile indicators
-        missile_ready = (self.animation_timer % 2000) < 1000  # Blink every 2 seconds
+        missile_ready = math.sin(self.animation_timer * 0.003) >= 0  # Blink about every 2 seconds
         if missile_ready:
             pygame.draw.circle(surface, warning_lights, 
                              (center_x - 8 + heavy_sway, hover_y - 15), 1)
@@ -1040,7 +1163,7 @@ class Enemy(pygame.sprite.Sprite):
                              (center_x + 8 + heavy_sway, hover_y - 15), 1)
         
         # Enhanced mobility system - heavy treads
-        tread_animation = int(self.animation_timer * 0.008) % 12
+        tread_animation = int(self.animation_timer * 0.004 / (2 * math.pi) * 12) % 12  # 12 steps per cycle
         for i in range(-12, 13, 3):
             tread_y = hover_y + 15 + (1 if (i + tread_animation) % 6 < 3 else 0)
             pygame.draw.circle(surface, heavy_weapons, (center_x + i + heavy_sway, tread_y), 3)
@@ -1080,7 +1203,7 @@ class Enemy(pygame.sprite.Sprite):
         hover_y = center_y + int(self.hover_offset * 0.2)  # Minimal hover for heavy unit
         walk_cycle = math.sin(self.animation_timer * 0.003) * 2  # Subtle walking
         body_sway = math.sin(self.animation_timer * 0.002) * 0.8  # Minimal sway
-        turret_rotation = math.sin(self.animation_timer * 0.0008) * 0.15  # Slow scanning
+        turret_rotation = math.sin(self.animation_timer * 0.001) * 0.15  # Slow scanning
         
         # Military color scheme - dark and menacing
         dark_armor = (25, 30, 35)       # Very dark gray armor
@@ -1200,9 +1323,9 @@ class Enemy(pygame.sprite.Sprite):
         # === DAMAGE EFFECTS ===
         if self.health < self.max_health * 0.5:
             # Sparking damage effects
-            if random.random() < 0.2:  # Random sparking
-                spark_x = center_x + random.randint(-15, 15)
-                spark_y = hover_y + random.randint(-10, 10)
+            if rng.cosmetic.random() < 0.2:  # Random sparking
+                spark_x = center_x + rng.cosmetic.randint(-15, 15)
+                spark_y = hover_y + rng.cosmetic.randint(-10, 10)
                 pygame.draw.circle(surface, amber_light, (spark_x, spark_y), 1)
     
     def draw_boss_enemy(self, surface, center_x, center_y, color):
@@ -1222,17 +1345,6 @@ class Enemy(pygame.sprite.Sprite):
         warning_amber = (120, 80, 30)    # Amber warnings
         steel_highlight = (70, 75, 80)   # Steel highlights
         
-        # === INTIMIDATION AURA (Subtle) ===
-        field_radius = int(30 + 5 * power_surge)
-        field_alpha = int(15 + 10 * power_surge)
-        
-        for ring in range(2):
-            ring_radius = field_radius + ring * 6
-            field_surf = pygame.Surface((ring_radius * 2, ring_radius * 2))
-            field_surf.set_alpha(field_alpha // (ring + 1))
-            pygame.draw.circle(field_surf, danger_red, (ring_radius, ring_radius), ring_radius, 2)
-            surface.blit(field_surf, (center_x - ring_radius, hover_y - ring_radius))
-        
         # === MAIN CHASSIS (Massive Tank Body) ===
         chassis_width = 60
         chassis_height = 38
@@ -1250,7 +1362,7 @@ class Enemy(pygame.sprite.Sprite):
             
             # Subtle warning lights
             if i % 2 == 0:
-                light_y = hover_y - 8 + (self.animation_timer * 0.005) % 20
+                light_y = hover_y - 8 + (self.animation_timer * 0.0015 / (2 * math.pi) * 20) % 20
                 pygame.draw.circle(surface, warning_amber, (plate_x + 4, int(light_y)), 1)
         
         # === TITAN WALKER LEGS (6 legs for stability) ===
@@ -1394,7 +1506,7 @@ class Enemy(pygame.sprite.Sprite):
         
         # Power distribution network
         for angle in range(0, 360, 30):
-            network_angle = math.radians(angle + self.rotation_angle * 20)
+            network_angle = math.radians(angle) + self.rotation_angle / 3
             network_end_x = center_x + math.cos(network_angle) * 20 + body_sway
             network_end_y = hover_y + 8 + math.sin(network_angle) * 15
             pygame.draw.line(surface, danger_red, 
@@ -1422,25 +1534,79 @@ class Enemy(pygame.sprite.Sprite):
             spark_positions = [(center_x - 15, hover_y), (center_x + 15, hover_y), 
                              (center_x, tower_y + 10)]
             for spark_x, spark_y in spark_positions:
-                if random.random() < 0.3:  # Random sparking
+                if rng.cosmetic.random() < 0.3:  # Random sparking
                     for _ in range(3):
-                        spark_offset_x = random.randint(-5, 5)
-                        spark_offset_y = random.randint(-5, 5)
+                        spark_offset_x = rng.cosmetic.randint(-5, 5)
+                        spark_offset_y = rng.cosmetic.randint(-5, 5)
                         pygame.draw.circle(surface, warning_amber, 
                                          (spark_x + spark_offset_x, spark_y + spark_offset_y), 1)
-            
-            # Damage warning field
-            damage_alpha = int(50 + 50 * power_surge)
-            damage_surf = pygame.Surface((field_radius * 2, field_radius * 2))
-            damage_surf.set_alpha(damage_alpha)
-            pygame.draw.circle(damage_surf, danger_red, (field_radius, field_radius), field_radius, 5)
-            surface.blit(damage_surf, (center_x - field_radius - 10, hover_y - field_radius - 10))
+
+    
+    def draw_movement_trail(self, surface, camera_offset=(0, 0), scale=1.0):
+        """Draw the fading movement trail of fast and swarm enemies (world positions)"""
+        camera_x, camera_y = camera_offset
+        if self.enemy_type == "fast":
+            # Speed trails behind the enemy
+            energy_trail = (255, 200, 0)
+            for i, trail_pos in enumerate(self.movement_trail):
+                trail_radius = round((3 - i) * scale)
+                if i < len(self.movement_trail) - 1 and trail_radius > 0:
+                    alpha = (i + 1) * 50
+                    # Create temporary surface for alpha blending
+                    trail_surf = surface_pool.get((trail_radius * 2, trail_radius * 2), alpha=alpha)
+                    pygame.draw.circle(trail_surf, energy_trail, (trail_radius, trail_radius), trail_radius)
+                    surface.blit(trail_surf, (round((trail_pos[0] + camera_x) * scale) - trail_radius,
+                                              round((trail_pos[1] + camera_y) * scale) - trail_radius))
+        elif self.enemy_type == "swarm":
+            # Energy trails for speed indication
+            agile_green = (100, 255, 150)
+            for i, trail_pos in enumerate(self.movement_trail[-3:]):  # Only last 3 positions
+                if i < len(self.movement_trail) - 1:
+                    alpha = (i + 1) * 80
+                    trail_surf = surface_pool.get((2, 2), alpha=alpha)
+                    pygame.draw.circle(trail_surf, agile_green, (1, 1), 1)
+                    surface.blit(trail_surf, (round((trail_pos[0] + camera_x) * scale) - 1,
+                                              round((trail_pos[1] + camera_y) * scale) - 1))
+    
+    def draw_boss_aura(self, surface, center_x, center_y, scale=1.0):
+        """Draw the boss's translucent intimidation aura (under the body)"""
+        hover_y = center_y + int(self.hover_offset * 0.1 * scale)
+        power_surge = math.sin(self.animation_timer * 0.003) * 0.3 + 0.7
+        danger_red = (100, 25, 25)
+        
+        # === INTIMIDATION AURA (Subtle) ===
+        field_radius = int(30 + 5 * power_surge)
+        field_alpha = int(15 + 10 * power_surge)
+        
+        for ring in range(2):
+            ring_radius = int((field_radius + ring * 6) * scale)
+            field_surf = surface_pool.get((ring_radius * 2, ring_radius * 2), alpha=field_alpha // (ring + 1))
+            pygame.draw.circle(field_surf, danger_red, (ring_radius, ring_radius), ring_radius,
+                               max(1, round(2 * scale)))
+            surface.blit(field_surf, (center_x - ring_radius, hover_y - ring_radius))
     
-    def draw_health_bar(self, surface):
-        bar_width = self.rect.width
-        bar_height = 4
-        bar_x = self.rect.x
-        bar_y = self.rect.y - 8
+    def draw_boss_damage_field(self, surface, center_x, center_y, scale=1.0):
+        """Draw the boss's translucent damage warning field (over the body)"""
+        if self.health >= self.max_health * 0.5:
+            return
+        hover_y = center_y + int(self.hover_offset * 0.1 * scale)
+        power_surge = math.sin(self.animation_timer * 0.003) * 0.3 + 0.7
+        field_radius = int((30 + 5 * power_surge) * scale)
+        danger_red = (100, 25, 25)
+        
+        # Damage warning field
+        damage_alpha = int(50 + 50 * power_surge)
+        damage_surf = surface_pool.get((field_radius * 2, field_radius * 2), alpha=damage_alpha)
+        pygame.draw.circle(damage_surf, danger_red, (field_radius, field_radius), field_radius,
+                           max(1, round(5 * scale)))
+        field_shift = round(10 * scale)
+        surface.blit(damage_surf, (center_x - field_radius - field_shift, hover_y - field_radius - field_shift))
+    
+    def draw_health_bar(self, surface, center_x, center_y, scale=1.0):
+        bar_width = round(self.rect.width * scale)
+        bar_height = max(2, round(4 * scale))
+        bar_x = center_x - bar_width // 2
+        bar_y = center_y - round((self.rect.height // 2 + 8) * scale)
         
         # Background
         pygame.draw.rect(surface, self.WHITE, 
@@ -1461,6 +1627,10 @@ class Enemy(pygame.sprite.Sprite):
                         pygame.Rect(bar_x, bar_y, health_width, bar_height))
 
 
+# Pre-rendered enemy body frames shared by all enemies
+sprite_cache = EnemySpriteCache()
+
+
 class EnemySpawner:
     def __init__(self, screen_width, screen_height):
         self.screen_width = screen_width
@@ -1508,16 +1678,16 @@ class EnemySpawner:
         player_x, player_y = player_pos
         
         # Choose a side to spawn from
-        side = random.choice(["top", "bottom", "left", "right"])
+        side = rng.spawning.choice(["top", "bottom", "left", "right"])
         
         if side == "top":
-            return random.randint(0, self.screen_width), -30
+            return rng.spawning.randint(0, self.screen_width), -30
         elif side == "bottom":
-            return random.randint(0, self.screen_width), self.screen_height + 30
+            return rng.spawning.randint(0, self.screen_width), self.screen_height + 30
         elif side == "left":
-            return -30, random.randint(0, self.screen_height)
+            return -30, rng.spawning.randint(0, self.screen_height)
         else:  # right
-            return self.screen_width + 30, random.randint(0, self.screen_height)
+            return self.screen_width + 30, rng.spawning.randint(0, self.screen_height)
     
     def choose_enemy_type(self, wave, is_boss_wave=False):
         """Choose enemy type based on progressive horde system"""
@@ -1584,14 +1754,14 @@ class EnemySpawner:
                            if enemy_type in available_types}
         
         # Handle swarm special spawning (spawn multiple)
-        if random.random() < 0.3 and "swarm" in filtered_weights and wave >= 3:
+        if rng.spawning.random() < 0.3 and "swarm" in filtered_weights and wave >= 3:
             return "swarm"
             
         # Weighted random selection
         if not filtered_weights:
             return "basic"
             
-        rand = random.random()
+        rand = rng.spawning.random()
         cumulative = 0
         total_weight = sum(filtered_weights.values())
         
@@ -1606,14 +1776,14 @@ class EnemySpawner:
         """Get how many enemies of this type to spawn at once"""
         if enemy_type == "swarm":
             # Spawn swarm enemies in groups
-            return random.randint(3, min(8, 3 + wave // 2))
+            return rng.spawning.randint(3, min(8, 3 + wave // 2))
         elif enemy_type == "boss":
             # Bosses spawn alone, but more bosses in later waves
             return min(3, 1 + wave // 10)
         else:
             # Normal enemies usually spawn alone, sometimes in small groups
-            if wave >= 8 and random.random() < 0.3:
-                return random.randint(2, 3)
+            if wave >= 8 and rng.spawning.random() < 0.3:
+                return rng.spawning.randint(2, 3)
             return 1
     
     def reset_boss_flag(self):
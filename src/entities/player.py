@@ -1,6 +1,8 @@
 import pygame
 import math
-import random
+from src.systems.rng import rng
+from src.systems.sprite_cache import LRUFrameCache, bake_frame, scale_frame
+from src.systems.surface_pool import surface_pool
 from .projectile import Projectile
 from .weapon_system import WeaponSystem
 
@@ -16,9 +18,31 @@ if not hasattr(pygame, 'K_LEFT'):
     pygame.K_s = 115
 
 class Player(pygame.sprite.Sprite):
+    # Baked shadow surfaces per render scale, shared by all players; off for low quality
+    use_shadows = True
+    shadow_cache = {}
+    
+    # Baked character poses (False: draw procedurally every frame)
+    use_frame_cache = True
+    frame_cache = LRUFrameCache(256)
+    
+    # Pose quantization for cached frames
+    FRAME_ANIMATION_MS = 100    # animation_timer step (core pulse, idle breathing)
+    FRAME_ANIMATION_STEPS = 40  # animation steps before the loop repeats
+    FRAME_WALK_STEPS = 24       # steps per walk loop (4 pi covers all walk sines)
+    FRAME_RECOIL_STEPS = 8      # steps per shooting recoil oscillation
+    
     def __init__(self, x, y):
         super().__init__()
         self.rect = pygame.Rect(x - 15, y - 15, 30, 30)
+        
+        # Float position of the rect center (prev_* is the last simulated step)
+        self.x = float(x)
+        self.y = float(y)
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.rect.center = (round(self.x), round(self.y))
+        
         self.image = pygame.Surface((30, 30))  # Required for pygame sprite
         self.image.set_colorkey((0, 0, 0))  # Make black transparent
         self.speed = 180  # pixels per second (reduced from 300 for better balance)
@@ -113,6 +137,10 @@ class Player(pygame.sprite.Sprite):
         self.damage_reduction = 1.0  # Multiplier for incoming damage
         
     def update(self, keys, dt, screen_width, screen_height):
+        # Remember the last simulated position for render interpolation
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # Update timers
         self.shoot_cooldown = max(0, self.shoot_cooldown - dt)
         self.damage_cooldown = max(0, self.damage_cooldown - dt)
@@ -198,20 +226,26 @@ class Player(pygame.sprite.Sprite):
         # Apply movement with upgrades
         total_speed_multiplier = self.speed_multiplier * self.base_speed_multiplier
         move_speed = self.speed * total_speed_multiplier * (dt / 1000.0)
-        self.rect.x += dx * move_speed
-        self.rect.y += dy * move_speed
+        self.x += dx * move_speed
+        self.y += dy * move_speed
         
         # Keep player on screen
-        self.rect.clamp_ip(pygame.Rect(0, 0, screen_width, screen_height))
+        half_width = self.rect.width / 2
+        half_height = self.rect.height / 2
+        self.x = max(half_width, min(self.x, screen_width - half_width))
+        self.y = max(half_height, min(self.y, screen_height - half_height))
+        self.rect.center = (round(self.x), round(self.y))
     
-    def shoot(self, camera_x=0.0, camera_y=0.0):
+    def shoot(self, camera_x=0.0, camera_y=0.0, mouse_pos=None):
         # Get weapon-specific fire rate multiplier
         fire_rate_multiplier = self.weapon_system.get_fire_rate_multiplier(self.current_weapon)
         actual_shoot_delay = self.shoot_delay * self.shoot_delay_multiplier * fire_rate_multiplier
         
         if self.shoot_cooldown <= 0:
             # Get mouse position for direction
-            mouse_x, mouse_y = pygame.mouse.get_pos()
+            if mouse_pos is None:
+                mouse_pos = pygame.mouse.get_pos()
+            mouse_x, mouse_y = mouse_pos
             
             # Convert mouse coordinates to world coordinates
             world_mouse_x = mouse_x + camera_x
@@ -283,9 +317,9 @@ class Player(pygame.sprite.Sprite):
         elif powerup_type == "health":
             self.heal(50)
     
-    def draw(self, surface):
+    def draw(self, surface, custom_center=None, scale=1.0):
         # Draw enhanced player with animations and effects
-        center_x, center_y = self.rect.center
+        center_x, center_y = custom_center if custom_center else self.rect.center
         
         # Determine if player is invincible (flashing effect)
         is_invincible = self.damage_cooldown > 0
@@ -293,22 +327,76 @@ class Player(pygame.sprite.Sprite):
         
         # Draw shield effect first (behind player)
         if self.shield_current > 0:
-            self._draw_shield_effect(surface, center_x, center_y)
+            self._draw_shield_effect(surface, center_x, center_y, scale)
         
         # Draw energy aura for powered-up states
         if "damage" in self.powerup_timers or "speed" in self.powerup_timers:
-            self._draw_power_aura(surface, center_x, center_y)
+            self._draw_power_aura(surface, center_x, center_y, scale)
         
         if not flash:
-            self._draw_detailed_player(surface, center_x, center_y)
+            if self.use_shadows:
+                self.draw_shadow(surface, center_x, center_y, scale)
+            # Scaled render targets always use (scaled) cached poses
+            if self.use_frame_cache or scale != 1.0:
+                self._draw_cached_player(surface, center_x, center_y, scale)
+            else:
+                self._draw_detailed_player(surface, center_x, center_y)
         else:
             # Draw damage sparks when hit
             if is_invincible:
                 for _ in range(5):  # Draw random sparks
-                    spark_x = center_x + random.randint(-10, 10)
-                    spark_y = center_y + random.randint(-10, 10)
+                    spark_x = center_x + round(rng.cosmetic.randint(-10, 10) * scale)
+                    spark_y = center_y + round(rng.cosmetic.randint(-10, 10) * scale)
                     pygame.draw.line(surface, (255, 200, 0), (spark_x, spark_y), 
-                                    (spark_x + random.randint(-5, 5), spark_y + random.randint(-5, 5)), 2)
+                                    (spark_x + round(rng.cosmetic.randint(-5, 5) * scale),
+                                     spark_y + round(rng.cosmetic.randint(-5, 5) * scale)), max(1, round(2 * scale)))
+    
+    def get_pose(self):
+        """Quantize the animation state into (cache key, representative timers)"""
+        # Animation pulses and idle breathing
+        animation_step = int(self.animation_timer // self.FRAME_ANIMATION_MS) % self.FRAME_ANIMATION_STEPS
+        animation_timer = animation_step * self.FRAME_ANIMATION_MS
+        
+        # Walk cycle (only drawn while moving)
+        walk_step = 0
+        walk_cycle = 0
+        if self.is_moving:
+            walk_loop = 4 * math.pi
+            walk_step = int(self.walk_cycle % walk_loop / walk_loop * self.FRAME_WALK_STEPS)
+            walk_cycle = (walk_step + 0.5) * walk_loop / self.FRAME_WALK_STEPS
+        
+        # Shooting recoil oscillates with the cooldown; the muzzle flash shows below 50 ms
+        recoil = None
+        shoot_cooldown = 0
+        if self.shoot_cooldown > 0:
+            recoil_loop = 2 * math.pi / 0.1
+            muzzle_flash = self.shoot_cooldown < 50
+            recoil_step = int(self.shoot_cooldown % recoil_loop / recoil_loop * self.FRAME_RECOIL_STEPS)
+            shoot_cooldown = (recoil_step + 0.5) * recoil_loop / self.FRAME_RECOIL_STEPS
+            shoot_cooldown = min(shoot_cooldown, 49) if muzzle_flash else shoot_cooldown + recoil_loop
+            recoil = (recoil_step, muzzle_flash)
+        
+        # Color variants from powerups and implants
+        variant = ("damage" in self.powerup_timers, "speed" in self.powerup_timers,
+                   self.has_night_vision, self.has_neural_link, self.has_cyber_armor)
+        
+        key = (self.facing_direction, self.is_moving, walk_step, animation_step, recoil, variant)
+        return key, (animation_timer, walk_cycle, shoot_cooldown)
+    
+    def _draw_cached_player(self, surface, center_x, center_y, scale=1.0):
+        """Blit the baked frame for the current pose (baking it on a miss)"""
+        key, timers = self.get_pose()
+        frame, offset_x, offset_y = Player.frame_cache.get((key, scale), lambda: self._bake_pose(timers, scale))
+        surface.blit(frame, (center_x + offset_x, center_y + offset_y))
+    
+    def _bake_pose(self, timers, scale=1.0):
+        """Render the procedural player at the pose's representative timers"""
+        saved = (self.animation_timer, self.walk_cycle, self.shoot_cooldown)
+        self.animation_timer, self.walk_cycle, self.shoot_cooldown = timers
+        try:
+            return bake_frame(self._draw_detailed_player, 96, scale=scale)
+        finally:
+            self.animation_timer, self.walk_cycle, self.shoot_cooldown = saved
     
     def _draw_detailed_player(self, surface, center_x, center_y):
         """Draw detailed animated cyberpunk player character"""
@@ -373,8 +461,7 @@ class Player(pygame.sprite.Sprite):
             elif self.facing_direction == 3:  # Down
                 torso_tilt = int(math.sin(self.walk_cycle) * 0.5 * scale)
         
-        # 1. Realistic shaped shadow (like enemies)
-        self.draw_shadow(surface, center_x, center_y)
+        # 1. Realistic shaped shadow (like enemies) is drawn by draw()
         
         # 2. Legs with walking animation (scaled) and directional adjustment
         leg_offset = walk_offset if self.is_moving else 0
@@ -613,7 +700,7 @@ class Player(pygame.sprite.Sprite):
                         pygame.Rect(antenna_base_x - int(0.5 * scale), antenna_base_y - antenna_height - int(1 * scale), 
                                     int(1 * scale), int(1 * scale)))
     
-    def _draw_shield_effect(self, surface, center_x, center_y):
+    def _draw_shield_effect(self, surface, center_x, center_y, scale=1.0):
         """Draw shield visual effect around player"""
         import time
         current_time = time.time() * 1000  # Convert to milliseconds
@@ -627,24 +714,24 @@ class Player(pygame.sprite.Sprite):
         
         # Multiple shield layers for depth
         for layer in range(3):
-            radius = 20 + layer * 3
+            radius = round((20 + layer * 3) * scale)
             layer_alpha = max(20, shield_alpha - layer * 20)
             
             # Create shield color (cyan-blue)
             shield_color = (self.CYAN[0], self.CYAN[1], self.CYAN[2])
             
             # Draw shield ring
-            pygame.draw.circle(surface, shield_color, (int(center_x), int(center_y)), radius, 2)
+            pygame.draw.circle(surface, shield_color, (int(center_x), int(center_y)), radius, max(1, round(2 * scale)))
         
         # Shield energy sparks
         if shield_percentage > 0.5:
             for i in range(6):
                 angle = (current_time * 0.01 + i * math.pi / 3) % (2 * math.pi)
-                spark_x = center_x + math.cos(angle) * 22
-                spark_y = center_y + math.sin(angle) * 22
+                spark_x = center_x + math.cos(angle) * 22 * scale
+                spark_y = center_y + math.sin(angle) * 22 * scale
                 pygame.draw.circle(surface, (255, 255, 255), (int(spark_x), int(spark_y)), 1)
     
-    def _draw_power_aura(self, surface, center_x, center_y):
+    def _draw_power_aura(self, surface, center_x, center_y, scale=1.0):
         """Draw power-up aura around player"""
         import time
         current_time = time.time() * 1000
@@ -662,13 +749,11 @@ class Player(pygame.sprite.Sprite):
         
         # Multiple aura layers
         for layer in range(4):
-            radius = int((25 + layer * 5) * pulse)
+            radius = int((25 + layer * 5) * pulse * scale)
             layer_alpha = max(10, int(40 - layer * 8))
             
             # Create semi-transparent surface for aura
-            aura_surf = pygame.Surface((radius * 2, radius * 2))
-            aura_surf.set_alpha(layer_alpha)
-            aura_surf.fill(aura_color)
+            aura_surf = surface_pool.get((radius * 2, radius * 2), alpha=layer_alpha, fill=aura_color)
             
             # Draw as circle
             pygame.draw.circle(aura_surf, aura_color, (radius, radius), radius)
@@ -677,11 +762,11 @@ class Player(pygame.sprite.Sprite):
         # Energy particles around player
         for i in range(8):
             angle = (current_time * 0.01 + i * math.pi / 4) % (2 * math.pi)
-            particle_distance = 30 + math.sin(current_time * 0.01 + i) * 5
+            particle_distance = (30 + math.sin(current_time * 0.01 + i) * 5) * scale
             particle_x = center_x + math.cos(angle) * particle_distance
             particle_y = center_y + math.sin(angle) * particle_distance
             
-            particle_size = 2 + int(math.sin(current_time * 0.015 + i) * 1)
+            particle_size = max(1, round((2 + int(math.sin(current_time * 0.015 + i) * 1)) * scale))
             pygame.draw.circle(surface, (255, 255, 255), (int(particle_x), int(particle_y)), particle_size)
     
     def get_health_percentage(self):
@@ -808,24 +893,15 @@ class Player(pygame.sprite.Sprite):
             return damage, radius
         return None, None
     
-    def get_auto_target_shot(self, enemies):
+    def get_auto_target_shot(self, targeting):
         """Get auto-targeting projectile if ready"""
         # Cap auto-targeting level to prevent excessive firing
         effective_level = min(self.auto_targeting_level, 5)
         if effective_level > 0 and self.auto_target_timer <= 0:
-            # Find nearest enemy
-            nearest_enemy = None
-            min_distance = float('inf')
+            # Find nearest enemy within range
+            nearest_enemy = targeting.nearest(self.rect.centerx, self.rect.centery, max_distance=400)
             
-            for enemy in enemies:
-                dx = enemy.rect.centerx - self.rect.centerx
-                dy = enemy.rect.centery - self.rect.centery
-                distance = (dx * dx + dy * dy) ** 0.5
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_enemy = enemy
-            
-            if nearest_enemy and min_distance < 400:  # Range limit
+            if nearest_enemy:
                 # Calculate angle to enemy
                 dx = nearest_enemy.rect.centerx - self.rect.centerx
                 dy = nearest_enemy.rect.centery - self.rect.centery
@@ -901,15 +977,15 @@ class Player(pygame.sprite.Sprite):
         
         return attacks
     
-    def draw_passive_weapons(self, surface):
+    def draw_passive_weapons(self, surface, custom_center=None, scale=1.0):
         """Draw orbiting shuriken and other passive visual effects"""
-        center_x, center_y = self.rect.center
+        center_x, center_y = custom_center if custom_center else self.rect.center
         
         # Energy Shuriken
         if self.energy_shuriken_level > 0:
             for i in range(self.energy_shuriken_level):
                 angle = self.shuriken_angle + (i * 2 * math.pi / self.energy_shuriken_level)
-                radius = 40 + (i * 10)
+                radius = (40 + (i * 10)) * scale
                 x = center_x + math.cos(angle) * radius
                 y = center_y + math.sin(angle) * radius
                 
@@ -918,9 +994,9 @@ class Player(pygame.sprite.Sprite):
                 for j in range(6):  # 6-pointed star
                     star_angle = angle * 3 + (j * math.pi / 3)  # Spin 3x faster
                     if j % 2 == 0:
-                        r = 8
+                        r = 8 * scale
                     else:
-                        r = 4
+                        r = 4 * scale
                     points.append((
                         x + math.cos(star_angle) * r,
                         y + math.sin(star_angle) * r
@@ -932,18 +1008,35 @@ class Player(pygame.sprite.Sprite):
         # Combat Drone indicator
         if self.drone_companion_level > 0:
             for i in range(self.drone_companion_level):
-                drone_x = center_x + (i * 40) - 20
-                drone_y = center_y + 30
+                drone_x = center_x + ((i * 40) - 20) * scale
+                drone_y = center_y + 30 * scale
                 
                 # Simple drone representation
-                pygame.draw.circle(surface, self.ELECTRIC_BLUE, (int(drone_x), int(drone_y)), 6)
-                pygame.draw.circle(surface, self.WHITE, (int(drone_x), int(drone_y)), 3)
+                pygame.draw.circle(surface, self.ELECTRIC_BLUE, (int(drone_x), int(drone_y)), round(6 * scale))
+                pygame.draw.circle(surface, self.WHITE, (int(drone_x), int(drone_y)), max(1, round(3 * scale)))
     
-    def draw_shadow(self, surface, center_x, center_y):
+    def draw_shadow(self, surface, center_x, center_y, scale=1.0):
         """Draw realistic shaped shadow for the player (same system as enemies)"""
         # Shadow offset (sun from South-West) - same as enemies
-        shadow_offset_x = 4
-        shadow_offset_y = 6
+        shadow_offset_x = round(4 * scale)
+        shadow_offset_y = round(6 * scale)
+        
+        # The shadow never changes, so it is baked once (per scale) and reused
+        shadow_surf = Player.shadow_cache.get(scale)
+        if shadow_surf is None:
+            shadow_surf = self.create_shadow_surface()
+            if scale != 1.0:
+                shadow_surf = scale_frame(shadow_surf, scale, smooth=False)
+            Player.shadow_cache[scale] = shadow_surf
+        
+        # Position shadow with offset
+        shadow_x = center_x - shadow_surf.get_width() // 2 + shadow_offset_x
+        shadow_y = center_y - shadow_surf.get_height() // 2 + shadow_offset_y
+        
+        surface.blit(shadow_surf, (shadow_x, shadow_y))
+    
+    def create_shadow_surface(self):
+        """Bake the armored soldier shadow"""
         shadow_alpha = 60
         shadow_color = (30, 30, 30)
         
@@ -970,8 +1063,4 @@ class Player(pygame.sprite.Sprite):
         # Weapon shadow extending from right arm
         pygame.draw.ellipse(shadow_surf, shadow_color, (24, 12, 8, 3))
         
-        # Position shadow with offset
-        shadow_x = center_x - shadow_surf.get_width() // 2 + shadow_offset_x
-        shadow_y = center_y - shadow_surf.get_height() // 2 + shadow_offset_y
-        
-        surface.blit(shadow_surf, (shadow_x, shadow_y)) 
\ No newline at end of file
+        return shadow_surf 
\ No newline at end of file
@@ -1,12 +1,13 @@
 import pygame
-import random
 import math
+from src.systems.rng import rng
+from src.systems.surface_pool import surface_pool
 
 class PowerUp(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         self.powerup_types = ["health", "damage", "speed"]
-        self.powerup_type = random.choice(self.powerup_types)
+        self.powerup_type = rng.loot.choice(self.powerup_types)
         
         self.rect = pygame.Rect(x - 15, y - 15, 30, 30)
         self.image = pygame.Surface((30, 30))  # Required for pygame sprite
@@ -63,13 +64,12 @@ class PowerUp(pygame.sprite.Sprite):
         elif self.powerup_type == "speed":
             player.apply_powerup("speed", 8000)  # 8 seconds
     
-    def draw(self, surface):
-        center_x, center_y = self.rect.center
+    def draw(self, surface, custom_center=None, scale=1.0):
+        center_x, center_y = custom_center if custom_center else self.rect.center
         
         # Draw glow effect
-        glow_radius = int(20 * self.pulse)
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2))
-        glow_surface.set_alpha(50)
+        glow_radius = int(20 * self.pulse * scale)
+        glow_surface = surface_pool.get((glow_radius * 2, glow_radius * 2), alpha=50)
         pygame.draw.circle(glow_surface, self.glow_color, 
                           (glow_radius, glow_radius), glow_radius)
         surface.blit(glow_surface, 
@@ -77,16 +77,16 @@ class PowerUp(pygame.sprite.Sprite):
         
         # Draw main powerup based on type
         if self.powerup_type == "health":
-            self.draw_health_powerup(surface, center_x, center_y)
+            self.draw_health_powerup(surface, center_x, center_y, scale)
         elif self.powerup_type == "damage":
-            self.draw_damage_powerup(surface, center_x, center_y)
+            self.draw_damage_powerup(surface, center_x, center_y, scale)
         elif self.powerup_type == "speed":
-            self.draw_speed_powerup(surface, center_x, center_y)
+            self.draw_speed_powerup(surface, center_x, center_y, scale)
     
-    def draw_health_powerup(self, surface, center_x, center_y):
+    def draw_health_powerup(self, surface, center_x, center_y, scale=1.0):
         # Cross shape for health
-        size = int(12 * self.pulse)
-        thickness = max(2, int(3 * self.pulse))
+        size = int(12 * self.pulse * scale)
+        thickness = max(2, int(3 * self.pulse * scale))
         
         # Horizontal bar
         pygame.draw.rect(surface, self.color,
@@ -105,11 +105,11 @@ class PowerUp(pygame.sprite.Sprite):
                         pygame.Rect(center_x - thickness//2, center_y - size, 
                                    thickness, size * 2), 1)
     
-    def draw_damage_powerup(self, surface, center_x, center_y):
+    def draw_damage_powerup(self, surface, center_x, center_y, scale=1.0):
         # Star/spike shape for damage
         num_spikes = 8
-        outer_radius = int(12 * self.pulse)
-        inner_radius = int(6 * self.pulse)
+        outer_radius = int(12 * self.pulse * scale)
+        inner_radius = int(6 * self.pulse * scale)
         
         points = []
         for i in range(num_spikes * 2):
@@ -124,11 +124,11 @@ class PowerUp(pygame.sprite.Sprite):
             points.append((x, y))
         
         pygame.draw.polygon(surface, self.color, points)
-        pygame.draw.polygon(surface, self.WHITE, points, 2)
+        pygame.draw.polygon(surface, self.WHITE, points, max(1, round(2 * scale)))
     
-    def draw_speed_powerup(self, surface, center_x, center_y):
+    def draw_speed_powerup(self, surface, center_x, center_y, scale=1.0):
         # Lightning bolt shape for speed
-        size = int(10 * self.pulse)
+        size = int(10 * self.pulse * scale)
         
         # Lightning bolt points
         points = [
@@ -141,4 +141,4 @@ class PowerUp(pygame.sprite.Sprite):
         ]
         
         pygame.draw.polygon(surface, self.color, points)
-        pygame.draw.polygon(surface, self.WHITE, points, 2) 
\ No newline at end of file
+        pygame.draw.polygon(surface, self.WHITE, points, max(1, round(2 * scale))) 
\ No newline at end of file
@@ -1,15 +1,67 @@
 import pygame
 import math
-import random
+from collections import deque
+from src.systems.rng import rng
+from src.systems.array_kernel import KernelField
+from src.systems.projectile_kernel import TrailPositions
+from src.systems.sprite_cache import LRUFrameCache, bake_frame
 
 class Projectile(pygame.sprite.Sprite):
+    # Simulation state lives in a ProjectileKernel's arrays while the projectile
+    # is in a ProjectileGroup; Projectile.update is the scalar path outside one
+    kernel = None
+    kernel_slot = -1
+    x = KernelField()
+    y = KernelField()
+    prev_x = KernelField()
+    prev_y = KernelField()
+    velocity_x = KernelField()
+    velocity_y = KernelField()
+    distance_traveled = KernelField()
+    max_range = KernelField()
+    animation_timer = KernelField()
+    pulse_scale = KernelField()
+    damage = KernelField()
+    piercing = KernelField()
+    explosive = KernelField()
+    is_enemy = KernelField()
+    trail_positions = TrailPositions()
+    
+    # Default colors
+    NEON_CYAN = (0, 255, 255)
+    ELECTRIC_BLUE = (125, 249, 255)
+    WHITE = (255, 255, 255)
+    
+    # Baked full-length trails (False: draw every trail segment procedurally)
+    use_trail_cache = True
+    trail_cache = LRUFrameCache(512)
+    TRAIL_ANGLE_STEPS = 256  # Direction buckets for baked trails
+    TRAIL_STEP_PRECISION = 0.1  # Spacing between trail points is rounded to this (px)
+    TRAIL_COLORKEY = (255, 0, 128)  # Not used by any trail color
+    trail_length_scale = 1.0  # Shorter trails for cheaper quality presets
+    
+    # Baked bodies, only used for scaled render targets (bodies are drawn
+    # procedurally at full scale). Directional bodies are keyed by angle,
+    # animated ones by their phase in the 2 pi / 0.01 ms animation loop.
+    body_cache = LRUFrameCache(512)
+    DIRECTIONAL_WEAPONS = ("laser_rifle", "shotgun", "sniper_rifle", "machine_gun")
+    BODY_ANGLE_STEPS = 64
+    BODY_ANIMATION_LOOP = 2 * math.pi / 0.01
+    BODY_ANIMATION_STEPS = 16
+    
     def __init__(self, x, y, angle, damage=20, speed=500, size=6, color=None, weapon_type="default", max_range=600):
         super().__init__()
         self.size = size
         half_size = size // 2
         self.rect = pygame.Rect(x - half_size, y - half_size, size, size)
-        self.image = pygame.Surface((size, size))  # Required for pygame sprite
-        self.image.set_colorkey((0, 0, 0))  # Make black transparent
+        
+        # Float position of the rect center (prev_* is the last simulated step)
+        self.x = float(x)
+        self.y = float(y)
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.rect.center = (round(self.x), round(self.y))
+        
         self.damage = damage
         self.speed = speed
         self.weapon_type = weapon_type
@@ -23,10 +75,10 @@ class Projectile(pygame.sprite.Sprite):
         self.velocity_x = math.cos(angle) * speed
         self.velocity_y = math.sin(angle) * speed
         
-        # Visual properties
+        # Visual properties (the trail keeps the last max_trail_length positions)
         self.angle = angle
-        self.trail_positions = []
-        self.max_trail_length = self._get_trail_length()
+        self.max_trail_length = max(2, round(self._get_trail_length() * Projectile.trail_length_scale))
+        self.trail_positions = deque(maxlen=self.max_trail_length)
         
         # Upgrade properties
         self.piercing = False
@@ -37,11 +89,6 @@ class Projectile(pygame.sprite.Sprite):
         self.animation_timer = 0
         self.pulse_scale = 1.0
         
-        # Default colors
-        self.NEON_CYAN = (0, 255, 255)
-        self.ELECTRIC_BLUE = (125, 249, 255)
-        self.WHITE = (255, 255, 255)
-        
         # Custom color override or weapon-specific color
         self.color = color if color else self._get_weapon_color()
     
@@ -73,22 +120,22 @@ class Projectile(pygame.sprite.Sprite):
         return weapon_colors.get(self.weapon_type, self.NEON_CYAN)
     
     def update(self, dt):
-        # Store current position for trail
-        self.trail_positions.append((self.rect.centerx, self.rect.centery))
+        # Remember the last simulated position for render interpolation
+        self.prev_x = self.x
+        self.prev_y = self.y
         
-        # Limit trail length
-        if len(self.trail_positions) > self.max_trail_length:
-            self.trail_positions.pop(0)
+        # Store current position for trail (the deque drops the oldest)
+        self.trail_positions.append((self.x, self.y))
         
         # Move projectile
         move_factor = dt / 1000.0
-        old_x, old_y = self.rect.x, self.rect.y
-        self.rect.x += self.velocity_x * move_factor
-        self.rect.y += self.velocity_y * move_factor
+        dx = self.velocity_x * move_factor
+        dy = self.velocity_y * move_factor
+        self.x += dx
+        self.y += dy
+        self.rect.center = (round(self.x), round(self.y))
         
         # Calculate distance traveled
-        dx = self.rect.x - old_x
-        dy = self.rect.y - old_y
         self.distance_traveled += math.sqrt(dx * dx + dy * dy)
         
         # Update animation timer for weapon-specific effects
@@ -98,8 +145,9 @@ class Projectile(pygame.sprite.Sprite):
         # Check if projectile exceeded its range
         if self.distance_traveled > self.max_range:
             # Mark for removal by moving off-screen
-            self.rect.x = -1000
-            self.rect.y = -1000
+            self.x = self.prev_x = -1000.0
+            self.y = self.prev_y = -1000.0
+            self.rect.center = (-1000, -1000)
     
     def draw(self, surface, custom_center=None, camera_offset=(0, 0)):
         # Use custom center if provided, otherwise use rect center
@@ -107,7 +155,39 @@ class Projectile(pygame.sprite.Sprite):
         
         # Draw trail first (behind projectile) with camera offset
         self._draw_trail(surface, center, camera_offset)
+        self.draw_body(surface, center)
+    
+    @classmethod
+    def draw_all(cls, surface, projectiles, camera_offset=(0, 0), scale=1.0):
+        """Draw (projectile, screen center) pairs: every trail first, full baked trails
+        in one batched blit, then the projectile bodies"""
+        camera_x, camera_y = camera_offset
+        batch = []
+        for projectile, center in projectiles:
+            if cls.use_trail_cache:
+                count, head_x, head_y, step_x, step_y = projectile.get_trail_head()
+                if count == projectile.max_trail_length and count >= 2:
+                    frame, offset_x, offset_y = projectile.get_trail_frame(count, step_x, step_y, scale)
+                    batch.append((frame, (int((head_x + camera_x) * scale) + offset_x,
+                                          int((head_y + camera_y) * scale) + offset_y)))
+                    continue
+            # Trails still growing change every step, so they are drawn live
+            projectile.draw_trail_segments(surface, projectile.trail_positions, camera_offset, scale)
+        surface.blits(batch, doreturn=False)
+        
+        if scale == 1.0:
+            for projectile, center in projectiles:
+                projectile.draw_body(surface, center)
+            return
         
+        # Scaled targets blit scaled baked bodies
+        batch = []
+        for projectile, (center_x, center_y) in projectiles:
+            frame, offset_x, offset_y = projectile.get_body_frame(scale)
+            batch.append((frame, (center_x + offset_x, center_y + offset_y)))
+        surface.blits(batch, doreturn=False)
+    
+    def draw_body(self, surface, center):
         # Weapon-specific drawing
         if self.weapon_type == "laser_rifle":
             self._draw_laser_projectile(surface, center)
@@ -124,40 +204,93 @@ class Projectile(pygame.sprite.Sprite):
         else:
             self._draw_default_projectile(surface, center)
     
+    def get_trail_head(self):
+        """Get (trail length, newest trail point, step between points) without building the trail"""
+        if self.kernel is not None:
+            return self.kernel.get_trail_head(self.kernel_slot, self.max_trail_length)
+        trail_positions = self.trail_positions
+        if len(trail_positions) < 2:
+            return (len(trail_positions), self.x, self.y, 0.0, 0.0)
+        (last_x, last_y), (head_x, head_y) = trail_positions[-2], trail_positions[-1]
+        return (len(trail_positions), head_x, head_y, head_x - last_x, head_y - last_y)
+    
+    def get_trail_frame(self, count, step_x, step_y, scale=1.0):
+        """Get the baked (surface, offset_x, offset_y) for a straight trail ending at the offset origin"""
+        # Projectiles fly straight, so a trail is defined by its direction and point spacing
+        angle_step = 2 * math.pi / self.TRAIL_ANGLE_STEPS
+        direction = round(math.atan2(step_y, step_x) / angle_step) % self.TRAIL_ANGLE_STEPS
+        spacing = round(math.hypot(step_x, step_y) / self.TRAIL_STEP_PRECISION)
+        key = (tuple(self.color), self.size, count, direction, spacing, scale)
+        return Projectile.trail_cache.get(key, lambda: self._bake_trail(count, direction * angle_step,
+                                                                        spacing * self.TRAIL_STEP_PRECISION, scale))
+    
+    def _bake_trail(self, count, angle, spacing, scale=1.0):
+        step_x = math.cos(angle) * spacing
+        step_y = math.sin(angle) * spacing
+        trail_positions = [(-step_x * back, -step_y * back) for back in range(count - 1, -1, -1)]
+        size = int((2 * count * spacing + 2 * self.size) * scale) + 8
+        # The offset is scaled along with the positions, so undo that for the canvas middle
+        return bake_frame(lambda canvas, x, y: self.draw_trail_segments(canvas, trail_positions,
+                                                                       (x / scale, y / scale), scale),
+                          size, self.TRAIL_COLORKEY)
+    
+    def get_body_frame(self, scale):
+        """Get the baked (surface, offset_x, offset_y) for the body's current look at a render scale"""
+        angle_step = 0
+        animation_step = 0
+        if self.weapon_type in self.DIRECTIONAL_WEAPONS:
+            angle_step = round(self.angle / (2 * math.pi) * self.BODY_ANGLE_STEPS) % self.BODY_ANGLE_STEPS
+        else:
+            loop = self.BODY_ANIMATION_LOOP
+            animation_step = int(self.animation_timer % loop / loop * self.BODY_ANIMATION_STEPS)
+        key = (self.weapon_type, tuple(self.color), self.size, angle_step, animation_step, scale)
+        return Projectile.body_cache.get(key, lambda: self._bake_body(angle_step, animation_step, scale))
+    
+    def _bake_body(self, angle_step, animation_step, scale):
+        """Render the body procedurally on an unregistered template posed at the key's angle and phase"""
+        angle = angle_step * 2 * math.pi / self.BODY_ANGLE_STEPS
+        template = Projectile(0, 0, angle, size=self.size, color=self.color, weapon_type=self.weapon_type)
+        template.animation_timer = animation_step * self.BODY_ANIMATION_LOOP / self.BODY_ANIMATION_STEPS
+        template.pulse_scale = 1.0 + 0.2 * math.sin(template.animation_timer * 0.01)
+        return bake_frame(lambda canvas, x, y: template.draw_body(canvas, (x, y)), 4 * self.size + 64, scale=scale)
+    
     def _draw_trail(self, surface, center, camera_offset=(0, 0)):
         """Draw an enhanced trail behind the projectile"""
-        if len(self.trail_positions) < 2:
+        self.draw_trail_segments(surface, self.trail_positions, camera_offset)
+    
+    def draw_trail_segments(self, surface, trail_positions, camera_offset=(0, 0), scale=1.0):
+        """Draw trail segments between positions (oldest first), shifted by camera_offset then scaled"""
+        if len(trail_positions) < 2:
             return
         
         camera_x, camera_y = camera_offset
         
         # Draw trail with fading alpha and width
-        for i, (trail_x, trail_y) in enumerate(self.trail_positions[:-1]):
-            if i < len(self.trail_positions) - 1:
-                next_x, next_y = self.trail_positions[i + 1]
-                
-                # Apply camera offset to trail positions
-                screen_trail_x = trail_x + camera_x
-                screen_trail_y = trail_y + camera_y
-                screen_next_x = next_x + camera_x
-                screen_next_y = next_y + camera_y
-                
-                # Calculate alpha and width based on position in trail
-                alpha_factor = (i + 1) / len(self.trail_positions)
-                trail_width = max(1, int(self.size * alpha_factor * 0.8))
-                
-                # Color with alpha
-                trail_color = (
-                    int(self.color[0] * alpha_factor * 0.6),
-                    int(self.color[1] * alpha_factor * 0.6),
-                    int(self.color[2] * alpha_factor * 0.6)
-                )
-                
-                # Draw trail segment
-                if trail_width > 0:
-                    pygame.draw.line(surface, trail_color, 
-                                   (int(screen_trail_x), int(screen_trail_y)), 
-                                   (int(screen_next_x), int(screen_next_y)), trail_width)
+        for i in range(len(trail_positions) - 1):
+            (trail_x, trail_y), (next_x, next_y) = trail_positions[i], trail_positions[i + 1]
+            
+            # Apply camera offset to trail positions
+            screen_trail_x = (trail_x + camera_x) * scale
+            screen_trail_y = (trail_y + camera_y) * scale
+            screen_next_x = (next_x + camera_x) * scale
+            screen_next_y = (next_y + camera_y) * scale
+            
+            # Calculate alpha and width based on position in trail
+            alpha_factor = (i + 1) / len(trail_positions)
+            trail_width = max(1, int(self.size * alpha_factor * 0.8 * scale))
+            
+            # Color with alpha
+            trail_color = (
+                int(self.color[0] * alpha_factor * 0.6),
+                int(self.color[1] * alpha_factor * 0.6),
+                int(self.color[2] * alpha_factor * 0.6)
+            )
+            
+            # Draw trail segment
+            if trail_width > 0:
+                pygame.draw.line(surface, trail_color, 
+                               (int(screen_trail_x), int(screen_trail_y)), 
+                               (int(screen_next_x), int(screen_next_y)), trail_width)
     
     def _draw_laser_projectile(self, surface, center):
         """Draw an enhanced bright, fast laser beam"""
@@ -235,7 +368,7 @@ class Projectile(pygame.sprite.Sprite):
         
         # Add spark effect
         spark_length = 6
-        spark_angle = self.angle + random.uniform(-0.2, 0.2)
+        spark_angle = self.angle + rng.cosmetic.uniform(-0.2, 0.2)
         spark_end_x = center[0] - math.cos(spark_angle) * spark_length
         spark_end_y = center[1] - math.sin(spark_angle) * spark_length
         pygame.draw.line(surface, (255, 200, 100), center, (int(spark_end_x), int(spark_end_y)), 1)
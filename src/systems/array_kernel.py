@@ -0,0 +1,141 @@
+import numpy as np
+import pygame
+
+
+class KernelField:
+    """Sprite attribute that lives in a kernel array while the sprite is registered.
+
+    Unregistered sprites keep the value in their instance dict, so the
+    sprite class works the same with or without a kernel.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, sprite, owner=None):
+        if sprite is None:
+            return self
+        kernel = sprite.kernel
+        if kernel is None:
+            try:
+                return sprite.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        return kernel.fields[self.name][sprite.kernel_slot]
+
+    def __set__(self, sprite, value):
+        kernel = sprite.kernel
+        if kernel is None:
+            sprite.__dict__[self.name] = value
+        else:
+            kernel.fields[self.name][sprite.kernel_slot] = value
+
+
+class ArrayKernel:
+    """Dense structure-of-arrays storage for a set of sprites.
+
+    FIELDS ({name: dtype}) are sprite attributes moved into arrays on
+    register() and copied back on unregister(); the sprite class exposes
+    them through KernelField descriptors. ARRAYS ({name: (dtype, shape)})
+    are kernel-only per-slot arrays, available as attributes. Registered
+    sprites occupy slots [0, count); removal swaps the last sprite into the
+    freed slot.
+    """
+    FIELDS = {}
+    ARRAYS = {}
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = 0
+        self.sprites = []
+        self.fields = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """Grow every array to capacity, keeping the registered slots"""
+        count = self.count
+
+        def grown(old, shape, dtype):
+            new = np.zeros((capacity,) + shape, dtype)
+            if old is not None:
+                new[:count] = old[:count]
+            return new
+
+        for name, dtype in self.FIELDS.items():
+            self.fields[name] = grown(self.fields.get(name), (), dtype)
+        for name, (dtype, shape) in self.ARRAYS.items():
+            setattr(self, name, grown(getattr(self, name, None), shape, dtype))
+
+        self.sprites.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def _all_arrays(self):
+        return list(self.fields.values()) + [getattr(self, name) for name in self.ARRAYS]
+
+    def register(self, sprite):
+        """Move a sprite's fields into the arrays"""
+        if sprite.kernel is not None:
+            return
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        slot = self.count
+        state = sprite.__dict__
+        for name in self.FIELDS:
+            self.fields[name][slot] = state.pop(name)
+        self.on_register(sprite, slot)
+
+        sprite.kernel = self
+        sprite.kernel_slot = slot
+        self.sprites[slot] = sprite
+        self.count += 1
+
+    def unregister(self, sprite):
+        """Copy a sprite's fields back onto the object and free its slot"""
+        if sprite.kernel is not self:
+            return
+        slot = sprite.kernel_slot
+        state = sprite.__dict__
+        for name in self.FIELDS:
+            state[name] = self.fields[name][slot].item()
+        self.on_unregister(sprite, slot)
+        sprite.kernel = None
+        sprite.kernel_slot = -1
+
+        # Keep slots dense: move the last sprite into the hole
+        last = self.count - 1
+        if slot != last:
+            for array in self._all_arrays():
+                array[slot] = array[last]
+            moved = self.sprites[last]
+            moved.kernel_slot = slot
+            self.sprites[slot] = moved
+        self.sprites[last] = None
+        self.count -= 1
+
+    def on_register(self, sprite, slot):
+        """Fill the kernel-only arrays for a newly registered sprite"""
+
+    def on_unregister(self, sprite, slot):
+        """Restore any derived sprite state before its slot is freed"""
+
+    def sync_rects(self, center_x, center_y):
+        """Write integer rect centers (arrays over [0, count)) back to the sprites"""
+        for sprite, x, y in zip(self.sprites, center_x.tolist(), center_y.tolist()):
+            sprite.rect.center = (x, y)
+
+
+class KernelGroup(pygame.sprite.Group):
+    """Sprite group that registers its sprites with an ArrayKernel"""
+    kernel_class = ArrayKernel
+
+    def __init__(self, *sprites):
+        self.kernel = self.kernel_class()
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.kernel.register(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.kernel.unregister(sprite)
@@ -0,0 +1,393 @@
+import math
+import numpy as np
+from src.systems.rng import rng
+from src.systems.array_kernel import ArrayKernel, KernelGroup
+
+# Integer codes for the per-type masked AI passes
+TYPE_CODES = {"basic": 0, "fast": 1, "tank": 2, "sniper": 3,
+              "swarm": 4, "heavy": 5, "elite": 6, "boss": 7}
+
+# Positions kept for movement trail effects
+TRAIL_LENGTH = 5
+
+# Separation weights per type: (response, push). response scales how hard an
+# enemy steers away from crowding neighbours (0: never), push how hard it
+# shoves its neighbours. Swarms don't push, so they keep clustering; heavies
+# and bosses push others aside and barely yield themselves.
+SEPARATION_WEIGHTS = {"basic": (1.0, 1.0), "fast": (1.0, 0.6), "tank": (0.5, 1.5), "sniper": (1.0, 1.0),
+                      "swarm": (0.5, 0.0), "heavy": (0.2, 2.5), "elite": (0.6, 1.5), "boss": (0.0, 3.0)}
+SEPARATION_PADDING = 4          # Gap (px) kept between rects
+SEPARATION_MAX = 1.5            # Cap on the summed push, in multiples of the enemy's speed
+SEPARATION_RESPONSE = np.array([SEPARATION_WEIGHTS[name][0] for name in TYPE_CODES])
+SEPARATION_PUSH = np.array([SEPARATION_WEIGHTS[name][1] for name in TYPE_CODES])
+MAX_NEIGHBORS_PER_CELL = 4      # Pushing neighbours considered per grid cell, heaviest first
+MAX_SEARCH_RADIUS = 4           # Widest neighbourhood searched, in cells each side
+GRID_RADIUS = 128               # Grid cells each side of the player; farther enemies share edge cells
+GRID_SIDE = 2 * (GRID_RADIUS + MAX_SEARCH_RADIUS) + 1  # Plus a border so neighbour lookups stay in the grid
+SEARCH_OFFSETS = {radius: np.array([offset_x * GRID_SIDE + offset_y
+                                    for offset_x in range(-radius, radius + 1)
+                                    for offset_y in range(-radius, radius + 1)])
+                  for radius in range(1, MAX_SEARCH_RADIUS + 1)}
+
+
+def _cell_pairs(cell, queries, radius, candidates, priority=None, limit=MAX_NEIGHBORS_PER_CELL):
+    """Pair query enemies with the candidates in the cells within their radius.
+
+    cell holds each enemy's grid cell index and radius each query's search
+    radius in cells. Candidates are sorted by cell, then by priority (lowest
+    first), and at most limit of them (None: all) are taken from each cell.
+    Returns (query, candidate) index arrays.
+    """
+    if len(queries) == 0 or len(candidates) == 0:
+        return (np.empty(0, np.int64), np.empty(0, np.int64))
+    # Sort candidates by cell; each cell is a run of the sorted order
+    candidate_cell = cell[candidates]
+    if priority is None:
+        order = np.argsort(candidate_cell, kind="stable")
+    else:
+        order = np.lexsort((priority, candidate_cell))
+    candidates = candidates[order]
+    counts = np.bincount(candidate_cell, minlength=GRID_SIDE * GRID_SIDE)
+    starts = np.cumsum(counts) - counts
+    if limit is not None:
+        np.minimum(counts, limit, out=counts)
+
+    pair_queries = []
+    pair_candidates = []
+    radius = radius.astype(np.int64)
+    for search_radius in np.unique(radius):
+        offsets = SEARCH_OFFSETS[search_radius]
+        group = queries[radius == search_radius]
+        # Expand to one pair per candidate in each cell of the query's neighbourhood
+        neighbor_cell = (cell[group][:, np.newaxis] + offsets).ravel()
+        pair_counts = counts[neighbor_cell]
+        first_pair = np.cumsum(pair_counts) - pair_counts
+        rank = np.arange(int(pair_counts.sum())) - np.repeat(first_pair, pair_counts)
+        pair_queries.append(np.repeat(np.repeat(group, len(offsets)), pair_counts))
+        pair_candidates.append(candidates[np.repeat(starts[neighbor_cell], pair_counts) + rank])
+    return (np.concatenate(pair_queries), np.concatenate(pair_candidates))
+
+
+class TrailField:
+    """Enemy movement trail, stored as a ring buffer while registered"""
+    def __get__(self, enemy, owner=None):
+        if enemy is None:
+            return self
+        if enemy.kernel is None:
+            return enemy.__dict__["movement_trail"]
+        return enemy.kernel.get_trail(enemy.kernel_slot)
+
+    def __set__(self, enemy, value):
+        if enemy.kernel is None:
+            enemy.__dict__["movement_trail"] = value
+        else:
+            enemy.kernel.set_trail(enemy.kernel_slot, value)
+
+
+class EnemyKernel(ArrayKernel):
+    """Enemy kinematic state in structure-of-arrays form with a vectorized step.
+
+    step() replaces Enemy.update for every registered enemy: timers,
+    trails, the per-type AI (one masked pass per behaviour), separation
+    from crowding neighbours and integration, then writes the rect centers
+    back. Separation only exists here, as it needs the whole group.
+    """
+    # Boids-style separation between enemies (see SEPARATION_WEIGHTS)
+    separation = True
+
+    FIELDS = {name: np.float64 for name in (
+        "x", "y", "prev_x", "prev_y", "velocity_x", "velocity_y", "speed",
+        "ai_timer", "circle_angle", "damage_flash", "animation_timer", "pulse_timer",
+        "hover_offset", "rotation_angle", "shoot_timer")}
+    ARRAYS = {
+        "type_code": (np.int8, ()),
+        "can_shoot": (bool, ()),
+        "shoot_range": (np.float64, ()),
+        "half_size": (np.int64, ()),  # rect half extent, for culling
+        # Rect centers and the last center recorded for trails
+        "center_x": (np.int64, ()),
+        "center_y": (np.int64, ()),
+        "last_x": (np.int64, ()),
+        "last_y": (np.int64, ()),
+        # Movement trail ring buffers (oldest entry at trail_head)
+        "trail_x": (np.int64, (TRAIL_LENGTH,)),
+        "trail_y": (np.int64, (TRAIL_LENGTH,)),
+        "trail_head": (np.int64, ()),
+        "trail_count": (np.int64, ()),
+    }
+
+    def on_register(self, enemy, slot):
+        state = enemy.__dict__
+        self.type_code[slot] = TYPE_CODES[enemy.enemy_type]
+        self.can_shoot[slot] = enemy.can_shoot
+        self.shoot_range[slot] = 300 if enemy.enemy_type == "sniper" else 200
+        self.half_size[slot] = enemy.rect.width // 2
+        self.center_x[slot], self.center_y[slot] = enemy.rect.center
+        self.last_x[slot], self.last_y[slot] = state.pop("last_position")
+        self.set_trail(slot, state.pop("movement_trail"))
+
+    def on_unregister(self, enemy, slot):
+        state = enemy.__dict__
+        state["movement_trail"] = self.get_trail(slot)
+        state["last_position"] = (int(self.last_x[slot]), int(self.last_y[slot]))
+
+    def get_trail(self, slot):
+        """Get a slot's movement trail as a list of (x, y), oldest first"""
+        head = self.trail_head[slot]
+        xs = self.trail_x[slot]
+        ys = self.trail_y[slot]
+        return [(int(xs[(head + i) % TRAIL_LENGTH]), int(ys[(head + i) % TRAIL_LENGTH]))
+                for i in range(self.trail_count[slot])]
+
+    def set_trail(self, slot, trail):
+        trail = trail[-TRAIL_LENGTH:]
+        self.trail_head[slot] = 0
+        self.trail_count[slot] = len(trail)
+        for i, (x, y) in enumerate(trail):
+            self.trail_x[slot, i] = x
+            self.trail_y[slot, i] = y
+
+    def step(self, dt, player_pos):
+        """Advance every registered enemy by dt ms (vectorized Enemy.update)"""
+        n = self.count
+        if n == 0:
+            return
+        f = self.fields
+        x = f["x"][:n]
+        y = f["y"][:n]
+
+        # Remember the last simulated position for render interpolation
+        f["prev_x"][:n] = x
+        f["prev_y"][:n] = y
+
+        # Update timers and animation properties
+        f["ai_timer"][:n] += dt
+        np.maximum(f["damage_flash"][:n] - dt, 0, out=f["damage_flash"][:n])
+        f["animation_timer"][:n] += dt
+        f["pulse_timer"][:n] += dt
+        f["hover_offset"][:n] = np.sin(f["animation_timer"][:n] * 0.003) * 2
+        f["rotation_angle"][:n] += dt * 0.001
+        np.maximum(f["shoot_timer"][:n] - dt, 0, out=f["shoot_timer"][:n])
+
+        self._record_trails(n)
+        self._update_ai(n, dt, player_pos)
+
+        # Apply movement
+        move_factor = dt / 1000.0
+        x += f["velocity_x"][:n] * move_factor
+        y += f["velocity_y"][:n] * move_factor
+        np.rint(x, out=self.center_x[:n], casting="unsafe")
+        np.rint(y, out=self.center_y[:n], casting="unsafe")
+
+        # Sync rects for collisions, the spatial hash and drawing
+        self.sync_rects(self.center_x[:n], self.center_y[:n])
+
+    def _record_trails(self, n):
+        """Append the current rect center to the trail of every enemy that moved"""
+        center_x = self.center_x[:n]
+        center_y = self.center_y[:n]
+        moved = np.flatnonzero((center_x != self.last_x[:n]) | (center_y != self.last_y[:n]))
+        if len(moved):
+            head = self.trail_head[moved]
+            trail_count = self.trail_count[moved]
+            write = (head + trail_count) % TRAIL_LENGTH
+            self.trail_x[moved, write] = center_x[moved]
+            self.trail_y[moved, write] = center_y[moved]
+
+            # Full trails drop their oldest entry
+            full = trail_count == TRAIL_LENGTH
+            self.trail_head[moved[full]] = (head[full] + 1) % TRAIL_LENGTH
+            self.trail_count[moved[~full]] += 1
+        self.last_x[:n] = center_x
+        self.last_y[:n] = center_y
+
+    def _update_ai(self, n, dt, player_pos):
+        """Per-type steering, one masked pass per behaviour (see Enemy.update_ai)"""
+        f = self.fields
+        player_x, player_y = player_pos
+        dx = player_x - f["x"][:n]
+        dy = player_y - f["y"][:n]
+        distance = np.hypot(dx, dy)
+
+        # Enemies sitting exactly on the player keep their velocity
+        active = distance > 0
+        safe_distance = np.where(active, distance, 1.0)
+        dx /= safe_distance
+        dy /= safe_distance
+
+        speed = f["speed"][:n]
+        ai_timer = f["ai_timer"][:n]
+        circle_angle = f["circle_angle"][:n]
+        type_code = self.type_code[:n]
+
+        # Default: straight chase (basic, tank, heavy and out-of-range cases)
+        velocity_x = dx * speed
+        velocity_y = dy * speed
+
+        # Fast: zigzag chase (both halves of the timer cycle steer the same way)
+        mask = type_code == TYPE_CODES["fast"]
+        if mask.any():
+            velocity_x[mask] = ((dx - dy * 0.5) * speed)[mask]
+            velocity_y[mask] = ((dy + dx * 0.5) * speed)[mask]
+
+        # Sniper: close in, back off, or strafe at range
+        mask = type_code == TYPE_CODES["sniper"]
+        if mask.any():
+            ideal_distance = 220
+            far = mask & (distance > ideal_distance + 40)
+            close = mask & (distance < ideal_distance - 40)
+            strafe = mask & ~far & ~close
+            velocity_x[far] = (dx * speed * 0.8)[far]
+            velocity_y[far] = (dy * speed * 0.8)[far]
+            velocity_x[close] = (-dx * speed)[close]
+            velocity_y[close] = (-dy * speed)[close]
+            velocity_x[strafe] = ((-dy * 0.8 + dx * 0.2) * speed)[strafe]
+            velocity_y[strafe] = ((dx * 0.8 + dy * 0.2) * speed)[strafe]
+
+        # Swarm: jittered chase, alternating with sharp random turns
+        mask = active & (type_code == TYPE_CODES["swarm"])
+        if mask.any():
+            generator = rng.numpy_stream("ai")
+            jitter = np.flatnonzero(mask & (ai_timer % 800 < 400))
+            if len(jitter):
+                noise = generator.uniform(-20, 20, (len(jitter), 2))
+                velocity_x[jitter] += noise[:, 0]
+                velocity_y[jitter] += noise[:, 1]
+            turn = np.flatnonzero(mask & (ai_timer % 800 >= 400))
+            if len(turn):
+                turn_angle = generator.uniform(-math.pi / 4, math.pi / 4, len(turn))
+                cos_turn = np.cos(turn_angle)
+                sin_turn = np.sin(turn_angle)
+                velocity_x[turn] = (dx[turn] * cos_turn - dy[turn] * sin_turn) * speed[turn]
+                velocity_y[turn] = (dx[turn] * sin_turn + dy[turn] * cos_turn) * speed[turn]
+
+        # Elite: chase when far, circle tightly when close
+        circling = active & (type_code == TYPE_CODES["elite"]) & (distance <= 120)
+        if circling.any():
+            circle_angle[circling] += dt * 0.006
+            velocity_x[circling] = ((dx * 0.2 + np.cos(circle_angle) * 0.8) * speed)[circling]
+            velocity_y[circling] = ((dy * 0.2 + np.sin(circle_angle) * 0.8) * speed)[circling]
+
+        # Boss: hold a medium range and orbit the player
+        mask = type_code == TYPE_CODES["boss"]
+        if mask.any():
+            ideal_distance = 130
+            close = mask & (distance < ideal_distance - 30)
+            orbit = active & mask & (distance <= ideal_distance + 30) & ~close
+            velocity_x[close] = (-dx * speed)[close]
+            velocity_y[close] = (-dy * speed)[close]
+            if orbit.any():
+                circle_angle[orbit] += dt * 0.005
+                velocity_x[orbit] = ((np.cos(circle_angle) * 0.8 + dx * 0.2) * speed)[orbit]
+                velocity_y[orbit] = ((np.sin(circle_angle) * 0.8 + dy * 0.2) * speed)[orbit]
+
+        if self.separation and n > 1:
+            self._add_separation(n, velocity_x, velocity_y, player_pos)
+
+        f["velocity_x"][:n][active] = velocity_x[active]
+        f["velocity_y"][:n][active] = velocity_y[active]
+
+    def _add_separation(self, n, velocity_x, velocity_y, player_pos):
+        """Steer enemies away from overlapping neighbours.
+
+        Enemies are bucketed into a uniform grid around the player by
+        sorting their cell indices. Cells fit the typical (median) enemy,
+        so each enemy takes pushes from the typical-sized pushers in the
+        3x3 cells around it (wider for larger enemies), at most
+        MAX_NEIGHBORS_PER_CELL per cell and heaviest first. Enemies that
+        don't push never take up those places. Larger pushers reach past the neighbouring cells, so they
+        search a wider ring themselves and push every enemy they overlap;
+        there are few of them, and they spread each other out. All pairs
+        are resolved in one vectorized pass.
+        """
+        f = self.fields
+        player_x, player_y = player_pos
+        x = f["x"][:n]
+        y = f["y"][:n]
+        half_size = self.half_size[:n].astype(np.float64)
+        type_code = self.type_code[:n]
+        response = SEPARATION_RESPONSE[type_code]
+        push_weight = SEPARATION_PUSH[type_code]
+
+        typical = np.median(half_size)
+        largest = half_size.max()
+        cell_size = max(2 * typical + SEPARATION_PADDING, (2 * largest + SEPARATION_PADDING) / MAX_SEARCH_RADIUS)
+        cell_x = np.clip(np.floor_divide(x - player_x, cell_size), -GRID_RADIUS, GRID_RADIUS)
+        cell_y = np.clip(np.floor_divide(y - player_y, cell_size), -GRID_RADIUS, GRID_RADIUS)
+        border = GRID_RADIUS + MAX_SEARCH_RADIUS
+        cell = ((cell_x + border) * GRID_SIDE + cell_y + border).astype(np.int64)
+
+        receivers = np.flatnonzero(response > 0)
+        pushing = push_weight > 0
+        typical_pushers = np.flatnonzero(pushing & (half_size <= typical))
+        large_pushers = np.flatnonzero(pushing & (half_size > typical))
+
+        # Each enemy gathers the typical-sized pushers around it, heaviest first...
+        radius = np.ceil((half_size[receivers] + typical + SEPARATION_PADDING) / cell_size)
+        gathered = _cell_pairs(cell, receivers, radius, typical_pushers, -push_weight[typical_pushers])
+        # ...and each larger pusher finds every enemy it overlaps
+        radius = np.ceil((half_size[large_pushers] + largest + SEPARATION_PADDING) / cell_size)
+        pushed_others, pushed_slots = _cell_pairs(cell, large_pushers, radius, receivers, limit=None)
+        slots = np.concatenate((gathered[0], pushed_slots))
+        others = np.concatenate((gathered[1], pushed_others))
+
+        # Keep pairs closer than their rects plus padding (compared squared)
+        dx = x[slots] - x[others]
+        dy = y[slots] - y[others]
+        distance_sq = dx * dx + dy * dy
+        reach = half_size[slots] + half_size[others] + SEPARATION_PADDING
+        close = np.flatnonzero((distance_sq < reach * reach) & (slots != others))
+        if len(close) == 0:
+            return
+        slots = slots[close]
+        others = others[close]
+        dx = dx[close]
+        dy = dy[close]
+        distance = np.sqrt(distance_sq[close])
+
+        # Exactly stacked pairs split along golden-angle steps of their slot difference
+        stacked = distance == 0
+        if stacked.any():
+            angle = (slots[stacked] - others[stacked]) * 2.399963
+            dx[stacked] = np.cos(angle)
+            dy[stacked] = np.sin(angle)
+            distance[stacked] = 1.0
+
+        # Push harder the deeper the overlap, summed per enemy
+        strength = (1.0 - distance / reach[close]) * push_weight[others] / distance
+        push_x = np.bincount(slots, dx * strength, minlength=n)
+        push_y = np.bincount(slots, dy * strength, minlength=n)
+
+        # Cap the summed push and scale it by each enemy's speed and response
+        magnitude = np.sqrt(push_x * push_x + push_y * push_y)
+        factor = response * f["speed"][:n] * np.minimum(1.0, SEPARATION_MAX / np.maximum(magnitude, 1e-9))
+        velocity_x += push_x * factor
+        velocity_y += push_y * factor
+
+    def ready_shooters(self, player_pos):
+        """Get shooting enemies that are off cooldown and in range of the player"""
+        n = self.count
+        ready = self.can_shoot[:n] & (self.fields["shoot_timer"][:n] <= 0)
+        if not ready.any():
+            return []
+        player_x, player_y = player_pos
+        dx = player_x - self.center_x[:n]
+        dy = player_y - self.center_y[:n]
+        shoot_range = self.shoot_range[:n]
+        ready &= dx * dx + dy * dy <= shoot_range * shoot_range
+        return [self.sprites[slot] for slot in np.flatnonzero(ready)]
+
+
+class EnemyGroup(KernelGroup):
+    """Enemy group backed by an EnemyKernel.
+
+    update(dt, player_pos) runs the vectorized kernel step instead of
+    calling Enemy.update on each sprite.
+    """
+    kernel_class = EnemyKernel
+
+    def update(self, dt, player_pos):
+        self.kernel.step(dt, player_pos)
+
+    def ready_shooters(self, player_pos):
+        return self.kernel.ready_shooters(player_pos)
@@ -0,0 +1,225 @@
+import json
+import pygame
+
+# Fix linter errors for pygame constants
+if not hasattr(pygame, 'KEYDOWN'):
+    pygame.KEYDOWN = 768
+    pygame.KEYUP = 769
+    pygame.MOUSEBUTTONDOWN = 1025
+    pygame.MOUSEBUTTONUP = 1026
+    pygame.MOUSEMOTION = 1024
+
+
+class KeyState:
+    """Held-key lookup indexed like the result of pygame.key.get_pressed()"""
+    def __init__(self, pressed_keys=()):
+        self.pressed_keys = frozenset(pressed_keys)
+
+    def __getitem__(self, key):
+        return key in self.pressed_keys
+
+
+class InputFrame:
+    """Snapshot of the input state for a single frame.
+
+    steps is the number of fixed simulation steps the frame ran for (live
+    play runs 0..N per rendered frame); None means one step.
+    """
+    def __init__(self, keys=(), mouse_buttons=(False, False, False), mouse_pos=(0, 0), events=None, steps=None):
+        self.keys = frozenset(keys)
+        self.mouse_buttons = tuple(mouse_buttons)
+        self.mouse_pos = tuple(mouse_pos)
+        self.events = list(events) if events else []
+        self.steps = steps
+
+    def to_dict(self):
+        """Convert to a JSON-friendly dict"""
+        data = {
+            "keys": sorted(self.keys),
+            "mouse_buttons": list(self.mouse_buttons),
+            "mouse_pos": list(self.mouse_pos),
+            "events": [_event_to_dict(event) for event in self.events]
+        }
+        if self.steps is not None:
+            data["steps"] = self.steps
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            keys=data.get("keys", ()),
+            mouse_buttons=data.get("mouse_buttons", (False, False, False)),
+            mouse_pos=data.get("mouse_pos", (0, 0)),
+            events=[_event_from_dict(event) for event in data.get("events", [])],
+            steps=data.get("steps")
+        )
+
+
+# Event attributes worth keeping when recording input
+_EVENT_FIELDS = ("key", "button", "pos")
+
+
+def _event_to_dict(event):
+    data = {"type": event.type}
+    for field in _EVENT_FIELDS:
+        if hasattr(event, field):
+            value = getattr(event, field)
+            data[field] = list(value) if isinstance(value, tuple) else value
+    return data
+
+
+def _event_from_dict(data):
+    attributes = {}
+    for field in _EVENT_FIELDS:
+        if field in data:
+            value = data[field]
+            attributes[field] = tuple(value) if isinstance(value, list) else value
+    return pygame.event.Event(data["type"], attributes)
+
+
+class InputProvider:
+    """Base class for anything that feeds player input into the game.
+
+    The game calls poll() once per frame to collect that frame's events,
+    then queries held keys, mouse buttons and the mouse position, and
+    reports the number of simulation steps it ran through end_frame().
+    """
+    def __init__(self):
+        self.current = InputFrame()
+        self.frame_index = 0
+
+    def poll(self):
+        """Advance to the next frame and return its events"""
+        self.current = self.next_frame()
+        self.frame_index += 1
+        return self.current.events
+
+    def next_frame(self):
+        """Produce the InputFrame for the upcoming frame"""
+        return InputFrame()
+
+    def end_frame(self, steps):
+        """Called after the frame's simulation steps ran"""
+        pass
+
+    def get_pressed(self):
+        return KeyState(self.current.keys)
+
+    def get_mouse_pressed(self):
+        return self.current.mouse_buttons
+
+    def get_mouse_pos(self):
+        return self.current.mouse_pos
+
+
+class PygameInputProvider(InputProvider):
+    """Live keyboard and mouse input from pygame (requires a display)"""
+    def poll(self):
+        self.frame_index += 1
+        return pygame.event.get()
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def get_mouse_pressed(self):
+        return pygame.mouse.get_pressed()
+
+    def get_mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+
+class ScriptedInputProvider(InputProvider):
+    """Replays a fixed script of input frames.
+
+    The script is either a list of InputFrame objects or a callable that
+    takes the frame index and returns an InputFrame. Once a list script runs
+    out, the last frame's held keys and mouse state stay active (without
+    re-sending its events) unless loop=True.
+
+    Scripts loaded from a recording also carry the seed, simulation rate
+    and starting game state of the recorded session (None if unknown).
+    """
+    def __init__(self, script=None, loop=False):
+        super().__init__()
+        self.script = script if script is not None else []
+        self.loop = loop
+        self.seed = None
+        self.sim_rate = None
+        self.start_state = None
+
+    def next_frame(self):
+        if callable(self.script):
+            return self.script(self.frame_index)
+
+        if not self.script:
+            return InputFrame()
+
+        if self.frame_index < len(self.script):
+            return self.script[self.frame_index]
+        if self.loop:
+            return self.script[self.frame_index % len(self.script)]
+
+        # Hold the final state without repeating its events
+        last = self.script[-1]
+        return InputFrame(last.keys, last.mouse_buttons, last.mouse_pos)
+
+    @classmethod
+    def load(cls, path, loop=False):
+        """Load a script saved by RecordingInputProvider.save()"""
+        with open(path, "r") as f:
+            data = json.load(f)
+        provider = cls([InputFrame.from_dict(frame) for frame in data["frames"]], loop=loop)
+        provider.seed = data.get("seed")
+        provider.sim_rate = data.get("sim_rate")
+        provider.start_state = data.get("start_state")
+        return provider
+
+
+class RecordingInputProvider(InputProvider):
+    """Wraps another provider and records every frame it produces, along
+    with the number of simulation steps the game ran for it"""
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.frames = []
+
+    def poll(self):
+        events = self.source.poll()
+        pressed = self.source.get_pressed()
+        if isinstance(pressed, KeyState):
+            keys = pressed.pressed_keys
+        else:
+            keys = [key for key in _RECORDED_KEYS if pressed[key]]
+
+        self.current = InputFrame(
+            keys,
+            self.source.get_mouse_pressed(),
+            self.source.get_mouse_pos(),
+            events,
+            self.source.current.steps
+        )
+        self.frames.append(self.current)
+        self.frame_index += 1
+        return events
+
+    def end_frame(self, steps):
+        self.current.steps = steps
+        self.source.end_frame(steps)
+
+    def save(self, path, seed=None, sim_rate=None, start_state=None):
+        """Save the recording as JSON for ScriptedInputProvider.load().
+
+        A replay needs the session's seed, simulation rate and starting game
+        state to reproduce it, so pass the ones the game was run with.
+        """
+        with open(path, "w") as f:
+            json.dump({"seed": seed, "sim_rate": sim_rate, "start_state": start_state,
+                       "frames": [frame.to_dict() for frame in self.frames]}, f)
+
+
+# Keys the game reads as held state (movement and fire)
+_RECORDED_KEYS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+    pygame.K_SPACE
+)
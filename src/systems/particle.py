@@ -1,220 +1,136 @@
 import pygame
-import random
 import math
+import numpy as np
+from src.systems.rng import rng
 
-class Particle:
-    def __init__(self, x, y, velocity_x, velocity_y, color, lifetime, particle_type="default", size=None):
-        self.x = x
-        self.y = y
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.particle_type = particle_type
-        self.size = size if size else random.randint(2, 5)
-        self.original_size = self.size
-        
-        # Enhanced properties
-        self.rotation = random.uniform(0, 2 * math.pi)
-        self.rotation_speed = random.uniform(-0.1, 0.1)
-        self.scale = 1.0
-        self.gravity_modifier = 1.0
-        
-        # Type-specific properties
-        if particle_type == "spark":
-            self.size = random.randint(1, 3)
-            self.gravity_modifier = 0.3
-        elif particle_type == "ember":
-            self.size = random.randint(3, 6)
-            self.gravity_modifier = 0.8
-        elif particle_type == "smoke":
-            self.size = random.randint(8, 15)
-            self.gravity_modifier = -0.2  # Rises up
-        elif particle_type == "energy":
-            self.size = random.randint(4, 8)
-            self.gravity_modifier = 0.0
-            self.rotation_speed = random.uniform(-0.3, 0.3)
-        
-    def update(self, dt):
-        dt_factor = dt / 1000.0
-        
-        # Move particle
-        self.x += self.velocity_x * dt_factor
-        self.y += self.velocity_y * dt_factor
-        
-        # Apply gravity and friction based on type
-        gravity_strength = 100 * self.gravity_modifier
-        self.velocity_y += gravity_strength * dt_factor
-        
-        # Air resistance
-        resistance = 0.995 if self.particle_type != "energy" else 0.98
-        self.velocity_x *= resistance
-        self.velocity_y *= resistance
-        
-        # Update rotation
-        self.rotation += self.rotation_speed * dt
-        
-        # Update scale for certain types
-        if self.particle_type == "smoke":
-            age_factor = 1 - (self.lifetime / self.max_lifetime)
-            self.scale = 1.0 + age_factor * 2  # Smoke grows over time
-        elif self.particle_type == "energy":
-            self.scale = 1.0 + 0.3 * math.sin(self.rotation * 3)
-        
-        # Decrease lifetime
-        self.lifetime -= dt
-        
-        return self.lifetime > 0
-    
-    def draw(self, surface):
-        if self.lifetime > 0:
-            # Calculate alpha based on remaining lifetime
-            alpha_factor = self.lifetime / self.max_lifetime
-            
-            # Adjust color with alpha
-            color = (
-                int(self.color[0] * alpha_factor),
-                int(self.color[1] * alpha_factor),
-                int(self.color[2] * alpha_factor)
-            )
-            
-            # Calculate current size
-            current_size = max(1, int(self.original_size * self.scale * alpha_factor))
-            
-            # Type-specific drawing
-            if self.particle_type == "spark":
-                # Draw as bright line
-                end_x = self.x + math.cos(self.rotation) * current_size * 2
-                end_y = self.y + math.sin(self.rotation) * current_size * 2
-                pygame.draw.line(surface, color, (int(self.x), int(self.y)), (int(end_x), int(end_y)), max(1, current_size))
-            elif self.particle_type == "ember":
-                # Draw as glowing circle
-                pygame.draw.circle(surface, color, (int(self.x), int(self.y)), current_size)
-                # Inner bright core
-                core_color = (min(255, color[0] + 50), min(255, color[1] + 50), min(255, color[2] + 50))
-                pygame.draw.circle(surface, core_color, (int(self.x), int(self.y)), max(1, current_size // 2))
-            elif self.particle_type == "smoke":
-                # Draw as fading circle
-                smoke_color = (color[0] // 2, color[1] // 2, color[2] // 2)
-                pygame.draw.circle(surface, smoke_color, (int(self.x), int(self.y)), current_size)
-            elif self.particle_type == "energy":
-                # Draw as pulsating energy ball
-                pulse_size = current_size + int(2 * math.sin(self.rotation * 4))
-                pygame.draw.circle(surface, color, (int(self.x), int(self.y)), max(1, pulse_size))
-                # Bright center
-                pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(self.y)), max(1, pulse_size // 3))
-            else:
-                # Default particle
-                pygame.draw.circle(surface, color, (int(self.x), int(self.y)), current_size)
+# Particle types (index = type code) and their per-type constants
+PARTICLE_TYPES = ("default", "spark", "ember", "smoke", "energy")
+DEFAULT, SPARK, EMBER, SMOKE, ENERGY = range(len(PARTICLE_TYPES))
+GRAVITY_MODIFIERS = np.array([1.0, 0.3, 0.8, -0.2, 0.0])  # Smoke rises up
+RESISTANCE = np.array([0.995, 0.995, 0.995, 0.995, 0.98])
 
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
-    
+    """Particles stored in preallocated NumPy arrays.
+
+    Live particles occupy slots [0, count). Emitters generate a whole burst
+    in one vectorized call, update() advances every particle in one pass
+    and compacts out the dead ones, and draw() batches per particle type.
+    Bursts that don't fit under the limit (at most the capacity, lowered by
+    cheaper quality presets) are truncated, and emission_scale (lowered by
+    the quality governor) thins every burst.
+    """
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.limit = capacity
+        self.emission_scale = 1.0
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.velocity_x = np.zeros(capacity)
+        self.velocity_y = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.max_lifetime = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.rotation = np.zeros(capacity)
+        self.rotation_speed = np.zeros(capacity)
+        self.scale = np.ones(capacity)
+        self.color = np.zeros((capacity, 3))
+        self.particle_type = np.zeros(capacity, np.int8)
+        self.arrays = (self.x, self.y, self.velocity_x, self.velocity_y, self.lifetime,
+                       self.max_lifetime, self.size, self.rotation, self.rotation_speed,
+                       self.scale, self.color, self.particle_type)
+
+    def emit(self, x, y, angles, speeds, colors, lifetimes, particle_types):
+        """Add a burst of particles moving at angles/speeds from (x, y).
+
+        x and y may be scalars or per-particle arrays; colors is an (n, 3)
+        array or a single RGB tuple; particle_types holds type codes.
+        """
+        generator = rng.numpy_stream("particles")
+        count = min(math.ceil(len(angles) * self.emission_scale), min(self.limit, self.capacity) - self.count)
+        if count <= 0:
+            return
+        burst = slice(self.count, self.count + count)
+        particle_types = np.asarray(particle_types)[:count]
+
+        self.x[burst] = np.broadcast_to(x, len(angles))[:count]
+        self.y[burst] = np.broadcast_to(y, len(angles))[:count]
+        self.velocity_x[burst] = np.cos(angles[:count]) * speeds[:count]
+        self.velocity_y[burst] = np.sin(angles[:count]) * speeds[:count]
+        self.color[burst] = np.broadcast_to(colors, (len(angles), 3))[:count]
+        self.lifetime[burst] = lifetimes[:count]
+        self.max_lifetime[burst] = lifetimes[:count]
+        self.particle_type[burst] = particle_types
+        self.size[burst] = generator.integers(2, 6, count)
+        self.rotation[burst] = generator.uniform(0, 2 * math.pi, count)
+        self.rotation_speed[burst] = np.where(particle_types == ENERGY,
+                                              generator.uniform(-0.3, 0.3, count),
+                                              generator.uniform(-0.1, 0.1, count))
+        self.scale[burst] = 1.0
+        self.count += count
+
     def create_explosion(self, x, y, color, particle_count):
         """Create an enhanced explosion effect at the given position"""
-        for _ in range(particle_count):
-            # Random velocity in all directions
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 200)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            
-            # Random lifetime
-            lifetime = random.uniform(300, 800)
-            
-            # Add some color variation
-            color_variant = (
-                min(255, max(0, color[0] + random.randint(-30, 30))),
-                min(255, max(0, color[1] + random.randint(-30, 30))),
-                min(255, max(0, color[2] + random.randint(-30, 30)))
-            )
-            
-            # Mix of particle types for more interesting explosions
-            particle_type = random.choice(["default", "spark", "ember"])
-            
-            particle = Particle(x, y, velocity_x, velocity_y, color_variant, lifetime, particle_type)
-            self.particles.append(particle)
-    
+        generator = rng.numpy_stream("particles")
+        # Random velocity in all directions, with some color variation
+        angles = generator.uniform(0, 2 * math.pi, particle_count)
+        speeds = generator.uniform(50, 200, particle_count)
+        lifetimes = generator.uniform(300, 800, particle_count)
+        colors = np.clip(np.array(color) + generator.integers(-30, 31, (particle_count, 3)), 0, 255)
+
+        # Mix of particle types for more interesting explosions
+        particle_types = generator.choice([DEFAULT, SPARK, EMBER], particle_count)
+        self.emit(x, y, angles, speeds, colors, lifetimes, particle_types)
+
     def create_enhanced_explosion(self, x, y, color, intensity=1.0):
         """Create a more dramatic explosion with multiple particle types"""
+        generator = rng.numpy_stream("particles")
         base_count = int(20 * intensity)
-        
+
         # Main explosion particles
         self.create_explosion(x, y, color, base_count)
-        
+
         # Add sparks
-        for _ in range(int(8 * intensity)):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(150, 300)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            lifetime = random.uniform(200, 400)
-            
-            spark_color = (min(255, color[0] + 50), min(255, color[1] + 50), 255)
-            particle = Particle(x, y, velocity_x, velocity_y, spark_color, lifetime, "spark")
-            self.particles.append(particle)
-        
+        count = int(8 * intensity)
+        spark_color = (min(255, color[0] + 50), min(255, color[1] + 50), 255)
+        self.emit(x, y, generator.uniform(0, 2 * math.pi, count), generator.uniform(150, 300, count),
+                  spark_color, generator.uniform(200, 400, count), np.full(count, SPARK))
+
         # Add smoke
-        for _ in range(int(5 * intensity)):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(20, 60)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            lifetime = random.uniform(800, 1200)
-            
-            smoke_color = (color[0] // 3, color[1] // 3, color[2] // 3)
-            particle = Particle(x, y, velocity_x, velocity_y, smoke_color, lifetime, "smoke")
-            self.particles.append(particle)
-    
+        count = int(5 * intensity)
+        smoke_color = (color[0] // 3, color[1] // 3, color[2] // 3)
+        self.emit(x, y, generator.uniform(0, 2 * math.pi, count), generator.uniform(20, 60, count),
+                  smoke_color, generator.uniform(800, 1200, count), np.full(count, SMOKE))
+
     def create_hit_effect(self, x, y, color, direction_angle):
         """Create a directional hit effect"""
-        for _ in range(8):
-            # Particles fly in a cone from the hit direction
-            angle = direction_angle + random.uniform(-math.pi/4, math.pi/4)
-            speed = random.uniform(80, 150)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            
-            lifetime = random.uniform(200, 500)
-            
-            particle = Particle(x, y, velocity_x, velocity_y, color, lifetime, "spark")
-            self.particles.append(particle)
-    
+        generator = rng.numpy_stream("particles")
+        # Particles fly in a cone from the hit direction
+        angles = direction_angle + generator.uniform(-math.pi / 4, math.pi / 4, 8)
+        self.emit(x, y, angles, generator.uniform(80, 150, 8), color,
+                  generator.uniform(200, 500, 8), np.full(8, SPARK))
+
     def create_muzzle_flash(self, x, y, direction_angle):
         """Create an enhanced muzzle flash effect for shooting"""
-        for _ in range(8):
-            # Particles fly forward from the gun
-            angle = direction_angle + random.uniform(-math.pi/8, math.pi/8)
-            speed = random.uniform(100, 200)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            
-            lifetime = random.uniform(100, 300)
-            color = (255, 255, 100)  # Yellow flash
-            
-            particle_type = random.choice(["spark", "energy"])
-            particle = Particle(x, y, velocity_x, velocity_y, color, lifetime, particle_type)
-            self.particles.append(particle)
-    
+        generator = rng.numpy_stream("particles")
+        # Particles fly forward from the gun in a yellow flash
+        angles = direction_angle + generator.uniform(-math.pi / 8, math.pi / 8, 8)
+        self.emit(x, y, angles, generator.uniform(100, 200, 8), (255, 255, 100),
+                  generator.uniform(100, 300, 8), generator.choice([SPARK, ENERGY], 8))
+
     def create_energy_trail(self, x, y, color, direction_angle):
         """Create energy trail particles for special weapons"""
-        for _ in range(3):
-            # Small random offset
-            offset_x = random.uniform(-5, 5)
-            offset_y = random.uniform(-5, 5)
-            
-            # Slight random velocity
-            velocity_x = random.uniform(-20, 20)
-            velocity_y = random.uniform(-20, 20)
-            
-            lifetime = random.uniform(150, 300)
-            
-            particle = Particle(x + offset_x, y + offset_y, velocity_x, velocity_y, color, lifetime, "energy")
-            self.particles.append(particle)
-    
+        generator = rng.numpy_stream("particles")
+        # Small random offset and slight random velocity
+        offset_x = generator.uniform(-5, 5, 3)
+        offset_y = generator.uniform(-5, 5, 3)
+        velocity_x = generator.uniform(-20, 20, 3)
+        velocity_y = generator.uniform(-20, 20, 3)
+        self.emit(x + offset_x, y + offset_y, np.arctan2(velocity_y, velocity_x),
+                  np.hypot(velocity_x, velocity_y), color, generator.uniform(150, 300, 3),
+                  np.full(3, ENERGY))
+
     def create_death_explosion(self, x, y, enemy_type):
         """Create type-specific death explosions"""
         if enemy_type == "boss":
@@ -228,16 +144,99 @@ class ParticleSystem:
         else:
             # Standard explosion
             self.create_enhanced_explosion(x, y, (255, 100, 150), 1.0)
-    
+
     def update(self, dt):
         """Update all particles and remove dead ones"""
-        self.particles = [particle for particle in self.particles if particle.update(dt)]
-    
-    def draw(self, surface):
-        """Draw all particles"""
-        for particle in self.particles:
-            particle.draw(surface)
-    
+        n = self.count
+        if n == 0:
+            return
+        dt_factor = dt / 1000.0
+        particle_type = self.particle_type[:n]
+        lifetime = self.lifetime[:n]
+
+        # Move particles, then apply gravity and air resistance by type
+        self.x[:n] += self.velocity_x[:n] * dt_factor
+        self.y[:n] += self.velocity_y[:n] * dt_factor
+        self.velocity_y[:n] += 100 * GRAVITY_MODIFIERS[particle_type] * dt_factor
+        resistance = RESISTANCE[particle_type]
+        self.velocity_x[:n] *= resistance
+        self.velocity_y[:n] *= resistance
+
+        # Rotation, and scale for smoke (grows with age) and energy (pulses)
+        rotation = self.rotation[:n]
+        rotation += self.rotation_speed[:n] * dt
+        smoke = particle_type == SMOKE
+        energy = particle_type == ENERGY
+        self.scale[:n][smoke] = 1.0 + (1 - lifetime[smoke] / self.max_lifetime[:n][smoke]) * 2
+        self.scale[:n][energy] = 1.0 + 0.3 * np.sin(rotation[energy] * 3)
+
+        # Decrease lifetime and compact out dead particles
+        lifetime -= dt
+        alive = lifetime > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for array in self.arrays:
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
+
+    def draw(self, surface, offset=(0, 0), scale=1.0):
+        """Draw all on-screen particles, shifted by offset then scaled, batched per type"""
+        n = self.count
+        if n == 0:
+            return
+        offset_x, offset_y = offset
+        x = (self.x[:n] + offset_x) * scale
+        y = (self.y[:n] + offset_y) * scale
+        width, height = surface.get_size()
+        visible = (x > -40) & (x < width + 40) & (y > -40) & (y < height + 40)
+
+        # Fade color and size with remaining lifetime
+        alpha = self.lifetime[:n] / self.max_lifetime[:n]
+        color = (self.color[:n] * alpha[:, None]).astype(np.int64)
+        size = np.maximum(1, (self.size[:n] * self.scale[:n] * alpha * scale).astype(np.int64))
+        screen_x = x.astype(np.int64)
+        screen_y = y.astype(np.int64)
+        particle_type = self.particle_type[:n]
+
+        def batch(type_code):
+            slots = np.flatnonzero(visible & (particle_type == type_code))
+            return slots, screen_x[slots].tolist(), screen_y[slots].tolist(), size[slots].tolist()
+
+        draw_circle = pygame.draw.circle
+
+        # Default particles: plain circles
+        slots, xs, ys, sizes = batch(DEFAULT)
+        for center_x, center_y, radius, particle_color in zip(xs, ys, sizes, color[slots].tolist()):
+            draw_circle(surface, particle_color, (center_x, center_y), radius)
+
+        # Sparks: bright lines along the rotation
+        slots, xs, ys, sizes = batch(SPARK)
+        end_x = (x[slots] + np.cos(self.rotation[slots]) * size[slots] * 2).astype(np.int64).tolist()
+        end_y = (y[slots] + np.sin(self.rotation[slots]) * size[slots] * 2).astype(np.int64).tolist()
+        for start_x, start_y, stop_x, stop_y, line_width, particle_color in zip(
+                xs, ys, end_x, end_y, sizes, color[slots].tolist()):
+            pygame.draw.line(surface, particle_color, (start_x, start_y), (stop_x, stop_y), line_width)
+
+        # Embers: glowing circles with a brighter core
+        slots, xs, ys, sizes = batch(EMBER)
+        core = np.minimum(255, color[slots] + 50).tolist()
+        for center_x, center_y, radius, particle_color, core_color in zip(
+                xs, ys, sizes, color[slots].tolist(), core):
+            draw_circle(surface, particle_color, (center_x, center_y), radius)
+            draw_circle(surface, core_color, (center_x, center_y), max(1, radius // 2))
+
+        # Smoke: dim fading circles
+        slots, xs, ys, sizes = batch(SMOKE)
+        for center_x, center_y, radius, smoke_color in zip(xs, ys, sizes, (color[slots] // 2).tolist()):
+            draw_circle(surface, smoke_color, (center_x, center_y), radius)
+
+        # Energy: pulsating balls with a bright center
+        slots, xs, ys, sizes = batch(ENERGY)
+        pulse = (size[slots] + (2 * np.sin(self.rotation[slots] * 4)).astype(np.int64)).tolist()
+        for center_x, center_y, pulse_size, particle_color in zip(xs, ys, pulse, color[slots].tolist()):
+            draw_circle(surface, particle_color, (center_x, center_y), max(1, pulse_size))
+            draw_circle(surface, (255, 255, 255), (center_x, center_y), max(1, pulse_size // 3))
+
     def get_particle_count(self):
         """Get the current number of particles"""
-        return len(self.particles) 
\ No newline at end of file
+        return self.count
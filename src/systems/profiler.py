@@ -0,0 +1,156 @@
+import csv
+import time
+from collections import deque
+import pygame
+from src.ui.fonts import fonts
+
+
+class PhaseTimer:
+    """Context manager that adds its elapsed time to one profiler phase"""
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed_ms = (time.perf_counter() - self.start) * 1000.0
+        timings = self.profiler.current_timings
+        timings[self.name] = timings.get(self.name, 0.0) + elapsed_ms
+        return False
+
+
+class NullTimer:
+    """Do-nothing stand-in for PhaseTimer while profiling is off"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class FrameProfiler:
+    """Per-phase frame timings kept in a ring buffer.
+
+    Game code wraps each phase in `with profiler.phase(name):`. Timings of a
+    phase that runs several times in one frame (e.g. several fixed simulation
+    steps) are summed. end_frame() stores the frame with its entity counts.
+    """
+    UPDATE_PHASES = ("player", "spawning", "enemy_update", "projectile_update", "xp_orb_update",
+                     "area_damage", "shuriken", "collisions", "particles_update")
+    DRAW_PHASES = ("background", "enemy_draw", "projectile_draw", "pickup_draw",
+                   "player_draw", "particle_draw", "upscale", "ui")
+    PHASES = ("update",) + UPDATE_PHASES + ("draw",) + DRAW_PHASES
+    COUNTS = ("enemies", "projectiles", "particles", "xp_orbs", "surface_allocations",
+              "visible_enemies", "enemy_lod", "detail_level")
+
+    def __init__(self, history=600, enabled=False):
+        self.enabled = enabled
+        self.frames = deque(maxlen=history)  # (frame_index, timings, counts)
+        self.frame_index = 0
+        self.current_timings = {}
+
+        # Timers are reused every frame to keep instrumentation cheap
+        self.timers = {name: PhaseTimer(self, name) for name in self.PHASES}
+        self.null_timer = NullTimer()
+
+        # Overlay state (stats are refreshed periodically, not every frame)
+        self.stats_refresh_interval = 15
+        self.cached_stats = {}
+        self.font = None
+        self.BACKGROUND = (10, 15, 20)
+        self.HEADER_COLOR = (0, 255, 255)
+        self.TEXT_COLOR = (220, 220, 220)
+        self.TOTAL_COLOR = (255, 165, 0)
+
+    def toggle(self):
+        """Turn recording and the overlay on or off"""
+        self.enabled = not self.enabled
+        self.current_timings = {}
+        return self.enabled
+
+    def phase(self, name):
+        """Get a context manager that times one phase of the current frame"""
+        if not self.enabled:
+            return self.null_timer
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = PhaseTimer(self, name)
+        return timer
+
+    def end_frame(self, counts):
+        """Store the finished frame's timings along with entity counts"""
+        if not self.enabled:
+            return
+        self.frames.append((self.frame_index, self.current_timings, dict(counts)))
+        self.current_timings = {}
+        self.frame_index += 1
+
+    def stats(self):
+        """Get {phase: (p50, p95, max)} in milliseconds over the buffered frames"""
+        stats = {}
+        if not self.frames:
+            return stats
+        for name in self.PHASES:
+            samples = sorted(timings.get(name, 0.0) for _, timings, _ in self.frames)
+            last = len(samples) - 1
+            stats[name] = (samples[int(last * 0.5)], samples[int(last * 0.95)], samples[last])
+        return stats
+
+    def export_csv(self, path):
+        """Write one row per buffered frame (phase timings in ms, then counts)"""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame",) + self.PHASES + self.COUNTS)
+            for frame_index, timings, counts in self.frames:
+                writer.writerow([frame_index] +
+                                [f"{timings.get(name, 0.0):.4f}" for name in self.PHASES] +
+                                [counts.get(name, 0) for name in self.COUNTS])
+        return len(self.frames)
+
+    def draw_overlay(self, surface, info=()):
+        """Draw the per-phase p50/p95/max table, entity counts and extra info lines"""
+        if not self.enabled:
+            return
+        if self.font is None:
+            self.font = fonts.get(18)
+
+        if not self.cached_stats or self.frame_index % self.stats_refresh_interval == 0:
+            self.cached_stats = self.stats()
+
+        # Rows of (label, column values, color)
+        rows = [("phase", ("p50", "p95", "max"), self.HEADER_COLOR)]
+        for name in self.PHASES:
+            p50, p95, peak = self.cached_stats.get(name, (0.0, 0.0, 0.0))
+            color = self.TOTAL_COLOR if name in ("update", "draw") else self.TEXT_COLOR
+            rows.append((name, (f"{p50:.2f}", f"{p95:.2f}", f"{peak:.2f}"), color))
+        if self.frames:
+            # Two counts per row to fit the panel
+            counts = self.frames[-1][2]
+            for start in range(0, len(self.COUNTS), 2):
+                names = self.COUNTS[start:start + 2]
+                rows.append(("  ".join(f"{name} {counts.get(name, 0)}" for name in names),
+                             (), self.HEADER_COLOR))
+        for line in info:
+            rows.append((line, (), self.HEADER_COLOR))
+
+        # Background panel in the bottom-left corner
+        line_height = 15
+        column_width = 50
+        panel = pygame.Rect(0, 0, 290, len(rows) * line_height + 10)
+        panel.bottomleft = (10, surface.get_height() - 10)
+        pygame.draw.rect(surface, self.BACKGROUND, panel)
+        pygame.draw.rect(surface, self.HEADER_COLOR, panel, 1)
+
+        # Right-align the numeric columns (the default font is proportional)
+        y = panel.y + 5
+        for label, values, color in rows:
+            surface.blit(self.font.render(label, True, color), (panel.x + 6, y))
+            for i, value in enumerate(values):
+                value_surface = self.font.render(value, True, color)
+                right = panel.right - 8 - (len(values) - 1 - i) * column_width
+                surface.blit(value_surface, (right - value_surface.get_width(), y))
+            y += line_height
@@ -0,0 +1,161 @@
+from collections import deque
+import numpy as np
+from src.systems.array_kernel import ArrayKernel, KernelGroup
+
+# Integer codes per weapon type (unknown types get the next free code)
+WEAPON_CODES = {"default": 0, "laser_rifle": 1, "plasma_cannon": 2, "shotgun": 3,
+                "sniper_rifle": 4, "machine_gun": 5, "energy_beam": 6, "auto_targeting": 7}
+
+# Distance past the world edge before a projectile is culled
+CULL_BUFFER = 100
+
+
+def weapon_code(weapon_type):
+    return WEAPON_CODES.setdefault(weapon_type, len(WEAPON_CODES))
+
+
+class TrailPositions:
+    """Projectile trail; derived from the kernel state while registered.
+
+    Projectiles fly straight at constant velocity, so the positions before
+    each of the last steps are the current position stepped back along the
+    velocity (exact for the fixed simulation timestep).
+    """
+    def __get__(self, projectile, owner=None):
+        if projectile is None:
+            return self
+        if projectile.kernel is None:
+            return projectile.__dict__["trail_positions"]
+        return projectile.kernel.get_trail(projectile.kernel_slot, projectile.max_trail_length)
+
+    def __set__(self, projectile, value):
+        if projectile.kernel is None:
+            projectile.__dict__["trail_positions"] = value
+        else:
+            projectile.kernel.steps[projectile.kernel_slot] = len(value)
+
+
+class ProjectileKernel(ArrayKernel):
+    """Projectile state in structure-of-arrays form with batched update passes.
+
+    step() replaces Projectile.update for every registered projectile:
+    integration, range tracking and pulse animation, then bounds culling.
+    """
+    FIELDS = {
+        "x": np.float64, "y": np.float64, "prev_x": np.float64, "prev_y": np.float64,
+        "velocity_x": np.float64, "velocity_y": np.float64,
+        "distance_traveled": np.float64, "max_range": np.float64,
+        "animation_timer": np.float64, "pulse_scale": np.float64,
+        "damage": np.int64, "piercing": bool, "explosive": bool, "is_enemy": bool,
+    }
+    ARRAYS = {
+        "weapon_code": (np.int16, ()),
+        "travel_speed": (np.float64, ()),  # |velocity|, for range tracking
+        "half_size": (np.int64, ()),       # rect half extent, for culling
+        "center_x": (np.int64, ()),
+        "center_y": (np.int64, ()),
+        "steps": (np.int64, ()),           # updates so far, for the trail
+    }
+
+    def __init__(self, capacity=256):
+        super().__init__(capacity)
+        self.last_dt = 0.0
+
+    def on_register(self, projectile, slot):
+        self.weapon_code[slot] = weapon_code(projectile.weapon_type)
+        self.travel_speed[slot] = np.hypot(self.fields["velocity_x"][slot], self.fields["velocity_y"][slot])
+        self.half_size[slot] = projectile.rect.width // 2
+        self.center_x[slot], self.center_y[slot] = projectile.rect.center
+        self.steps[slot] = len(projectile.__dict__.pop("trail_positions"))
+
+    def on_unregister(self, projectile, slot):
+        projectile.__dict__["trail_positions"] = deque(self.get_trail(slot, projectile.max_trail_length),
+                                                       maxlen=projectile.max_trail_length)
+
+    def get_trail(self, slot, max_length):
+        """Get a slot's trail positions, oldest first"""
+        x = self.fields["x"][slot]
+        y = self.fields["y"][slot]
+        move_factor = self.last_dt / 1000.0
+        step_x = self.fields["velocity_x"][slot] * move_factor
+        step_y = self.fields["velocity_y"][slot] * move_factor
+        length = min(int(self.steps[slot]), max_length)
+        return [(x - step_x * back, y - step_y * back) for back in range(length, 0, -1)]
+
+    def get_trail_head(self, slot, max_length):
+        """Get (trail length, newest trail point, step between points) for a slot"""
+        move_factor = self.last_dt / 1000.0
+        step_x = self.fields["velocity_x"][slot] * move_factor
+        step_y = self.fields["velocity_y"][slot] * move_factor
+        return (min(int(self.steps[slot]), max_length),
+                self.fields["x"][slot] - step_x, self.fields["y"][slot] - step_y, step_x, step_y)
+
+    def step(self, dt, world_width, world_height):
+        """Advance every projectile by dt ms; get the ones that expired or left the world"""
+        n = self.count
+        if n == 0:
+            return []
+        f = self.fields
+        x = f["x"][:n]
+        y = f["y"][:n]
+        self.last_dt = dt
+
+        # Remember the last simulated position for render interpolation
+        f["prev_x"][:n] = x
+        f["prev_y"][:n] = y
+        self.steps[:n] += 1
+
+        # Move projectiles and track range
+        move_factor = dt / 1000.0
+        x += f["velocity_x"][:n] * move_factor
+        y += f["velocity_y"][:n] * move_factor
+        f["distance_traveled"][:n] += self.travel_speed[:n] * move_factor
+        center_x = self.center_x[:n]
+        center_y = self.center_y[:n]
+        np.rint(x, out=center_x, casting="unsafe")
+        np.rint(y, out=center_y, casting="unsafe")
+
+        # Weapon-specific pulse animation
+        f["animation_timer"][:n] += dt
+        f["pulse_scale"][:n] = 1.0 + 0.2 * np.sin(f["animation_timer"][:n] * 0.01)
+
+        self.sync_rects(center_x, center_y)
+
+        # Cull projectiles past their range or off the world (rect top-left vs buffer)
+        left = center_x - self.half_size[:n]
+        top = center_y - self.half_size[:n]
+        expired = ((f["distance_traveled"][:n] > f["max_range"][:n]) |
+                   (left < -CULL_BUFFER) | (left > world_width + CULL_BUFFER) |
+                   (top < -CULL_BUFFER) | (top > world_height + CULL_BUFFER))
+        return [self.sprites[slot] for slot in np.flatnonzero(expired)]
+
+    def split_by_owner(self):
+        """Get (player projectiles, enemy projectiles)"""
+        n = self.count
+        sprites = self.sprites
+        is_enemy = self.fields["is_enemy"][:n]
+        return ([sprites[slot] for slot in np.flatnonzero(~is_enemy)],
+                [sprites[slot] for slot in np.flatnonzero(is_enemy)])
+
+    def count_weapon(self, weapon_type):
+        return int(np.count_nonzero(self.weapon_code[:self.count] == weapon_code(weapon_type)))
+
+
+class ProjectileGroup(KernelGroup):
+    """Projectile group backed by a ProjectileKernel.
+
+    update(dt, world_width, world_height) runs the batched kernel step and
+    removes projectiles that ran out of range or left the world.
+    """
+    kernel_class = ProjectileKernel
+
+    def update(self, dt, world_width, world_height):
+        expired = self.kernel.step(dt, world_width, world_height)
+        if expired:
+            self.remove(*expired)
+
+    def split_by_owner(self):
+        return self.kernel.split_by_owner()
+
+    def count_weapon(self, weapon_type):
+        return self.kernel.count_weapon(weapon_type)
@@ -0,0 +1,71 @@
+class SpatialHash:
+    """Uniform grid over world space for broadphase proximity queries.
+
+    Sprites are bucketed by the cell containing their rect center. Queries
+    pad their search area by the largest half-extent inserted, so every
+    sprite whose rect reaches into the query area is found. The grid is
+    meant to be rebuilt once per frame after sprites move; sprites killed
+    since the rebuild are skipped via alive().
+    """
+    def __init__(self, world_width, world_height, cell_size=64):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.cell_size = cell_size
+        self.cells = {}
+        self.max_half_extent = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.max_half_extent = 0
+
+    def insert(self, sprite):
+        rect = sprite.rect
+        key = (rect.centerx // self.cell_size, rect.centery // self.cell_size)
+        bucket = self.cells.get(key)
+        if bucket is None:
+            self.cells[key] = [sprite]
+        else:
+            bucket.append(sprite)
+
+        half_extent = max(rect.width, rect.height) // 2 + 1
+        if half_extent > self.max_half_extent:
+            self.max_half_extent = half_extent
+
+    def rebuild(self, sprites):
+        """Re-bucket every sprite at its current position"""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def _cells_in_range(self, left, top, right, bottom):
+        """Yield the non-empty buckets overlapping a world-space box"""
+        cell_size = self.cell_size
+        cells = self.cells
+        for cell_x in range(int(left // cell_size), int(right // cell_size) + 1):
+            for cell_y in range(int(top // cell_size), int(bottom // cell_size) + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    yield bucket
+
+    def query_rect(self, rect):
+        """Get live sprites whose rect collides with the given rect"""
+        pad = self.max_half_extent
+        found = []
+        for bucket in self._cells_in_range(rect.left - pad, rect.top - pad,
+                                           rect.right + pad, rect.bottom + pad):
+            for sprite in bucket:
+                if sprite.rect.colliderect(rect) and sprite.alive():
+                    found.append(sprite)
+        return found
+
+    def query_radius(self, x, y, radius):
+        """Get live sprites whose rect center is within radius of (x, y)"""
+        radius_sq = radius * radius
+        found = []
+        for bucket in self._cells_in_range(x - radius, y - radius, x + radius, y + radius):
+            for sprite in bucket:
+                dx = sprite.rect.centerx - x
+                dy = sprite.rect.centery - y
+                if dx * dx + dy * dy <= radius_sq and sprite.alive():
+                    found.append(sprite)
+        return found
@@ -0,0 +1,183 @@
+import math
+from collections import OrderedDict
+import pygame
+from src.systems.rng import rng
+
+
+def bake_frame(draw, size, colorkey=None, scale=1.0):
+    """Run draw(canvas, x, y) centered on a size x size canvas and crop the result.
+
+    Returns (surface, offset_x, offset_y): blit the surface at the draw
+    center plus the offset to reproduce the drawing. Fully opaque drawings
+    can pass a colorkey (a color they don't use) to get an RLE colorkeyed
+    frame, which blits much faster than per-pixel alpha. A scale other
+    than 1 resizes the frame (and offset) for a scaled render target.
+    """
+    canvas = pygame.Surface((size, size), pygame.SRCALPHA)
+    middle = size // 2
+    draw(canvas, middle, middle)
+
+    bounds = canvas.get_bounding_rect()
+    frame = canvas.subsurface(bounds).copy()
+    offset_x = bounds.x - middle
+    offset_y = bounds.y - middle
+    if scale != 1.0:
+        frame = scale_frame(frame, scale, smooth=colorkey is None)
+        offset_x = round(offset_x * scale)
+        offset_y = round(offset_y * scale)
+    has_display = pygame.display.get_surface() is not None
+    if colorkey is not None:
+        keyed = pygame.Surface(frame.get_size())
+        if has_display:
+            keyed = keyed.convert()
+        keyed.fill(colorkey)
+        keyed.blit(frame, (0, 0))
+        keyed.set_colorkey(colorkey, pygame.RLEACCEL)
+        frame = keyed
+    elif has_display:
+        frame = frame.convert_alpha()
+    return (frame, offset_x, offset_y)
+
+
+def scale_frame(surface, scale, smooth=True):
+    """Resize a surface by scale (at least 1 px). Smooth scaling blends edge
+    pixels, so colorkeyed surfaces should use nearest-neighbor instead."""
+    width, height = surface.get_size()
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    if smooth and surface.get_bitsize() in (24, 32):
+        return pygame.transform.smoothscale(surface, size)
+    return pygame.transform.scale(surface, size)
+
+
+class LRUFrameCache:
+    """Bounded frame cache that evicts the least recently used frame"""
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.frames = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render):
+        """Get the frame for key, calling render() to bake it on a miss"""
+        frame = self.frames.get(key)
+        if frame is None:
+            self.misses += 1
+            frame = self.frames[key] = render()
+            if len(self.frames) > self.capacity:
+                self.frames.popitem(last=False)
+        else:
+            self.hits += 1
+            self.frames.move_to_end(key)
+        return frame
+
+    def clear(self):
+        self.frames.clear()
+
+
+class EnemySpriteCache:
+    """Pre-rendered enemy body frames, keyed by type, animation phase and state.
+
+    Enemy animation is driven by animation_timer (pulse_timer, rotation_angle
+    and hover_offset all follow it), so it is quantized into phases of
+    about frame_ms over a looping period. The loop is a whole number of
+    rotation_angle cycles (2*pi / 0.001 ms, two for the slower boss), and
+    every rate in the draw code is a multiple of 0.001 rad/ms (0.0005 for
+    the boss), so hover, pulse and rotation all come back to their first
+    pose when the loop wraps. Each frame is rendered once, on first
+    use, by the procedural draw code of a template enemy, in normal and
+    damage-flash variants (plus a damaged variant for elites and bosses),
+    then cropped to its visible pixels. Drawing an enemy body is one blit.
+
+    Silhouettes are the low-detail stand-in for dense hordes: one still
+    frame per type, with the translucent pixels dropped and the rest made
+    opaque, stored as an RLE colorkeyed surface for the cheapest blit.
+    """
+    # Types whose look changes below half health
+    DAMAGE_STATES = ("elite", "boss")
+    # rotation_angle cycles per animation loop, for types with slower rates
+    LOOP_CYCLES = {"boss": 2}
+    SILHOUETTE_COLORKEY = (255, 0, 128)
+
+    def __init__(self, frame_ms=50):
+        self.frame_ms = frame_ms
+        self.loops = {}      # type -> (phase count, phase length in ms)
+        self.frames = {}     # (type, phase, flashing, damaged, scale) -> (surface, offset_x, offset_y)
+        self.silhouettes = {}  # (type, flashing, scale) -> (surface, offset_x, offset_y)
+        self.templates = {}  # type -> Enemy used for rendering
+
+    def get_loop(self, enemy_type):
+        """Get (phase count, phase ms) for a type's animation loop"""
+        loop = self.loops.get(enemy_type)
+        if loop is None:
+            period_ms = 2 * math.pi / 0.001 * self.LOOP_CYCLES.get(enemy_type, 1)
+            phases = round(period_ms / self.frame_ms)
+            loop = self.loops[enemy_type] = (phases, period_ms / phases)
+        return loop
+
+    def get_key(self, enemy, scale=1.0):
+        phases, phase_ms = self.get_loop(enemy.enemy_type)
+        phase = int(enemy.animation_timer // phase_ms) % phases
+        damaged = enemy.enemy_type in self.DAMAGE_STATES and enemy.health < enemy.max_health * 0.5
+        return (enemy.enemy_type, phase, enemy.damage_flash > 0, damaged, scale)
+
+    def get_frame(self, enemy, scale=1.0):
+        """Get (surface, offset_x, offset_y) for the enemy's current look"""
+        key = self.get_key(enemy, scale)
+        frame = self.frames.get(key)
+        if frame is None:
+            frame = self.frames[key] = self.render(type(enemy), *key)
+        return frame
+
+    def blit(self, surface, enemy, center_x, center_y, scale=1.0):
+        frame, offset_x, offset_y = self.get_frame(enemy, scale)
+        surface.blit(frame, (center_x + offset_x, center_y + offset_y))
+
+    def get_silhouette(self, enemy, scale=1.0):
+        """Get (surface, offset_x, offset_y) for the enemy's low-detail silhouette"""
+        key = (enemy.enemy_type, enemy.damage_flash > 0, scale)
+        frame = self.silhouettes.get(key)
+        if frame is None:
+            frame = self.silhouettes[key] = self.render_silhouette(type(enemy), *key)
+        return frame
+
+    def render_silhouette(self, enemy_class, enemy_type, flashing, scale=1.0):
+        """Reduce the first animation frame to its mostly opaque pixels"""
+        body, offset_x, offset_y = self.render(enemy_class, enemy_type, 0, flashing, False, scale)
+        opaque = body.copy()
+        opaque.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MAX)
+        keyed = pygame.mask.from_surface(body, 127).to_surface(setsurface=opaque,
+                                                               unsetcolor=self.SILHOUETTE_COLORKEY)
+        silhouette = pygame.Surface(keyed.get_size())
+        if pygame.display.get_surface() is not None:
+            silhouette = silhouette.convert()
+        silhouette.blit(keyed, (0, 0))
+        silhouette.set_colorkey(self.SILHOUETTE_COLORKEY, pygame.RLEACCEL)
+        return (silhouette, offset_x, offset_y)
+
+    def render(self, enemy_class, enemy_type, phase, flashing, damaged, scale=1.0):
+        """Draw one frame with the procedural code and crop it"""
+        template = self.templates.get(enemy_type)
+        if template is None:
+            # Building an enemy draws from the AI stream; keep the simulation unaffected
+            state = rng.ai.getstate()
+            template = self.templates[enemy_type] = enemy_class(0, 0, enemy_type)
+            rng.ai.setstate(state)
+            template.movement_trail = []  # Trails are drawn live
+
+        # Pose the template at the phase's representative time
+        time_ms = phase * self.get_loop(enemy_type)[1]
+        template.animation_timer = time_ms
+        template.pulse_timer = time_ms
+        template.rotation_angle = time_ms * 0.001
+        template.hover_offset = math.sin(time_ms * 0.003) * 2
+        template.damage_flash = 200 if flashing else 0
+        template.health = template.max_health * 0.25 if damaged else template.max_health
+        template.last_attack = -1000  # No sniper charge bar in cached frames
+
+        # Render around the middle of a generous canvas, then crop
+        size = max(template.rect.width, template.rect.height) * 4 + 64
+        return bake_frame(template.draw_body, size, scale=scale)
+
+    def clear(self):
+        self.frames.clear()
+        self.silhouettes.clear()
@@ -0,0 +1,46 @@
+import pygame
+
+
+class SurfacePool:
+    """Reusable scratch surfaces for per-frame alpha effects.
+
+    get() hands out one surface per (size, flags) key, cleared to the fill
+    color and set to the requested per-surface alpha, instead of allocating
+    a new Surface on every call. Alpha is applied on each get rather than
+    being part of the key, since pulsing effects would otherwise keep a copy
+    per alpha value (a full-screen flash fades through up to 256). A scratch
+    surface is only valid until the next get() with the same size and flags,
+    so blit it right away. Allocation counters are kept per frame (reset
+    by begin_frame) to check that the steady state allocates nothing.
+    """
+    def __init__(self):
+        self.surfaces = {}  # (width, height, flags) -> Surface
+        self.allocations = 0
+        self.frame_allocations = 0
+        self.frame_requests = 0
+
+    def get(self, size, flags=0, alpha=None, fill=(0, 0, 0)):
+        """Get a cleared scratch surface of size with flags and per-surface alpha"""
+        width, height = size
+        key = (width, height, flags)
+        self.frame_requests += 1
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = pygame.Surface((width, height), flags)
+            self.allocations += 1
+            self.frame_allocations += 1
+        surface.set_alpha(alpha)
+        surface.fill(fill)
+        return surface
+
+    def begin_frame(self):
+        """Reset the per-frame counters"""
+        self.frame_allocations = 0
+        self.frame_requests = 0
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared pool used by all drawing code (counters reset by Game.draw)
+surface_pool = SurfacePool()
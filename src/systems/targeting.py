@@ -0,0 +1,121 @@
+import heapq
+import math
+
+
+class TargetingService:
+    """Nearest-enemy queries for auto-aim weapons, backed by the enemy grid.
+
+    All distances are compared squared. Once per frame the service gathers
+    the enemies around an anchor (the player); queries whose search circle
+    fits inside that neighborhood are answered from it, everything else
+    falls back to a ring search over the spatial hash. Results are cached
+    for the rest of the frame.
+    """
+    def __init__(self, grid, neighborhood_radius=450):
+        self.grid = grid
+        self.neighborhood_radius = neighborhood_radius
+        self.anchor = None
+        self.neighborhood = None  # [(enemy, x, y)] within neighborhood_radius of the anchor
+        self.cache = {}
+
+    def begin_frame(self, anchor_x, anchor_y):
+        """Drop last frame's results and re-center the neighborhood"""
+        self.anchor = (anchor_x, anchor_y)
+        self.neighborhood = None
+        self.cache.clear()
+
+    def nearest(self, x, y, max_distance=None):
+        """Get the nearest live enemy closer than max_distance (or None)"""
+        found = self.nearest_k(x, y, 1, max_distance)
+        return found[0] if found else None
+
+    def nearest_k(self, x, y, k, max_distance=None):
+        """Get up to k live enemies closer than max_distance, nearest first"""
+        key = ("nearest", x, y, k, max_distance)
+        found = self.cache.get(key)
+        if found is None or not all(enemy.alive() for enemy in found):
+            found = self.cache[key] = self._find_nearest(x, y, k, max_distance)
+        return found
+
+    def within_radius(self, x, y, radius):
+        """Get live enemies whose center is within radius (unordered)"""
+        key = ("radius", x, y, radius)
+        found = self.cache.get(key)
+        if found is None:
+            found = self.cache[key] = self.grid.query_radius(x, y, radius)
+        return [enemy for enemy in found if enemy.alive()]
+
+    def _find_nearest(self, x, y, k, max_distance):
+        limit_sq = max_distance * max_distance if max_distance is not None else math.inf
+
+        # Radius around (x, y) that the anchor's neighborhood fully covers
+        reach = -1.0
+        if self.anchor is not None:
+            reach = self.neighborhood_radius - math.hypot(x - self.anchor[0], y - self.anchor[1])
+
+        if reach > 0:
+            if self.neighborhood is None:
+                self.neighborhood = [(enemy, enemy.rect.centerx, enemy.rect.centery)
+                                     for enemy in self.grid.query_radius(self.anchor[0], self.anchor[1],
+                                                                         self.neighborhood_radius)]
+            ranked = self._rank(self.neighborhood, x, y, k, limit_sq)
+
+            # Exact if the whole search circle is covered, or if k hits were
+            # found inside the covered part
+            if limit_sq <= reach * reach or (len(ranked) == k and ranked[-1][0] <= reach * reach):
+                return [enemy for _, _, enemy in ranked]
+
+        return self._ring_search(x, y, k, limit_sq)
+
+    def _rank(self, candidates, x, y, k, limit_sq):
+        """Get the k nearest (dist_sq, order, enemy) of (enemy, x, y) candidates"""
+        ranked = []
+        for order, (enemy, enemy_x, enemy_y) in enumerate(candidates):
+            dx = enemy_x - x
+            dy = enemy_y - y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < limit_sq and enemy.alive():
+                ranked.append((dist_sq, order, enemy))
+        return heapq.nsmallest(k, ranked)
+
+    def _ring_search(self, x, y, k, limit_sq):
+        """Scan grid cells in growing square rings until k nearest are settled"""
+        grid = self.grid
+        cell_size = grid.cell_size
+        center_x = int(x // cell_size)
+        center_y = int(y // cell_size)
+
+        # Never search past the world (plus a margin for off-world spawns)
+        max_ring = max(grid.world_width, grid.world_height) // cell_size + 2
+        if limit_sq != math.inf:
+            max_ring = min(max_ring, int(math.sqrt(limit_sq) // cell_size) + 1)
+
+        candidates = []
+        for ring in range(max_ring + 1):
+            for cell in self._ring_cells(center_x, center_y, ring):
+                bucket = grid.cells.get(cell)
+                if bucket:
+                    for enemy in bucket:
+                        candidates.append((enemy, enemy.rect.centerx, enemy.rect.centery))
+
+            # Cells outside this ring are at least ring * cell_size away
+            if len(candidates) >= k:
+                ranked = self._rank(candidates, x, y, k, limit_sq)
+                bound = ring * cell_size
+                if len(ranked) == k and ranked[-1][0] <= bound * bound:
+                    return [enemy for _, _, enemy in ranked]
+
+        ranked = self._rank(candidates, x, y, k, limit_sq)
+        return [enemy for _, _, enemy in ranked]
+
+    def _ring_cells(self, center_x, center_y, ring):
+        """Yield the cells at Chebyshev distance ring from the center cell"""
+        if ring == 0:
+            yield (center_x, center_y)
+            return
+        for cell_x in range(center_x - ring, center_x + ring + 1):
+            yield (cell_x, center_y - ring)
+            yield (cell_x, center_y + ring)
+        for cell_y in range(center_y - ring + 1, center_y + ring):
+            yield (center_x - ring, cell_y)
+            yield (center_x + ring, cell_y)
@@ -1,5 +1,7 @@
 import pygame
 import math
+from src.ui.fonts import fonts
+from src.core.renderer import renderer
 
 # Fix linter errors for pygame constants
 if not hasattr(pygame, 'KEYDOWN'):
@@ -40,14 +42,9 @@ class CheatMenu:
         self.DARK_PURPLE = (44, 26, 89)
         
         # Font setup
-        try:
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_medium = pygame.font.Font(None, 36)
-            self.font_small = pygame.font.Font(None, 24)
-        except:
-            self.font_large = pygame.font.SysFont("arial", 48)
-            self.font_medium = pygame.font.SysFont("arial", 36)
-            self.font_small = pygame.font.SysFont("arial", 24)
+        self.font_large = fonts.get(48)
+        self.font_medium = fonts.get(36)
+        self.font_small = fonts.get(24)
         
         # Cheat categories
         self.categories = {
@@ -173,10 +170,7 @@ class CheatMenu:
     def draw(self, surface):
         """Draw the cheat menu"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(200)
-        overlay.fill(self.DARK_PURPLE)
-        surface.blit(overlay, (0, 0))
+        renderer.dim(surface, self.DARK_PURPLE, 200, "cheat_menu")
         
         # Title
         title = self.font_large.render("CHEAT MENU / TESTING PAGE", True, self.HOT_PINK)
@@ -0,0 +1,30 @@
+import pygame
+
+
+class FontRegistry:
+    """Shared fonts, loaded once per size and reused by every UI module.
+
+    Loading a font parses the font file, which is far too slow to do per
+    frame. get() returns the default pygame font at that size, falling back
+    to a system Arial (bold if requested) when the default can't be loaded.
+    """
+    def __init__(self):
+        self.fonts = {}  # (size, bold) -> Font
+
+    def get(self, size, bold=False):
+        key = (size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            try:
+                font = pygame.font.Font(None, size)
+            except:
+                font = pygame.font.SysFont("arial", size, bold=bold)
+            self.fonts[key] = font
+        return font
+
+    def clear(self):
+        self.fonts.clear()
+
+
+# Shared registry used by all UI code
+fonts = FontRegistry()
@@ -1,5 +1,7 @@
 import pygame
 import math
+from src.ui.fonts import fonts
+from src.core.renderer import renderer
 
 # Fix linter errors for pygame constants
 if not hasattr(pygame, 'K_UP'):
@@ -50,16 +52,10 @@ class LevelUpUI:
         self.GRAY_MID = (120, 120, 120)
         
         # Fonts
-        try:
-            self.font_title = pygame.font.Font(None, 72)
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_medium = pygame.font.Font(None, 32)
-            self.font_small = pygame.font.Font(None, 24)
-        except:
-            self.font_title = pygame.font.SysFont("arial", 72, bold=True)
-            self.font_large = pygame.font.SysFont("arial", 48, bold=True)
-            self.font_medium = pygame.font.SysFont("arial", 32)
-            self.font_small = pygame.font.SysFont("arial", 24)
+        self.font_title = fonts.get(72, bold=True)
+        self.font_large = fonts.get(48, bold=True)
+        self.font_medium = fonts.get(32)
+        self.font_small = fonts.get(24)
         
         # Animation
         self.pulse_timer = 0
@@ -110,10 +106,7 @@ class LevelUpUI:
     def draw(self, surface, level_system, choices):
         """Draw the level up screen"""
         # Dark overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(220)
-        overlay.fill(self.DARK_BG)
-        surface.blit(overlay, (0, 0))
+        renderer.dim(surface, self.DARK_BG, 220)
         
         # Title frame
         self.draw_hex_frame(surface, self.screen_width // 2, 100, 400, 80)
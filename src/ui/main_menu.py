@@ -1,5 +1,6 @@
 import pygame
 import math
+from src.ui.fonts import fonts
 
 # Fix linter errors for pygame constants
 if not hasattr(pygame, 'KEYDOWN'):
@@ -55,21 +56,16 @@ class MainMenu:
         self.GRAY_MID = (120, 120, 120)
         
         # Fonts
-        try:
-            self.font_title = pygame.font.Font(None, 84)
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_medium = pygame.font.Font(None, 36)
-            self.font_small = pygame.font.Font(None, 24)
-        except:
-            self.font_title = pygame.font.SysFont("arial", 84, bold=True)
-            self.font_large = pygame.font.SysFont("arial", 48, bold=True)
-            self.font_medium = pygame.font.SysFont("arial", 36)
-            self.font_small = pygame.font.SysFont("arial", 24)
+        self.font_title = fonts.get(84, bold=True)
+        self.font_large = fonts.get(48, bold=True)
+        self.font_medium = fonts.get(36)
+        self.font_small = fonts.get(24)
         
         # Animation
         self.pulse_timer = 0
         self.selected_index = 0
-        self.menu_items = ["START GAME", "CONTROLS", "QUIT"]
+        self.menu_items = ["START GAME", "QUALITY", "CONTROLS", "QUIT"]
+        self.quality_name = "high"  # Current preset, shown on the QUALITY item (set by Game)
         
     def update(self, dt):
         """Update animations"""
@@ -96,7 +92,7 @@ class MainMenu:
                 
                 # Check which menu item was clicked
                 start_y = self.screen_height // 2 + 50
-                item_height = 80
+                item_height = 70
                 
                 for i, item in enumerate(self.menu_items):
                     item_y = start_y + i * item_height
@@ -107,7 +103,7 @@ class MainMenu:
             # Highlight menu item under mouse
             mouse_x, mouse_y = event.pos
             start_y = self.screen_height // 2 + 50
-            item_height = 80
+            item_height = 70
             
             for i, item in enumerate(self.menu_items):
                 item_y = start_y + i * item_height
@@ -149,12 +145,12 @@ class MainMenu:
         
         # Menu items with cyberpunk panels
         start_y = self.screen_height // 2 + 50
-        item_height = 80
+        item_height = 70
         
         for i, item in enumerate(self.menu_items):
             is_selected = (i == self.selected_index)
             item_y = start_y + i * item_height
-            self.draw_menu_panel(surface, item, self.screen_width // 2, item_y, is_selected)
+            self.draw_menu_panel(surface, self.get_item_label(item), self.screen_width // 2, item_y, is_selected)
         
         # Corner decorative elements
         self.draw_corner_elements(surface)
@@ -174,6 +170,11 @@ class MainMenu:
         version_rect = version_surface.get_rect(bottomright=(self.screen_width - 20, self.screen_height - 20))
         surface.blit(version_surface, version_rect)
     
+    def get_item_label(self, item):
+        if item == "QUALITY":
+            return f"QUALITY: {self.quality_name.upper()}"
+        return item
+    
     def draw_menu_panel(self, surface, text, center_x, center_y, is_selected):
         """Draw a cyberpunk-style menu panel"""
         panel_width = 400
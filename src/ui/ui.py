@@ -1,5 +1,8 @@
 import pygame
 import math
+from src.systems.surface_pool import surface_pool
+from src.systems.sprite_cache import LRUFrameCache
+from src.ui.fonts import fonts
 
 class UI:
     def __init__(self, screen_width, screen_height):
@@ -42,16 +45,39 @@ class UI:
         self.YELLOW_BRIGHT = (255, 255, 50)
         
         # Fonts
-        try:
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_medium = pygame.font.Font(None, 36)
-            self.font_small = pygame.font.Font(None, 24)
-            self.font_tiny = pygame.font.Font(None, 18)
-        except:
-            self.font_large = pygame.font.SysFont("arial", 48, bold=True)
-            self.font_medium = pygame.font.SysFont("arial", 36, bold=True)
-            self.font_small = pygame.font.SysFont("arial", 24)
-            self.font_tiny = pygame.font.SysFont("arial", 18)
+        self.font_large = fonts.get(48, bold=True)
+        self.font_medium = fonts.get(36, bold=True)
+        self.font_small = fonts.get(24)
+        self.font_tiny = fonts.get(18)
+        
+        # Rendered text keyed by (font, text, color), so values only re-render when they change
+        self.text_cache = LRUFrameCache(256)
+        
+        # Panel chrome (angled panel plus static labels) rendered once per look
+        self.panel_layers = {}
+        self.PANEL_PADDING = 2  # Room for the panel border outside its rect
+        self.PANEL_COLORKEY = (255, 0, 128)  # Not used by any panel color
+    
+    def render_text(self, font, text, color):
+        """Get a rendered antialiased text surface from the text cache"""
+        return self.text_cache.get((font, text, color), lambda: font.render(text, True, color))
+    
+    def blit_panel(self, surface, rect, border_color, draw_static=None):
+        """Blit a cached angled panel; draw_static(layer, local_rect) adds unchanging chrome"""
+        key = (rect.size, border_color, draw_static)
+        layer = self.panel_layers.get(key)
+        if layer is None:
+            # Opaque layer with a colorkey for the cut corners (cheaper to blit than per-pixel alpha)
+            padding = self.PANEL_PADDING
+            layer = pygame.Surface((rect.width + padding * 2 + 1, rect.height + padding * 2 + 1))
+            layer.fill(self.PANEL_COLORKEY)
+            local_rect = pygame.Rect(padding, padding, rect.width, rect.height)
+            self.draw_angled_panel(layer, local_rect, self.PANEL_BG, border_color)
+            if draw_static:
+                draw_static(layer, local_rect)
+            layer.set_colorkey(self.PANEL_COLORKEY, pygame.RLEACCEL)
+            self.panel_layers[key] = layer
+        surface.blit(layer, (rect.x - self.PANEL_PADDING, rect.y - self.PANEL_PADDING))
     
     def draw(self, surface, player, wave, score, enemies_remaining, in_wave_break, wave_timer, wave_break_duration, level_system=None, camera_x=0.0, camera_y=0.0, boss_notification_timer=0, is_boss_wave=False):
         # Draw health panel
@@ -83,14 +109,9 @@ class UI:
         panel_x = 20
         panel_y = 20
         
-        # Main panel
+        # Main panel with label and bar background
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        self.draw_angled_panel(surface, panel_rect, self.PANEL_BG, self.BORDER_LIGHT)
-        
-        # Health label
-        label_text = "VITALS"
-        label_surface = self.font_small.render(label_text, True, self.CYAN_BRIGHT)
-        surface.blit(label_surface, (panel_x + 15, panel_y + 8))
+        self.blit_panel(surface, panel_rect, self.BORDER_LIGHT, self._draw_health_panel_static)
         
         # Health bar
         bar_x = panel_x + 15
@@ -102,11 +123,6 @@ class UI:
         health_percentage = player.get_health_percentage()
         health_width = int(bar_width * health_percentage)
         
-        # Health bar background
-        bar_bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(surface, self.BLACK, bar_bg_rect)
-        pygame.draw.rect(surface, self.BORDER_DARK, bar_bg_rect, 1)
-        
         # Health bar fill with gradient effect
         if health_percentage > 0.6:
             health_color = self.CYAN_BRIGHT
@@ -127,13 +143,13 @@ class UI:
         # Health text
         actual_max_health = player.max_health + getattr(player, 'max_health_bonus', 0)
         health_text = f"{int(player.health)}/{int(actual_max_health)}"
-        health_surface = self.font_small.render(health_text, True, self.WHITE)
+        health_surface = self.render_text(self.font_small, health_text, self.WHITE)
         surface.blit(health_surface, (panel_x + 15, panel_y + 50))
         
         # Shield indicator
         if hasattr(player, 'shield_current') and player.shield_current > 0:
             shield_text = f"SHIELD: {int(player.shield_current)}"
-            shield_surface = self.font_tiny.render(shield_text, True, self.BLUE_BRIGHT)
+            shield_surface = self.render_text(self.font_tiny, shield_text, self.BLUE_BRIGHT)
             surface.blit(shield_surface, (panel_x + 120, panel_y + 50))
         
         # Status indicators
@@ -145,6 +161,16 @@ class UI:
             pygame.draw.circle(surface, self.RED_BRIGHT, (status_x, status_y), 8)
             pygame.draw.circle(surface, self.WHITE, (status_x, status_y), 8, 2)
     
+    def _draw_health_panel_static(self, layer, rect):
+        # Health label
+        label_surface = self.font_small.render("VITALS", True, self.CYAN_BRIGHT)
+        layer.blit(label_surface, (rect.x + 15, rect.y + 8))
+        
+        # Health bar background
+        bar_bg_rect = pygame.Rect(rect.x + 15, rect.y + 30, 250, 15)
+        pygame.draw.rect(layer, self.BLACK, bar_bg_rect)
+        pygame.draw.rect(layer, self.BORDER_DARK, bar_bg_rect, 1)
+    
     def draw_wave_panel(self, surface, wave, enemies_remaining, in_wave_break, wave_timer, wave_break_duration, boss_notification_timer=0, is_boss_wave=False):
         """Draw cyberpunk-style wave information panel"""
         # Panel dimensions
@@ -169,7 +195,7 @@ class UI:
         
         # Main panel
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        self.draw_angled_panel(surface, panel_rect, self.PANEL_BG, border_color)
+        self.blit_panel(surface, panel_rect, border_color)
         
         # Wave text
         if boss_notification_timer > 0:
@@ -182,16 +208,15 @@ class UI:
             wave_type = " [BOSS]" if is_boss_wave else ""
             text = f"WAVE {wave}{wave_type} - HOSTILES: {enemies_remaining}"
         
-        text_surface = self.font_medium.render(text, True, text_color)
+        text_surface = self.render_text(self.font_medium, text, text_color)
         text_rect = text_surface.get_rect(center=panel_rect.center)
         surface.blit(text_surface, text_rect)
         
         # Pulse effect for boss warnings
         if boss_notification_timer > 0:
             pulse_alpha = int(abs(math.sin(boss_notification_timer * 0.01)) * 100)
-            pulse_surface = pygame.Surface((panel_width, panel_height))
-            pulse_surface.set_alpha(pulse_alpha)
-            pulse_surface.fill(self.RED_BRIGHT)
+            pulse_surface = surface_pool.get((panel_width, panel_height), alpha=pulse_alpha,
+                                             fill=self.RED_BRIGHT)
             surface.blit(pulse_surface, (panel_x, panel_y))
     
     def draw_score_panel(self, surface, score):
@@ -202,20 +227,19 @@ class UI:
         panel_x = self.screen_width - panel_width - 20
         panel_y = 20
         
-        # Main panel
+        # Main panel with label
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        self.draw_angled_panel(surface, panel_rect, self.PANEL_BG, self.CYAN_BRIGHT)
-        
-        # Label
-        label_text = "SCORE"
-        label_surface = self.font_small.render(label_text, True, self.CYAN_BRIGHT)
-        surface.blit(label_surface, (panel_x + 15, panel_y + 8))
+        self.blit_panel(surface, panel_rect, self.CYAN_BRIGHT, self._draw_score_panel_static)
         
         # Score value
         score_text = f"{score:,}"
-        score_surface = self.font_medium.render(score_text, True, self.WHITE)
+        score_surface = self.render_text(self.font_medium, score_text, self.WHITE)
         surface.blit(score_surface, (panel_x + 15, panel_y + 28))
     
+    def _draw_score_panel_static(self, layer, rect):
+        label_surface = self.font_small.render("SCORE", True, self.CYAN_BRIGHT)
+        layer.blit(label_surface, (rect.x + 15, rect.y + 8))
+    
     def draw_level_panel(self, surface, level_system):
         """Draw cyberpunk-style level and XP panel"""
         # Panel dimensions
@@ -224,13 +248,13 @@ class UI:
         panel_x = self.screen_width - panel_width - 20
         panel_y = 100
         
-        # Main panel
+        # Main panel with XP bar background
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        self.draw_angled_panel(surface, panel_rect, self.PANEL_BG, self.PURPLE_BRIGHT)
+        self.blit_panel(surface, panel_rect, self.PURPLE_BRIGHT, self._draw_level_panel_static)
         
         # Level label and value
         level_text = f"LEVEL {level_system.level}"
-        level_surface = self.font_medium.render(level_text, True, self.PURPLE_BRIGHT)
+        level_surface = self.render_text(self.font_medium, level_text, self.PURPLE_BRIGHT)
         surface.blit(level_surface, (panel_x + 15, panel_y + 8))
         
         # XP bar
@@ -243,11 +267,6 @@ class UI:
         xp_progress = level_system.get_xp_progress()
         xp_width = int(bar_width * xp_progress)
         
-        # XP bar background
-        bar_bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(surface, self.BLACK, bar_bg_rect)
-        pygame.draw.rect(surface, self.BORDER_DARK, bar_bg_rect, 1)
-        
         # XP bar fill
         if xp_width > 0:
             xp_rect = pygame.Rect(bar_x, bar_y, xp_width, bar_height)
@@ -255,9 +274,15 @@ class UI:
         
         # XP text
         xp_text = f"XP: {level_system.xp}/{level_system.xp_to_next_level}"
-        xp_surface = self.font_tiny.render(xp_text, True, self.WHITE)
+        xp_surface = self.render_text(self.font_tiny, xp_text, self.WHITE)
         surface.blit(xp_surface, (bar_x, bar_y + bar_height + 3))
     
+    def _draw_level_panel_static(self, layer, rect):
+        # XP bar background
+        bar_bg_rect = pygame.Rect(rect.x + 15, rect.y + 40, 220, 12)
+        pygame.draw.rect(layer, self.BLACK, bar_bg_rect)
+        pygame.draw.rect(layer, self.BORDER_DARK, bar_bg_rect, 1)
+    
     def draw_powerup_panels(self, surface, player):
         """Draw cyberpunk-style powerup indicators"""
         start_x = 20
@@ -286,17 +311,17 @@ class UI:
                     icon_char = "●"
                 
                 # Draw panel
-                self.draw_angled_panel(surface, panel_rect, self.PANEL_BG, color)
+                self.blit_panel(surface, panel_rect, color)
                 
                 # Icon
-                icon_surface = self.font_large.render(icon_char, True, color)
+                icon_surface = self.render_text(self.font_large, icon_char, color)
                 icon_rect = icon_surface.get_rect(center=(panel_x + panel_size // 2, panel_y + panel_size // 2 - 5))
                 surface.blit(icon_surface, icon_rect)
                 
                 # Timer
                 time_left = timer / 1000.0
                 time_text = f"{time_left:.1f}s"
-                time_surface = self.font_tiny.render(time_text, True, color)
+                time_surface = self.render_text(self.font_tiny, time_text, color)
                 time_rect = time_surface.get_rect(center=(panel_x + panel_size // 2, panel_y + panel_size - 8))
                 surface.blit(time_surface, time_rect)
                 
@@ -310,10 +335,11 @@ class UI:
         panel_x = 20
         panel_y = self.screen_height - panel_height - 20
         
-        # Main panel
+        # The whole panel is static
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        self.draw_angled_panel(surface, panel_rect, self.PANEL_BG, self.BORDER_LIGHT)
-        
+        self.blit_panel(surface, panel_rect, self.BORDER_LIGHT, self._draw_controls_panel_static)
+    
+    def _draw_controls_panel_static(self, layer, rect):
         # Controls text
         controls = [
             "WASD/Arrows: Movement",
@@ -323,7 +349,7 @@ class UI:
         
         for i, control in enumerate(controls):
             control_surface = self.font_tiny.render(control, True, self.GRAY_LIGHT)
-            surface.blit(control_surface, (panel_x + 15, panel_y + 15 + i * 18))
+            layer.blit(control_surface, (rect.x + 15, rect.y + 15 + i * 18))
     
 
     